@@ -23,7 +23,7 @@
     TitleJudge,
 )
 from tqdm import tqdm
-from utils.evaluations import calculate_readability
+from utils.evaluations import calculate_readability, hemmingway_score_from_counts
 from utils.formatters import format_checks_outputs
 from utils.graphs import create_graph, execute_graph
 from utils.paths import get_root_dir
@@ -35,6 +35,14 @@
 # Declaring model to use
 MODEL = settings.MODEL_NAME
 
+# Text statistics columns of the merged data read by the content evaluation rules
+TEXT_STATS_COLUMNS = [
+    "word_count",
+    "sentence_count",
+    "readability_word_count",
+    "letter_count",
+]
+
 
 class ChecksState(TypedDict):
     """
@@ -85,10 +93,19 @@ def content_evaluation_rules_node(state: ChecksState) -> dict:
 
     article_content = state.get("article_inputs")["article_content"]
     content_category = state.get("article_inputs")["content_category"]
+    # Text statistics precomputed by the content optimisation pipeline, if any
+    text_stats = state.get("article_inputs").get("text_stats")
     content_flags = state.get("content_flags", {})
 
     # Check readability - Hemmingway Metric
-    metric = calculate_readability(article_content, "hemmingway")
+    if text_stats:
+        metric = hemmingway_score_from_counts(
+            text_stats["letter_count"],
+            text_stats["readability_word_count"],
+            text_stats["sentence_count"],
+        )
+    else:
+        metric = calculate_readability(article_content, "hemmingway")
     score = metric.get("score", -1)
 
     # NOTE: Exceptions must be handled to prevent the program from being prematurely terminated
@@ -111,7 +128,9 @@ def content_evaluation_rules_node(state: ChecksState) -> dict:
         "medical-care-and-facilities": 202,
         "support-group-and-others": 213,
     }
-    word_count = len(article_content.split())
+    word_count = (
+        text_stats["word_count"] if text_stats else len(article_content.split())
+    )
     # Flag articles based on the provided threshold. Otherwise, flag articles below 300 words
     threshold = word_count_threshold_dict.get(content_category, 300)
     if word_count < threshold:
@@ -514,6 +533,12 @@ def save_evaluation_dataframe(
             content_category = df_sample["content_category"].iloc[i]
             article_category_names = df_sample["article_category_names"].iloc[i]
             page_views = df_sample["page_views"].iloc[i]
+            # Merged data from before the text statistics were emitted has no such columns
+            text_stats = (
+                df_sample[TEXT_STATS_COLUMNS].iloc[i].astype(int).to_dict()
+                if set(TEXT_STATS_COLUMNS).issubset(df_sample.columns)
+                else None
+            )
 
             print(f"Checking '{article_title}' now...")
             # Set up Inputs for the Optimisation Checks graph
@@ -527,6 +552,7 @@ def save_evaluation_dataframe(
                     "page_views": page_views,
                     "article_content": article_content,
                     "meta_desc": meta_desc,
+                    "text_stats": text_stats,
                 },
                 "skip_llm_evaluations": {
                     "decision": False,
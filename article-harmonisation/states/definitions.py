@@ -18,6 +18,7 @@ class ArticleInputs(TypedDict):
         page_views (Union[int, Optional[list[int]]]): The number of page views the article has received. Can be a single integer or a list of integers.
         additional_input (Optional[str]): The additional input added by the user in the User Annotation Excel file
         main_article_content (Optional[str]): Stores the original article content of the "main article", only applicable for live-healthy article harmonisation.
+        text_stats (Optional[dict[str, int]]): The text statistics of the article content precomputed by the content optimisation pipeline (e.g. "word_count"). If not provided, they are computed from the article content.
     """
 
     article_id: Union[int, Optional[list[int]]]
@@ -30,6 +31,7 @@ class ArticleInputs(TypedDict):
     page_views: Union[int, Optional[list[int]]]
     additional_input: Optional[str]
     main_article_content: Optional[str]
+    text_stats: Optional[dict[str, int]]
 
 
 class SkipLLMEvals(TypedDict):
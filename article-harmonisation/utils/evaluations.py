@@ -101,6 +101,26 @@ def hemmingway_score(text: str) -> dict[str, Union[str, int]]:
     num_words = len(filtered_words)
     num_letters = reduce(lambda x, y: x + y, map(len, words))
 
+    return hemmingway_score_from_counts(num_letters, num_words, num_sentences)
+
+
+def hemmingway_score_from_counts(
+    num_letters: int, num_words: int, num_sentences: int
+) -> dict[str, Union[str, int]]:
+    """
+    Calculates the hemmingway score from the number of letters, words and sentences of a text.
+
+    The counts are emitted by the content optimisation pipeline as the `letter_count`, `readability_word_count` and
+    `sentence_count` columns of the merged data, so that the score of the original articles is not recounted.
+
+    Args:
+        num_letters (int): The number of letters of the text, excluding punctuation.
+        num_words (int): The number of words of the text.
+        num_sentences (int): The number of sentences of the text.
+
+    Returns:
+        dict[str, Union[int, str]]: Returns a dictionary containing the hemmingway score as "score" and difficulty of the text as "level"
+    """
     # Calculate the Hemmingway Score
     score = math.ceil(
         4.71 * (num_letters / num_words) + 0.5 * (num_words / num_sentences) - 21.43
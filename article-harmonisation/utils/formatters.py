@@ -10,6 +10,7 @@
 # Declaring column headers used in merged_data.parquet
 CONTENT_BODY = "extracted_content_body"
 EXTRACTED_HEADERS = "extracted_headers"
+EXTRACTED_SECTIONS = "extracted_sections"
 ARTICLE_TITLE = "title"
 META_DESC = "category_description"
 CONTENT_CATEGORY = "content_category"
@@ -17,6 +18,16 @@
 ARTICLE_ID = "id"
 ARTICLE_URL = "full_url"
 
+# The labels of the header types, h1 - h6
+HEADER_LABELS = {
+    1: "Main Header",
+    2: "Sub Header",
+    3: "Sub Section",
+    4: "Sub Section",
+    5: "Sub Section",
+    6: "Sub Section",
+}
+
 # Obtaining the merged data
 MERGED_DF = pq.read_table(MERGED_DATA_DIRECTORY)
 
@@ -132,15 +143,185 @@ def extract_content_for_evaluation(
     return article_details
 
 
+def format_sections(
+    article_title: str, article_content: str, sections: list[dict]
+) -> str:
+    """
+    Formats an article with its headers labelled by their header type and "parent" header.
+
+    The labels help the researcher LLM to better determine what headers are considered main, sub, etc. This is
+    especially helpful for list type articles, where the "parent" title is a h2 header and it has multiple "child"
+    headers as h3 headers for each list item. A h1 header is labelled as the Main Header, a h2 header as a Sub Header
+    and the h3 to h6 headers as Sub Sections. If a "parent" header of the previous header type exists, the last one
+    is stated as the parent of the header.
+
+    Args:
+        article_title (str): The title of the article, which is used as the main header.
+        article_content (str): The extracted content body of the article.
+        sections (list[dict]): The section tree of the article from the `extracted_sections` column, where the
+            paragraphs of each section are `article_content[start:end]`.
+
+    Returns:
+        str: The article with its headers and content organized hierarchically.
+    """
+    # Stores the last header of each header type, h1 - h6
+    last_headers = {}
+    final_labelled_article = f"Article Header: {article_title}\n"
+
+    for section in sections:
+        level = section["level"]
+        paragraphs = article_content[section["start"] : section["end"]]
+
+        # The root section holds the content before the first header
+        if level == 0:
+            if len(paragraphs.strip()) > 0:
+                final_labelled_article += paragraphs + "\n"
+            continue
+
+        header = f"h{level} {HEADER_LABELS[level]}: {section['header']}"
+        # Adding the title of the "parent" header, which is the last header of the previous header type
+        if level - 1 in last_headers:
+            header += f"\n{HEADER_LABELS[level]} to h{level - 1} {HEADER_LABELS[level - 1]}: {last_headers[level - 1]}"
+        last_headers[level] = section["header"]
+
+        final_labelled_article += header + "\n" + paragraphs + "\n"
+
+    return final_labelled_article
+
+
+def format_headers(
+    article_title: str, article_content: str, article_headers: list
+) -> str:
+    """
+    Formats an article by splitting its content by its headers, for merged data without the `extracted_sections`
+    column (see `format_sections`). A header that also appears earlier in the content may be split at the wrong place.
+
+    Args:
+        article_title (str): The title of the article, used as the main header.
+        article_content (str): The extracted content body of the article.
+        article_headers (list): The `(header_title, header_type)` pairs of the article headers, e.g. `("Symptoms", "h2")`.
+
+    Returns:
+        str: The article with its headers and content organized hierarchically.
+    """
+    # this list will store all the headers + content as elements
+    split_content = []
+
+    # Stores headers based on their heading type, h1 - h6
+    header_dictionary = {}
+
+    # If statement that checks if there are article_headers for the article
+    if len(article_headers) > 0:
+        # For loop iterating through each header in article_headers
+        for header_details in article_headers:
+            # Extracting header_title as a String
+            header_title = header_details[0]
+
+            # Some header_titles are just empty strings, which cannot run .split(). This if statement checks if the header_title is an empty string first.
+            if len(header_title.strip()) != 0:
+                # Extracting the header type of the specific header
+                header_type = header_details[1]
+
+                # checks if the specific header type exists as a key in header_dictionary
+                header_list = header_dictionary.get(header_type, [])
+
+                # adding the header to the respective item in header_dictionary
+                header_list.append(header_title)
+                header_dictionary[header_type] = header_list
+
+                # Explanation for section below:
+                # This section determines the type of the header and creates an appropriate String to better represent it.
+                # This helps the researcher LLM to better determine what headers are considered main, sub, etc.
+                # It is especially helpful for use cases for list type article headers, where the "parent" title is a h2 header and it has multiple "child" headers as h3 headers for each list item.
+                # Extracting the headers directly from the merged_data.parquet does not effectively capture this relationship.
+                # This section matches the header type to the various header html tags and creates a respective String called header based on the header type.
+                # It then checks if there is a "parent" header to this sub header, a second String will be concatenated to the header String which states the "child" headers relation to the "parent" header
+
+                match header_type:
+                    # if header type is h1, the header_title is defined as Main Header, which is stored in header.
+                    case "h1":
+                        header = f"h1 Main Header: {header_title}"
+
+                    # if header type is h2, the String header is defined as a Sub Header, which is stored in header.
+                    case "h2":
+                        header = f"h2 Sub Header: {header_title}"
+                        # If statement checking if there are any h1 headers as potential parents for this subheader
+                        if "h1" in header_dictionary.keys():
+                            # Adding second String to header with title of the "parent" header. The last item in header_dictionary['h1'] is set as the parent header.
+                            header += f"\nSub Header to h1 Main Header: {header_dictionary['h1'][-1]}"
+
+                    # if header type is h3, the String header is defined as a Sub Header, which is stored in header.
+                    case "h3":
+                        header = f"h3 Sub Section: {header_title}"
+                        # If statement checking if there are any h2 headers as potential parents for this subheader
+                        if "h2" in header_dictionary.keys():
+                            # Adding second String to header with title of the "parent" header. The last item in header_dictionary['h2'] is set as the parent header.
+                            header += f"\nSub Section to h2 Sub Header: {header_dictionary['h2'][-1]}"
+
+                    # if header type is h4, the String header is defined as a Sub Header, which is stored in header.
+                    case "h4":
+                        header = f"h4 Sub Section: {header_title}"
+                        # If statement checking if there are any h3 headers as potential parents for this subheader
+                        if "h3" in header_dictionary.keys():
+                            # Adding second String to header with title of the "parent" header. The last item in header_dictionary['h3'] is set as the parent header.
+                            header += f"\nSub Section to h3 Sub Section: {header_dictionary['h3'][-1]}"
+
+                    # if header type is h5, the String header is defined as a Sub Header, which is stored in header.
+                    case "h5":
+                        header = f"h5 Sub Section: {header_title}"
+                        # If statement checking if there are any h4 headers as potential parents for this subheader
+                        if "h4" in header_dictionary.keys():
+                            # Adding second String to header with title of the "parent" header. The last item in header_dictionary['h4'] is set as the parent header.
+                            header += f"\nSub Section to h4 Sub Section: {header_dictionary['h4'][-1]}"
+
+                    # if header type is h5, the String header is defined as a Sub Header, which is stored in header.
+                    case "h6":
+                        # If statement checking if there are any h5 headers as potential parents for this subheader
+                        header = f"h6 Sub Section: {header_title}"
+                        if "h5" in header_dictionary.keys():
+                            # Adding second String to header with title of the "parent" header. The last item in header_dictionary['h5'] is set as the parent header.
+                            header += f"\nSub Section to h5 Sub Section: {header_dictionary['h5'][-1]}"
+
+                # If statement checking if split_content is empty List
+                if not split_content:
+                    # Extends split_content with resultant list from article_content split by the header_title
+                    split_content.extend(article_content.split(header_title, 1))
+                else:
+                    # Obtains last item from split_content, since split_content is not empty
+                    last_content = split_content.pop()
+
+                    # Extends split_content with resultant list from last_content split by the header_title
+                    split_content.extend(last_content.split(header_title, 1))
+
+                # Adding the header defined from the previous match case and concatenating it to the last item in split_content
+                split_content[-1] = header + "\n" + split_content[-1][1:]
+
+    else:
+        # If there are no headers in the article, the article content is directly added to split_content
+        split_content.append(article_content)
+
+    # concatenate all into this string. The title is used as the main header.
+    final_labelled_article = f"Article Header: {article_title}\n"
+
+    for new_content in split_content:
+        # If statement checking if there are empty strings in split_content and empty headers
+        if len(new_content.strip()) > 0:
+            final_labelled_article += new_content + "\n"
+
+    return final_labelled_article
+
+
 def concat_headers_to_content(article_id: list) -> list[str]:
     """
     Concatenate headers to content for given articles.
 
-    This function extracts headers and content from MERGED_DF, organizes them hierarchically, and creates a formatted
-    string for each article.
+    This function slices the sections of each article from MERGED_DF by its section tree, which is extracted by the
+    Data Processing pipeline, and creates a formatted string for each article (see `format_sections`). If MERGED_DF
+    was saved before the section tree was extracted, the content is split by the headers instead (see
+    `format_headers`).
 
     Args:
-        articles (list): List of article titles to process.
+        article_id (list): List of article IDs to process.
 
     Returns:
         list[str]: List of formatted strings, each representing an article with its headers and content organized hierarchically.
@@ -148,6 +329,13 @@ def concat_headers_to_content(article_id: list) -> list[str]:
     Note:
         This function relies on the MERGED_DF global variable and the get_article_list_indexes function.
     """
+    has_sections = EXTRACTED_SECTIONS in MERGED_DF.column_names
+    if not has_sections:
+        print(
+            f"Warning: `{EXTRACTED_SECTIONS}` is not found in {MERGED_DATA_DIRECTORY}, so the article content is "
+            "split by the headers instead. Rerun the Data Processing pipeline to get the latest `merged_data.parquet`"
+        )
+
     final_configured_articles = []
     # Obtaining list of article indexes
     article_list_idx = get_article_list_indexes(article_id)
@@ -156,116 +344,22 @@ def concat_headers_to_content(article_id: list) -> list[str]:
     for num in range(len(article_id)):
         # Extracting the article
         idx = article_list_idx[num]
-        article_headers = list(MERGED_DF[EXTRACTED_HEADERS][idx])
         article_content = str(MERGED_DF[CONTENT_BODY][idx])
         article_title = str(MERGED_DF[ARTICLE_TITLE][idx])
 
-        # this list will store all the headers + content as elements
-        split_content = []
-
-        # Stores headers based on their heading type, h1 - h6
-        header_dictionary = {}
-
-        # If statement that checks if there are article_headers for the article
-        if len(article_headers) > 0:
-            # For loop iterating through each header in article_headers
-            for header_details in article_headers:
-                # Extracting header_title as a String
-                header_title = header_details[0].as_py()
-
-                # Some header_titles are just empty strings, which cannot run .split(). This if statement checks if the header_title is an empty string first.
-                if len(header_title.strip()) != 0:
-                    # Extracting the header type of the specific header
-                    header_type = header_details[1].as_py()
-
-                    # checks if the specific header type exists as a key in header_dictionary
-                    header_list = header_dictionary.get(header_type, [])
-
-                    # adding the header to the respective item in header_dictionary
-                    header_list.append(header_title)
-                    header_dictionary[header_type] = header_list
-
-                    # Explanation for section below:
-                    # This section determines the type of the header and creates an appropriate String to better represent it.
-                    # This helps the researcher LLM to better determine what headers are considered main, sub, etc.
-                    # It is especially helpful for use cases for list type article headers, where the "parent" title is a h2 header and it has multiple "child" headers as h3 headers for each list item.
-                    # Extracting the headers directly from the merged_data.parquet does not effectively capture this relationship.
-                    # This section matches the header type to the various header html tags and creates a respective String called header based on the header type.
-                    # It then checks if there is a "parent" header to this sub header, a second String will be concatenated to the header String which states the "child" headers relation to the "parent" header
-
-                    match header_type:
-                        # if header type is h1, the header_title is defined as Main Header, which is stored in header.
-                        case "h1":
-                            header = f"h1 Main Header: {header_title}"
-
-                        # if header type is h2, the String header is defined as a Sub Header, which is stored in header.
-                        case "h2":
-                            header = f"h2 Sub Header: {header_title}"
-                            # If statement checking if there are any h1 headers as potential parents for this subheader
-                            if "h1" in header_dictionary.keys():
-                                # Adding second String to header with title of the "parent" header. The last item in header_dictionary['h1'] is set as the parent header.
-                                header += f"\nSub Header to h1 Main Header: {header_dictionary['h1'][-1]}"
-
-                        # if header type is h3, the String header is defined as a Sub Header, which is stored in header.
-                        case "h3":
-                            header = f"h3 Sub Section: {header_title}"
-                            # If statement checking if there are any h2 headers as potential parents for this subheader
-                            if "h2" in header_dictionary.keys():
-                                # Adding second String to header with title of the "parent" header. The last item in header_dictionary['h2'] is set as the parent header.
-                                header += f"\nSub Section to h2 Sub Header: {header_dictionary['h2'][-1]}"
-
-                        # if header type is h4, the String header is defined as a Sub Header, which is stored in header.
-                        case "h4":
-                            header = f"h4 Sub Section: {header_title}"
-                            # If statement checking if there are any h3 headers as potential parents for this subheader
-                            if "h3" in header_dictionary.keys():
-                                # Adding second String to header with title of the "parent" header. The last item in header_dictionary['h3'] is set as the parent header.
-                                header += f"\nSub Section to h3 Sub Section: {header_dictionary['h3'][-1]}"
-
-                        # if header type is h5, the String header is defined as a Sub Header, which is stored in header.
-                        case "h5":
-                            header = f"h5 Sub Section: {header_title}"
-                            # If statement checking if there are any h4 headers as potential parents for this subheader
-                            if "h4" in header_dictionary.keys():
-                                # Adding second String to header with title of the "parent" header. The last item in header_dictionary['h4'] is set as the parent header.
-                                header += f"\nSub Section to h4 Sub Section: {header_dictionary['h4'][-1]}"
-
-                        # if header type is h5, the String header is defined as a Sub Header, which is stored in header.
-                        case "h6":
-                            # If statement checking if there are any h5 headers as potential parents for this subheader
-                            header = f"h6 Sub Section: {header_title}"
-                            if "h5" in header_dictionary.keys():
-                                # Adding second String to header with title of the "parent" header. The last item in header_dictionary['h5'] is set as the parent header.
-                                header += f"\nSub Section to h5 Sub Section: {header_dictionary['h5'][-1]}"
-
-                    # If statement checking if split_content is empty List
-                    if not split_content:
-                        # Extends split_content with resultant list from article_content split by the header_title
-                        split_content.extend(article_content.split(header_title, 1))
-                    else:
-                        # Obtains last item from split_content, since split_content is not empty
-                        last_content = split_content.pop()
-
-                        # Extends split_content with resultant list from last_content split by the header_title
-                        split_content.extend(last_content.split(header_title, 1))
-
-                    # Adding the header defined from the previous match case and concatenating it to the last item in split_content
-                    split_content[-1] = header + "\n" + split_content[-1][1:]
-
+        if has_sections:
+            article_sections = MERGED_DF[EXTRACTED_SECTIONS][idx].as_py() or []
+            formatted_article = format_sections(
+                article_title, article_content, article_sections
+            )
         else:
-            # If there are no headers in the article, the article content is directly added to cplit_content
-            split_content.append(article_content)
-
-        # concatenate all into this string. The title is used as the main header.
-        final_labelled_article = f"Article Header: {article_title}\n"
-
-        for new_content in split_content:
-            # If statement checking if there are empty strings in split_content and empty headers
-            if len(new_content.strip()) > 0:
-                final_labelled_article += new_content + "\n"
+            article_headers = MERGED_DF[EXTRACTED_HEADERS][idx].as_py() or []
+            formatted_article = format_headers(
+                article_title, article_content, article_headers
+            )
 
         # Adding this processed article to the final_configured_articles list
-        final_configured_articles.append(final_labelled_article)
+        final_configured_articles.append(formatted_article)
 
     return final_configured_articles
 
@@ -0,0 +1,104 @@
+"""
+Benchmarks `clean_text` against the previous implementation of `HTMLExtractor.clean_text` on the text fragments of
+the `all_contents_added` dataset.
+
+Run from the `content-optimization` directory after running the `data_processing` pipeline:
+
+    python benchmarks/benchmark_clean_text.py --repeat 5
+"""
+
+import argparse
+import re
+import timeit
+import unicodedata
+from pathlib import Path
+
+from bs4 import BeautifulSoup
+from content_optimization.pipelines.data_processing.normalization import clean_texts
+from kedro.framework.session import KedroSession
+from kedro.framework.startup import bootstrap_project
+
+
+def parse_arguments() -> argparse.Namespace:
+    """
+    Parses the command line arguments.
+
+    Returns:
+        argparse.Namespace: The parsed arguments.
+    """
+    parser = argparse.ArgumentParser(
+        description="Benchmark the text normalisation kernel against the previous `clean_text`."
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=5,
+        help="The number of times to run each implementation.",
+    )
+
+    return parser.parse_args()
+
+
+def clean_text_reference(text: str) -> str:
+    """
+    The previous implementation of `HTMLExtractor.clean_text`.
+
+    Args:
+        text (str): The input text to be cleaned.
+
+    Returns:
+        str: The cleaned text.
+    """
+    text = text.replace("\u2013", "-")
+    text = unicodedata.normalize("NFKD", text)
+    text = text.encode("ascii", "ignore").decode("utf-8")
+    text = text.replace("\xa0", " ")
+    text = text.replace("\u200b", "")
+    text = text.replace("\u2028", "\n")
+    text = text.replace("\u2029", "\n")
+    text = text.replace("_x000D_", "")
+    text = re.sub(r"\s+", " ", text)
+
+    return text.strip()
+
+
+def main():
+    args = parse_arguments()
+
+    project_path = Path(__file__).resolve().parents[1]
+    bootstrap_project(project_path)
+    with KedroSession.create(project_path=project_path) as session:
+        catalog = session.load_context().catalog
+        partitions = catalog.load("all_contents_added")
+
+    # The text fragments passed to `clean_text` by the extractor
+    texts = []
+    for partition_load_func in partitions.values():
+        for html_content in partition_load_func()["content_body"].dropna():
+            soup = BeautifulSoup(html_content, "html.parser")
+            texts.extend(str(text) for text in soup.find_all(string=True))
+
+    cleaned_texts = clean_texts(texts)
+    assert cleaned_texts == [
+        clean_text_reference(text) for text in texts
+    ], "Expected the same cleaned texts"
+
+    implementations = {
+        "clean_text (previous)": lambda: [clean_text_reference(text) for text in texts],
+        "clean_texts": lambda: clean_texts(texts),
+    }
+
+    print(
+        f"Text fragments: {len(texts)} ({sum(not text.isascii() for text in texts)} non-ASCII)"
+    )
+    timings = {}
+    for name, func in implementations.items():
+        timings[name] = min(timeit.repeat(func, number=1, repeat=args.repeat))
+        print(f"{name}: {timings[name] * 1000:.1f} ms (best of {args.repeat})")
+
+    baseline, kernel = timings.values()
+    print(f"Speedup: {baseline / kernel:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
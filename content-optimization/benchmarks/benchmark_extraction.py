@@ -0,0 +1,266 @@
+"""
+Benchmarks the throughput and latency of the article extraction (see `extract_article`) on synthetic articles (see
+`html_generator.py`), after checking the extracted data against the golden extraction corpus.
+
+The golden corpus (`benchmarks/golden/extraction.jsonl`) holds the HTML content of synthetic articles of different
+sizes, table and image densities and nesting depths, and the data extracted from them. It is also checked by
+`test_golden_extraction` in `tests/pipelines/data_processing/test_extractor.py`. When a change to the extractor is
+meant to change the extracted data, update the corpus with `--update-golden` and review its diff.
+
+Run from the `content-optimization` directory:
+
+    python benchmarks/benchmark_extraction.py --num-articles 500 --workers 4 --repeat 3
+    python benchmarks/benchmark_extraction.py --table-density 0.8 --image-density 0.5 --nesting-depth 4
+    python benchmarks/benchmark_extraction.py --update-golden
+"""
+
+import argparse
+import json
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+from content_optimization.pipelines.data_processing.utils import (
+    extract_article,
+    extract_articles,
+)
+from html_generator import generate_articles
+
+GOLDEN_PATH = Path(__file__).resolve().parent / "golden" / "extraction.jsonl"
+
+# The generator settings of each group of articles in the golden corpus
+GOLDEN_PROFILES = {
+    "minimal": {"num_sections": 1, "paragraphs_per_section": 1},
+    "default": {},
+    "tables": {"table_density": 0.9, "list_density": 0.6},
+    "images": {"image_density": 0.9, "non_ascii_ratio": 0.1},
+    "nested": {"nesting_depth": 5},
+    "long": {"num_sections": 8, "words_per_paragraph": 60},
+}
+GOLDEN_ARTICLES_PER_PROFILE = 2
+
+
+def parse_arguments() -> argparse.Namespace:
+    """
+    Parses the command line arguments.
+
+    Returns:
+        argparse.Namespace: The parsed arguments.
+    """
+    parser = argparse.ArgumentParser(
+        description="Benchmark the article extraction on synthetic articles."
+    )
+    parser.add_argument(
+        "--num-articles",
+        type=int,
+        default=200,
+        help="The number of synthetic articles to extract.",
+    )
+    parser.add_argument(
+        "--num-sections",
+        type=int,
+        default=5,
+        help="The average number of sections of each article.",
+    )
+    parser.add_argument(
+        "--paragraphs-per-section",
+        type=int,
+        default=3,
+        help="The average number of paragraphs in each section.",
+    )
+    parser.add_argument(
+        "--words-per-paragraph",
+        type=int,
+        default=40,
+        help="The approximate number of words in each paragraph.",
+    )
+    parser.add_argument(
+        "--table-density",
+        type=float,
+        default=0.2,
+        help="The probability that a section has a table.",
+    )
+    parser.add_argument(
+        "--image-density",
+        type=float,
+        default=0.2,
+        help="The probability that a section has an image.",
+    )
+    parser.add_argument(
+        "--nesting-depth",
+        type=int,
+        default=1,
+        help="The number of containers wrapped around each section.",
+    )
+    parser.add_argument(
+        "--seed", type=int, default=42, help="The seed of the synthetic articles."
+    )
+    parser.add_argument(
+        "--parser",
+        type=str,
+        default="html.parser",
+        help="The BeautifulSoup parser to use.",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="The number of worker processes. If 1, the articles are extracted in the current process.",
+    )
+    parser.add_argument(
+        "--chunksize",
+        type=int,
+        default=32,
+        help="The number of articles sent to a worker at a time.",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=3,
+        help="The number of times to extract the articles.",
+    )
+    parser.add_argument(
+        "--update-golden",
+        action="store_true",
+        help="Regenerate the golden extraction corpus with the current extractor and exit.",
+    )
+
+    return parser.parse_args()
+
+
+def to_json(extracted_data: dict[str, Any]) -> dict[str, Any]:
+    """
+    Converts the extracted data of an article to its JSON representation (e.g. tuples to lists), as stored in the
+    golden corpus.
+
+    Args:
+        extracted_data (dict[str, Any]): The extracted data of an article.
+
+    Returns:
+        dict[str, Any]: The JSON representation of the extracted data.
+    """
+    return json.loads(json.dumps(extracted_data))
+
+
+def update_golden(golden_path: Path) -> None:
+    """
+    Regenerates the golden corpus with the articles of the `GOLDEN_PROFILES` and the data extracted by the current
+    extractor.
+
+    Args:
+        golden_path (Path): The path of the golden corpus.
+    """
+    golden_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(golden_path, "w", encoding="utf-8") as f:
+        for seed, (profile, settings) in enumerate(GOLDEN_PROFILES.items()):
+            articles = generate_articles(
+                GOLDEN_ARTICLES_PER_PROFILE, seed=seed, **settings
+            )
+            for content_name, content_category, full_url, html_content in articles:
+                record = {
+                    "profile": profile,
+                    "content_name": f"{profile}-{content_name}",
+                    "content_category": content_category,
+                    "full_url": full_url,
+                    "html_content": html_content,
+                }
+                record["expected"] = to_json(
+                    extract_article(
+                        record["content_name"],
+                        content_category,
+                        full_url,
+                        html_content,
+                    )
+                )
+                f.write(json.dumps(record) + "\n")
+
+
+def check_golden(golden_path: Path, parser: str) -> int:
+    """
+    Checks the data extracted from the articles of the golden corpus against the expected data.
+
+    Args:
+        golden_path (Path): The path of the golden corpus.
+        parser (str): The BeautifulSoup parser to use.
+
+    Returns:
+        int: The number of articles checked.
+    """
+    with open(golden_path, encoding="utf-8") as f:
+        records = [json.loads(line) for line in f]
+
+    for record in records:
+        extracted_data = extract_article(
+            record["content_name"],
+            record["content_category"],
+            record["full_url"],
+            record["html_content"],
+            parser,
+        )
+        assert (
+            to_json(extracted_data) == record["expected"]
+        ), f"Expected the golden extracted data for {record['content_name']}"
+
+    return len(records)
+
+
+def main():
+    args = parse_arguments()
+
+    if args.update_golden:
+        update_golden(GOLDEN_PATH)
+        print(f"Updated the golden extraction corpus at {GOLDEN_PATH}")
+        return
+
+    print(f"Golden articles: {check_golden(GOLDEN_PATH, args.parser)} (matched)")
+
+    articles = generate_articles(
+        args.num_articles,
+        seed=args.seed,
+        num_sections=args.num_sections,
+        paragraphs_per_section=args.paragraphs_per_section,
+        words_per_paragraph=args.words_per_paragraph,
+        table_density=args.table_density,
+        image_density=args.image_density,
+        nesting_depth=args.nesting_depth,
+    )
+    sizes = [len(article[3]) for article in articles]
+    print(
+        f"Synthetic articles: {len(articles)} "
+        f"(median {np.median(sizes) / 1000:.1f} kB, max {max(sizes) / 1000:.1f} kB)"
+    )
+
+    # The latency of each article is measured in the current process
+    latencies = []
+    for _ in range(args.repeat):
+        for article in articles:
+            start = time.perf_counter()
+            extract_article(*article, args.parser)
+            latencies.append(time.perf_counter() - start)
+    p50, p95 = np.percentile(latencies, [50, 95]) * 1000
+    print(f"Latency: p50 {p50:.2f} ms, p95 {p95:.2f} ms")
+
+    if args.workers > 1:
+        with ProcessPoolExecutor(max_workers=args.workers) as executor:
+            # Warm up the worker processes before timing
+            extract_articles(articles[: args.workers], executor, 1, args.parser)
+            timings = []
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                extract_articles(articles, executor, args.chunksize, args.parser)
+                timings.append(time.perf_counter() - start)
+        best = min(timings)
+    else:
+        latencies = np.reshape(latencies, (args.repeat, len(articles)))
+        best = latencies.sum(axis=1).min()
+
+    print(
+        f"Throughput: {len(articles) / best:.1f} articles/s "
+        f"({args.workers} worker(s), best of {args.repeat})"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""
+Benchmarks `map_all_category_names` against `map_category_names` on the full `all_contents_extracted` dataset.
+
+Run from the `content-optimization` directory after running the `data_processing` pipeline:
+
+    python benchmarks/benchmark_ia_mappings.py --repeat 5
+"""
+
+import argparse
+import timeit
+from pathlib import Path
+
+import pandas as pd
+from content_optimization.pipelines.data_processing.utils import (
+    invert_ia_mappings,
+    map_all_category_names,
+    map_category_names,
+)
+from kedro.framework.session import KedroSession
+from kedro.framework.startup import bootstrap_project
+
+
+def parse_arguments() -> argparse.Namespace:
+    """
+    Parses the command line arguments.
+
+    Returns:
+        argparse.Namespace: The parsed arguments.
+    """
+    parser = argparse.ArgumentParser(
+        description="Benchmark the vectorized IA mapping against the row-wise IA mapping."
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=5,
+        help="The number of times to run each implementation.",
+    )
+
+    return parser.parse_args()
+
+
+def map_category_names_by_level(
+    l1_mappings: dict[str, dict[str, str]],
+    l2_mappings: dict[str, dict[str, str]],
+    df: pd.DataFrame,
+) -> pd.DataFrame:
+    """
+    Maps the L1 and L2 IA mappings one after another with `map_category_names`.
+
+    Args:
+        l1_mappings (dict[str, dict[str, str]]): The inverted L1 IA mappings.
+        l2_mappings (dict[str, dict[str, str]]): The inverted L2 IA mappings.
+        df (pd.DataFrame): The DataFrame containing the articles.
+
+    Returns:
+        pd.DataFrame: The DataFrame with the L1 and L2 IA mappings.
+    """
+    df = map_category_names(
+        l1_mappings, df, "content_category", "article_category_names", "l1_mappings"
+    )
+
+    return map_category_names(
+        l2_mappings, df, "content_category", "article_category_names", "l2_mappings"
+    )
+
+
+def main():
+    args = parse_arguments()
+
+    project_path = Path(__file__).resolve().parents[1]
+    bootstrap_project(project_path)
+    with KedroSession.create(project_path=project_path) as session:
+        catalog = session.load_context().catalog
+        df = pd.concat(
+            [
+                partition_load_func()
+                for partition_load_func in catalog.load(
+                    "all_contents_extracted"
+                ).values()
+            ],
+            ignore_index=True,
+        )
+        l1_mappings = invert_ia_mappings(catalog.load("params:l1_mappings"))
+        l2_mappings = invert_ia_mappings(catalog.load("params:l2_mappings"))
+
+    implementations = {
+        "map_category_names (L1, L2)": lambda: map_category_names_by_level(
+            l1_mappings, l2_mappings, df.copy()
+        ),
+        "map_all_category_names": lambda: map_all_category_names(
+            {"l1_mappings": l1_mappings, "l2_mappings": l2_mappings},
+            df.copy(),
+            "content_category",
+            "article_category_names",
+        ),
+    }
+
+    print(f"Articles: {len(df)}")
+    timings = {}
+    for name, func in implementations.items():
+        timings[name] = min(timeit.repeat(func, number=1, repeat=args.repeat))
+        print(f"{name}: {timings[name] * 1000:.1f} ms (best of {args.repeat})")
+
+    baseline, vectorized = timings.values()
+    print(f"Speedup: {baseline / vectorized:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,328 @@
+"""
+Generates synthetic article HTML that resembles the HealthHub CMS content, for the extraction benchmark and the golden
+extraction corpus (see `benchmark_extraction.py`).
+
+The articles are made of sections with a header, paragraphs with links, lists, tables, images and "Related:" links,
+wrapped in nested containers, followed by the "Read these next:" links. The size, table density, image density and nesting depth are tunable, and the same seed always generates
+the same articles.
+"""
+
+import random
+
+WORDS = (
+    "diabetes heart lungs fitness diet sleep stress vaccine kidney skin blood pressure cholesterol exercise "
+    "nutrition screening doctor clinic polyclinic medication caregiver pregnancy infant teen elderly mental "
+    "wellness smoking alcohol sugar salt fibre vegetables fruit rice water walking swimming"
+).split()
+
+# Special characters found in the CMS content, which are normalized by `clean_text`
+NON_ASCII_WORDS = [
+    "caf\u00e9",
+    "na\u00efve",
+    "\u201chealthy\u201d",
+    "don\u2019t",
+    "\u2013",
+    "\u00a9",
+    "\xa0",
+    "\u200b",
+]
+
+CONTENT_CATEGORIES = [
+    "cost-and-financing",
+    "diseases-and-conditions",
+    "live-healthy-articles",
+    "medical-care-and-facilities",
+    "support-group-and-others",
+]
+
+# The containers wrapped around the sections, as in the CMS content
+CONTAINERS = ["div", "span"]
+
+# The relative weights of the formatting of the sentences in a paragraph
+SENTENCE_FORMATS = {"plain": 70, "link": 15, "strong": 10, "em": 5}
+# The probability that a section ends with a "Related:" link
+RELATED_PROBABILITY = 0.2
+# The probability that a section header is a `h2` rather than a `h3` or `h4`
+H2_PROBABILITY = 0.6
+
+
+def generate_sentence(
+    rng: random.Random, num_words: int, non_ascii_ratio: float
+) -> str:
+    """
+    Generates a sentence of random words.
+
+    Args:
+        rng (random.Random): The random number generator.
+        num_words (int): The number of words.
+        non_ascii_ratio (float): The probability that a word is replaced by a word with special characters.
+
+    Returns:
+        str: The sentence.
+    """
+    words = [
+        (
+            rng.choice(NON_ASCII_WORDS)
+            if rng.random() < non_ascii_ratio
+            else rng.choice(WORDS)
+        )
+        for _ in range(num_words)
+    ]
+
+    return " ".join(words).capitalize() + rng.choice([".", ".", ".", "!", "?"])
+
+
+def generate_paragraph(
+    rng: random.Random, num_words: int, non_ascii_ratio: float
+) -> str:
+    """
+    Generates a paragraph of sentences, with inline formatting and links.
+
+    Args:
+        rng (random.Random): The random number generator.
+        num_words (int): The approximate number of words.
+        non_ascii_ratio (float): The probability that a word is replaced by a word with special characters.
+
+    Returns:
+        str: The HTML of the paragraph.
+    """
+    sentences = []
+    while num_words > 0:
+        length = min(num_words, rng.randint(5, 20))
+        sentence = generate_sentence(rng, length, non_ascii_ratio)
+        sentence_format = rng.choices(
+            list(SENTENCE_FORMATS), weights=list(SENTENCE_FORMATS.values())
+        )[0]
+        if sentence_format == "link":
+            word = rng.choice(WORDS)
+            sentence += f' <a href="https://www.healthhub.sg/live-healthy/{word}">Read more about {word}</a>.'
+        elif sentence_format == "strong":
+            sentence = f"<strong>{sentence}</strong>"
+        elif sentence_format == "em":
+            sentence = f"<em>{sentence}</em>"
+        sentences.append(sentence)
+        num_words -= length
+
+    return f"<p>{' '.join(sentences)}</p>"
+
+
+def generate_list(rng: random.Random, non_ascii_ratio: float) -> str:
+    """
+    Generates an unordered or ordered list.
+
+    Args:
+        rng (random.Random): The random number generator.
+        non_ascii_ratio (float): The probability that a word is replaced by a word with special characters.
+
+    Returns:
+        str: The HTML of the list.
+    """
+    tag = rng.choice(["ul", "ol"])
+    items = "".join(
+        f"<li>{generate_sentence(rng, rng.randint(3, 12), non_ascii_ratio)}</li>"
+        for _ in range(rng.randint(2, 6))
+    )
+
+    return f"<{tag}>{items}</{tag}>"
+
+
+def generate_table(rng: random.Random) -> str:
+    """
+    Generates a table with a header row.
+
+    Args:
+        rng (random.Random): The random number generator.
+
+    Returns:
+        str: The HTML of the table.
+    """
+    num_columns = rng.randint(2, 4)
+    header = "".join(
+        f"<th>{rng.choice(WORDS).title()}</th>" for _ in range(num_columns)
+    )
+    rows = "".join(
+        "<tr>"
+        + "".join(
+            f"<td>{' '.join(rng.choices(WORDS, k=rng.randint(1, 4)))}</td>"
+            for _ in range(num_columns)
+        )
+        + "</tr>"
+        for _ in range(rng.randint(1, 8))
+    )
+
+    return f"<table><tbody><tr>{header}</tr>{rows}</tbody></table>"
+
+
+def generate_image(rng: random.Random) -> str:
+    """
+    Generates an image with alternative text.
+
+    Args:
+        rng (random.Random): The random number generator.
+
+    Returns:
+        str: The HTML of the image.
+    """
+    word = rng.choice(WORDS)
+
+    return (
+        f'<p><img src="https://www.healthhub.sg/sites/assets/Assets/{word}.jpg" alt="Image of {word}"/>'
+        f"<em>Image courtesy of HealthHub</em></p>"
+    )
+
+
+def generate_related_link(rng: random.Random) -> str:
+    """
+    Generates a "Related:" link to another article.
+
+    Args:
+        rng (random.Random): The random number generator.
+
+    Returns:
+        str: The HTML of the related link.
+    """
+    word = rng.choice(WORDS)
+
+    return (
+        f'<p><strong>Related: <a href="https://www.healthhub.sg/live-healthy/{word}">'
+        f"Managing {word.title()}</a></strong></p>"
+    )
+
+
+def generate_related_sections(rng: random.Random) -> str:
+    """
+    Generates the "Read these next" links at the end of an article.
+
+    Args:
+        rng (random.Random): The random number generator.
+
+    Returns:
+        str: The HTML of the related sections.
+    """
+    links = "".join(
+        f'<li><a href="https://www.healthhub.sg/live-healthy/{word}">{word.title()} Guide</a></li>'
+        for word in rng.sample(WORDS, rng.randint(2, 4))
+    )
+
+    return f"<p><strong>Read these next:</strong></p><ul>{links}</ul>"
+
+
+def nest(rng: random.Random, html: str, depth: int) -> str:
+    """
+    Wraps the HTML in nested containers.
+
+    Args:
+        rng (random.Random): The random number generator.
+        html (str): The HTML to wrap.
+        depth (int): The number of containers.
+
+    Returns:
+        str: The wrapped HTML.
+    """
+    for _ in range(depth):
+        tag = rng.choice(CONTAINERS)
+        html = f"<{tag}>{html}</{tag}>"
+
+    return html
+
+
+def generate_article_html(
+    rng: random.Random,
+    num_sections: int = 5,
+    paragraphs_per_section: int = 3,
+    words_per_paragraph: int = 40,
+    table_density: float = 0.2,
+    image_density: float = 0.2,
+    list_density: float = 0.3,
+    nesting_depth: int = 1,
+    non_ascii_ratio: float = 0.02,
+) -> str:
+    """
+    Generates the HTML content of an article.
+
+    Args:
+        rng (random.Random): The random number generator.
+        num_sections (int): The number of sections, each with a header. Defaults to 5.
+        paragraphs_per_section (int): The number of paragraphs in each section. Defaults to 3.
+        words_per_paragraph (int): The approximate number of words in each paragraph. Defaults to 40.
+        table_density (float): The probability that a section has a table. Defaults to 0.2.
+        image_density (float): The probability that a section has an image. Defaults to 0.2.
+        list_density (float): The probability that a section has a list. Defaults to 0.3.
+        nesting_depth (int): The number of containers wrapped around each section. Defaults to 1.
+        non_ascii_ratio (float): The probability that a word is replaced by a word with special characters.
+            Defaults to 0.02.
+
+    Returns:
+        str: The HTML content of the article.
+    """
+    sections = []
+    for i in range(num_sections):
+        header_tag = (
+            "h2"
+            if i == 0 or rng.random() < H2_PROBABILITY
+            else rng.choice(["h3", "h4"])
+        )
+        blocks = [
+            f"<{header_tag}>{generate_sentence(rng, rng.randint(2, 6), 0)[:-1]}</{header_tag}>"
+        ]
+        blocks.extend(
+            generate_paragraph(rng, words_per_paragraph, non_ascii_ratio)
+            for _ in range(paragraphs_per_section)
+        )
+        if rng.random() < list_density:
+            blocks.insert(
+                rng.randint(1, len(blocks)), generate_list(rng, non_ascii_ratio)
+            )
+        if rng.random() < table_density:
+            blocks.insert(rng.randint(1, len(blocks)), generate_table(rng))
+        if rng.random() < image_density:
+            blocks.insert(rng.randint(1, len(blocks)), generate_image(rng))
+        if rng.random() < RELATED_PROBABILITY:
+            blocks.append(generate_related_link(rng))
+        sections.append(nest(rng, "".join(blocks), nesting_depth))
+
+    sections.append(generate_related_sections(rng))
+
+    return "<div>" + "".join(sections) + "</div>"
+
+
+def generate_articles(
+    num_articles: int, seed: int = 42, **kwargs
+) -> list[tuple[str, str, str, str]]:
+    """
+    Generates articles in the format of `extract_articles`. The number of sections and paragraphs of each article vary
+    by up to 50% around the given values, so that the articles have different sizes.
+
+    Args:
+        num_articles (int): The number of articles.
+        seed (int): The seed of the random number generator. Defaults to 42.
+        **kwargs: The keyword arguments of `generate_article_html`.
+
+    Returns:
+        list[tuple[str, str, str, str]]: A list of `(content_name, content_category, full_url, html_content)` tuples.
+    """
+    rng = random.Random(seed)
+    num_sections = kwargs.pop("num_sections", 5)
+    paragraphs_per_section = kwargs.pop("paragraphs_per_section", 3)
+
+    articles = []
+    for i in range(num_articles):
+        content_category = rng.choice(CONTENT_CATEGORIES)
+        html_content = generate_article_html(
+            rng,
+            num_sections=max(1, round(num_sections * rng.uniform(0.5, 1.5))),
+            paragraphs_per_section=max(
+                1, round(paragraphs_per_section * rng.uniform(0.5, 1.5))
+            ),
+            **kwargs,
+        )
+        articles.append(
+            (
+                f"synthetic-article-{i}",
+                content_category,
+                f"https://www.healthhub.sg/{content_category}/synthetic-article-{i}",
+                html_content,
+            )
+        )
+
+    return articles
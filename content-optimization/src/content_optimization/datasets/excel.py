@@ -0,0 +1,216 @@
+import hashlib
+import io
+import json
+import logging
+import pickle
+from pathlib import PurePosixPath
+from typing import Any
+
+import fsspec
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+from kedro.io import AbstractDataset, DatasetError
+from kedro.io.core import get_filepath_str, get_protocol_and_path
+
+# Set up logger in excel.py
+# Edit conf/logging.yml to see changes
+logger = logging.getLogger(__name__)
+
+# Bump to invalidate all sidecars written by earlier versions of the dataset
+SIDECAR_VERSION = 1
+
+
+class CachedExcelDataset(AbstractDataset[None, pd.DataFrame | dict[str, pd.DataFrame]]):
+    def __init__(
+        self,
+        filepath: str,
+        cache_dir: str = "data/02_intermediate/excel_cache",
+        load_args: dict[str, Any] = {},
+        fs_args: dict[str, Any] = {},
+    ):
+        """
+        A constructor method for initializing the CachedExcelDataset object.
+
+        The workbook is read with `pd.read_excel` the first time, and converted to a columnar Parquet sidecar in
+        `cache_dir`, keyed on the SHA-256 hash of the workbook and the `load_args`. Later loads read the sidecar
+        instead, until the workbook or the `load_args` change. Sheets that cannot be stored losslessly as Parquet
+        (e.g. columns of mixed types) are pickled instead.
+
+        Parameters:
+            filepath (str): The path to the Excel workbook.
+            cache_dir (str, optional): The directory of the sidecars. Defaults to "data/02_intermediate/excel_cache".
+            load_args (dict[str, Any], optional): Arguments passed to `pd.read_excel` on a cache miss. Set `engine`
+                to "calamine" (requires `python-calamine`) for a faster reader. Defaults to {}.
+            fs_args (dict[str, Any], optional): Arguments passed to the fsspec filesystem. Defaults to {}.
+        """
+        # parse the path and protocol (e.g. file, http, s3, etc.)
+        protocol, path = get_protocol_and_path(filepath)
+        self._protocol = protocol
+        self._fs = fsspec.filesystem(self._protocol, **fs_args)
+        self._filepath = PurePosixPath(path)
+        self._cache_dir = PurePosixPath(get_protocol_and_path(cache_dir)[1])
+        self._load_args = load_args
+
+    def _load(self) -> pd.DataFrame | dict[str, pd.DataFrame]:
+        """
+        Loads the workbook from its sidecar, or reads the workbook and writes its sidecar on a cache miss.
+
+        Returns:
+            pd.DataFrame | dict[str, pd.DataFrame]: The sheet, or a dictionary of sheets if `sheet_name` is a list
+                or None, exactly as returned by `pd.read_excel`.
+        """
+        load_path = get_filepath_str(self._filepath, self._protocol)
+        with self._fs.open(load_path, mode="rb") as f:
+            content = f.read()
+
+        sidecar_dir = self._get_sidecar_dir(content)
+        manifest_path = f"{sidecar_dir}/manifest.json"
+        if self._fs.exists(manifest_path):
+            return self._load_sidecar(sidecar_dir)
+
+        logger.info(f"Excel Cache: Miss for {self._filepath}, reading workbook")
+        data = pd.read_excel(io.BytesIO(content), **self._load_args)
+        self._save_sidecar(sidecar_dir, data)
+
+        return data
+
+    def _save(self, data: pd.DataFrame | dict[str, pd.DataFrame]) -> None:
+        raise DatasetError(f"{self.__class__.__name__} is a read-only dataset")
+
+    def _exists(self) -> bool:
+        return self._fs.exists(get_filepath_str(self._filepath, self._protocol))
+
+    def _describe(self) -> dict[str, Any]:
+        """Returns a dict that describes the attributes of the dataset."""
+        return dict(
+            filepath=self._filepath,
+            cache_dir=self._cache_dir,
+            load_args=self._load_args,
+            protocol=self._protocol,
+        )
+
+    def _get_sidecar_dir(self, content: bytes) -> str:
+        """
+        Gets the directory of the sidecar of the workbook, keyed on the hash of its content and the `load_args`.
+
+        Args:
+            content (bytes): The content of the workbook.
+
+        Returns:
+            str: The directory of the sidecar.
+        """
+        digest = hashlib.sha256(content)
+        digest.update(
+            json.dumps(
+                [SIDECAR_VERSION, pd.__version__, self._load_args],
+                sort_keys=True,
+                default=str,
+            ).encode()
+        )
+        return f"{self._cache_dir}/{self._filepath.stem}-{digest.hexdigest()[:16]}"
+
+    def _load_sidecar(self, sidecar_dir: str) -> pd.DataFrame | dict[str, pd.DataFrame]:
+        """
+        Loads the sheets from the sidecar.
+
+        Args:
+            sidecar_dir (str): The directory of the sidecar.
+
+        Returns:
+            pd.DataFrame | dict[str, pd.DataFrame]: The sheet, or a dictionary of sheets.
+        """
+        with self._fs.open(f"{sidecar_dir}/manifest.json", mode="r") as f:
+            manifest = json.load(f)
+
+        sheets = {}
+        for sheet in manifest["sheets"]:
+            with self._fs.open(f"{sidecar_dir}/{sheet['file']}", mode="rb") as f:
+                if sheet["file"].endswith(".parquet"):
+                    sheets[sheet["name"]] = restore_missing_values(pd.read_parquet(f))
+                else:
+                    sheets[sheet["name"]] = pickle.load(f)
+
+        if not manifest["multiple_sheets"]:
+            return next(iter(sheets.values()))
+
+        return sheets
+
+    def _save_sidecar(
+        self, sidecar_dir: str, data: pd.DataFrame | dict[str, pd.DataFrame]
+    ) -> None:
+        """
+        Saves the sheets to the sidecar, and removes the stale sidecars of the workbook.
+
+        Args:
+            sidecar_dir (str): The directory of the sidecar.
+            data (pd.DataFrame | dict[str, pd.DataFrame]): The sheet, or a dictionary of sheets.
+        """
+        multiple_sheets = isinstance(data, dict)
+        sheets = data if multiple_sheets else {None: data}
+
+        # Remove the sidecars of earlier versions of the workbook
+        for stale_dir in self._fs.glob(
+            f"{self._cache_dir}/{self._filepath.stem}-{'?' * 16}"
+        ):
+            self._fs.rm(stale_dir, recursive=True)
+        self._fs.makedirs(sidecar_dir, exist_ok=True)
+
+        manifest = {"multiple_sheets": multiple_sheets, "sheets": []}
+        for i, (name, df) in enumerate(sheets.items()):
+            buffer = to_parquet_bytes(df)
+            filename = f"{i}.parquet" if buffer is not None else f"{i}.pkl"
+            if buffer is None:
+                buffer = pickle.dumps(df, protocol=pickle.HIGHEST_PROTOCOL)
+            with self._fs.open(f"{sidecar_dir}/{filename}", mode="wb") as f:
+                f.write(buffer)
+            manifest["sheets"].append({"name": name, "file": filename})
+
+        # The manifest is written last, so that an interrupted write is a cache miss
+        with self._fs.open(f"{sidecar_dir}/manifest.json", mode="w") as f:
+            json.dump(manifest, f)
+
+
+def restore_missing_values(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Restores the missing values of the object columns as NaN, as returned by `pd.read_excel`, since Parquet loads
+    them as None.
+
+    Args:
+        df (pd.DataFrame): The DataFrame loaded from Parquet.
+
+    Returns:
+        pd.DataFrame: The DataFrame with NaN as the missing values of the object columns.
+    """
+    for column in df.columns[df.dtypes == object]:
+        if df[column].isna().any():
+            df[column] = df[column].where(df[column].notna(), np.nan)
+
+    return df
+
+
+def to_parquet_bytes(df: pd.DataFrame) -> bytes | None:
+    """
+    Converts a DataFrame to Parquet, if it loads back from Parquet exactly.
+
+    Args:
+        df (pd.DataFrame): The DataFrame to convert.
+
+    Returns:
+        bytes | None: The Parquet file, or None if the DataFrame cannot be stored losslessly as Parquet.
+    """
+    try:
+        buffer = df.to_parquet()
+        restored = restore_missing_values(pd.read_parquet(io.BytesIO(buffer)))
+    except (pa.ArrowException, ValueError, TypeError) as e:
+        logger.debug(f"Excel Cache: Falling back to pickle ({e})")
+        return None
+
+    if (
+        restored.columns.equals(df.columns)
+        and restored.dtypes.equals(df.dtypes)
+        and restored.equals(df)
+    ):
+        return buffer
+
+    return None
@@ -0,0 +1,202 @@
+import os
+import sqlite3
+from collections.abc import Iterator, Mapping
+from contextlib import closing
+from pathlib import PurePosixPath
+from typing import Any
+
+from kedro.io import AbstractDataset
+from kedro.io.core import get_protocol_and_path
+
+# Seconds to wait for the lock on the database held by another save (e.g. a branch of the parallel pipeline)
+LOCK_TIMEOUT = 60
+
+
+def get_article_id(key: str) -> int | None:
+    """
+    Gets the article id from the key of an extracted text, e.g. "diseases-and-conditions/Diabetes_1234".
+
+    Args:
+        key (str): The key of the extracted text, i.e. the path of the text file without the suffix.
+
+    Returns:
+        int | None: The article id, or None if the key does not end with an id.
+    """
+    suffix = key.rsplit("_", 1)[-1]
+    return int(suffix) if suffix.isdigit() else None
+
+
+class PackedTextStore(Mapping[str, str]):
+    """
+    A read-only view of the extracted texts packed in a SQLite database.
+
+    The texts are keyed by the path of the text file without the suffix (e.g. "diseases-and-conditions/Diabetes_1234"),
+    as in the `partitions.PartitionedDataset` of `text.TextDataset`, and can also be looked up by article id. Each
+    lookup opens its own read-only connection, so that the store can be shared across processes.
+
+    Attributes:
+        filepath (str): The path to the SQLite database.
+    """
+
+    def __init__(self, filepath: str) -> None:
+        self.filepath = filepath
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(f"file:{self.filepath}?mode=ro", uri=True)
+
+    def __getitem__(self, key: str) -> str:
+        with closing(self._connect()) as connection:
+            row = connection.execute(
+                "SELECT text FROM texts WHERE key = ?", (key,)
+            ).fetchone()
+
+        if row is None:
+            raise KeyError(key)
+
+        return row[0]
+
+    def __iter__(self) -> Iterator[str]:
+        with closing(self._connect()) as connection:
+            for (key,) in connection.execute("SELECT key FROM texts ORDER BY rowid"):
+                yield key
+
+    def __len__(self) -> int:
+        with closing(self._connect()) as connection:
+            return connection.execute("SELECT COUNT(*) FROM texts").fetchone()[0]
+
+    def get_by_id(self, article_id: int) -> str | None:
+        """
+        Looks up the extracted text of an article by its id.
+
+        Args:
+            article_id (int): The id of the article.
+
+        Returns:
+            str | None: The extracted text if found, None otherwise.
+        """
+        with closing(self._connect()) as connection:
+            row = connection.execute(
+                "SELECT text FROM texts WHERE article_id = ?", (int(article_id),)
+            ).fetchone()
+
+        return None if row is None else row[0]
+
+    def iter_texts(
+        self, content_category: str | None = None, batch_size: int = 1000
+    ) -> Iterator[tuple[str, str]]:
+        """
+        Streams the extracted texts in the order they were saved, without loading them all into memory.
+
+        Args:
+            content_category (str | None): The content category to stream. Defaults to None (all content categories).
+            batch_size (int): The number of texts to fetch from the database at a time. Defaults to 1000.
+
+        Yields:
+            tuple[str, str]: The key and the extracted text.
+        """
+        query = "SELECT key, text FROM texts"
+        parameters = ()
+        if content_category is not None:
+            query += " WHERE content_category = ?"
+            parameters = (content_category,)
+
+        with closing(self._connect()) as connection:
+            cursor = connection.execute(query + " ORDER BY rowid", parameters)
+            while rows := cursor.fetchmany(batch_size):
+                yield from rows
+
+    def export(self, output_dir: str, content_category: str | None = None) -> int:
+        """
+        Exports the extracted texts as loose text files, in the layout of the `partitions.PartitionedDataset` of
+        `text.TextDataset` (i.e. `<output_dir>/<content_category>/<title>_<id>.txt`).
+
+        Args:
+            output_dir (str): The directory to export the text files to.
+            content_category (str | None): The content category to export. Defaults to None (all content categories).
+
+        Returns:
+            int: The number of exported text files.
+        """
+        exported = 0
+        for key, text in self.iter_texts(content_category):
+            filepath = os.path.join(output_dir, f"{key}.txt")
+            os.makedirs(os.path.dirname(filepath), exist_ok=True)
+            with open(filepath, "w", encoding="utf-8") as f:
+                f.write(text or "")
+            exported += 1
+
+        return exported
+
+
+class PackedTextDataset(AbstractDataset[Mapping[str, str], PackedTextStore]):
+    def __init__(self, filepath: str):
+        """
+        A constructor method for initializing the PackedTextDataset object.
+
+        The extracted texts are packed into a single SQLite database with an index on the article id, instead of one
+        text file per article. Like a `partitions.PartitionedDataset`, saving replaces the texts of the content
+        categories that are saved and keeps the others (e.g. in incremental runs).
+
+        Parameters:
+            filepath (str): The path to the SQLite database. Only local paths are supported.
+        """
+        _, path = get_protocol_and_path(filepath)
+        self._filepath = PurePosixPath(path)
+
+    def _load(self) -> PackedTextStore:
+        """
+        Loads a lazy view of the extracted texts.
+
+        Returns:
+            PackedTextStore: The extracted texts, which are only read from the database on access.
+        """
+        return PackedTextStore(str(self._filepath))
+
+    def _save(self, data: Mapping[str, str]) -> None:
+        """
+        Saves the extracted texts, replacing the texts of the content categories that are saved.
+
+        The texts are inserted as they are iterated, so that texts spilled to disk (e.g. `SpilledTexts`) are not all
+        loaded into memory.
+
+        Args:
+            data (Mapping[str, str]): The extracted texts, where the keys are the paths of the text files without the
+                suffix (i.e. "<content_category>/<title>_<id>") and the values are the extracted texts.
+        """
+        os.makedirs(os.path.dirname(self._filepath) or ".", exist_ok=True)
+        content_categories = {key.split("/", 1)[0] for key in data}
+        rows = (
+            (key, key.split("/", 1)[0], get_article_id(key), text)
+            for key, text in data.items()
+        )
+
+        with closing(
+            sqlite3.connect(self._filepath, timeout=LOCK_TIMEOUT)
+        ) as connection, connection:
+            connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS texts (
+                    key TEXT PRIMARY KEY,
+                    content_category TEXT NOT NULL,
+                    article_id INTEGER,
+                    text TEXT
+                )
+                """
+            )
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS texts_article_id ON texts (article_id)"
+            )
+            connection.executemany(
+                "DELETE FROM texts WHERE content_category = ?",
+                [(content_category,) for content_category in content_categories],
+            )
+            connection.executemany(
+                "INSERT OR REPLACE INTO texts VALUES (?, ?, ?, ?)", rows
+            )
+
+    def _exists(self) -> bool:
+        return os.path.exists(self._filepath)
+
+    def _describe(self) -> dict[str, Any]:
+        """Returns a dict that describes the attributes of the dataset."""
+        return dict(filepath=self._filepath)
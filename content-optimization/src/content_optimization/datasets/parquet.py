@@ -0,0 +1,214 @@
+import os
+from collections.abc import Iterable
+from pathlib import PurePosixPath
+from typing import Any
+
+import fsspec
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from kedro.io import AbstractVersionedDataset
+from kedro.io.core import Version, get_filepath_str, get_protocol_and_path
+
+
+class CompactParquetDataset(
+    AbstractVersionedDataset[pd.DataFrame | Iterable[pd.DataFrame], pd.DataFrame]
+):
+    DEFAULT_SAVE_ARGS: dict[str, Any] = {
+        "compression": "zstd",
+        "compression_level": 3,
+        "row_group_size": 1024,
+    }
+
+    def __init__(
+        self,
+        filepath: str,
+        categorical_columns: list[str] = [],
+        large_string_columns: list[str] = [],
+        arrow_dtypes: bool = True,
+        save_args: dict[str, Any] = {},
+        load_args: dict[str, Any] = {},
+        version: Version | None = None,
+        fs_args: dict[str, Any] = {},
+    ):
+        """
+        A constructor method for initializing the CompactParquetDataset object.
+
+        The DataFrame is saved as a Parquet file with an explicit schema, where the low-cardinality string columns
+        (e.g. `content_category`, `remove_type`) are dictionary encoded and the large text columns (e.g.
+        `extracted_content_body`) are stored as `large_string`. The types of the other columns are inferred.
+
+        Parameters:
+            filepath (str): The path to the Parquet file.
+            categorical_columns (list[str], optional): The low-cardinality string columns to dictionary encode.
+                Defaults to [].
+            large_string_columns (list[str], optional): The large text columns to store as `large_string`.
+                Defaults to [].
+            arrow_dtypes (bool, optional): Whether to load the dictionary encoded columns as `category` and the
+                `large_string` columns as Arrow-backed strings, which use less memory than Python strings. If False,
+                all string columns are loaded as Python strings, as with `pandas.ParquetDataset`. Defaults to True.
+            save_args (dict[str, Any], optional): Arguments passed to `pq.write_table`. Defaults to zstd compression
+                and row groups of 1024 rows.
+            load_args (dict[str, Any], optional): Arguments passed to `pq.read_table`. Defaults to {}.
+            version (Version | None, optional): The version of the dataset. Defaults to None.
+            fs_args (dict[str, Any], optional): Arguments passed to the fsspec filesystem. Defaults to {}.
+        """
+        # parse the path and protocol (e.g. file, http, s3, etc.)
+        protocol, path = get_protocol_and_path(filepath)
+        self._protocol = protocol
+        self._fs = fsspec.filesystem(self._protocol, **fs_args)
+        self._categorical_columns = categorical_columns
+        self._large_string_columns = large_string_columns
+        self._arrow_dtypes = arrow_dtypes
+        self._save_args = {**self.DEFAULT_SAVE_ARGS, **save_args}
+        self._load_args = load_args
+
+        super().__init__(
+            filepath=PurePosixPath(path),
+            version=version,
+            exists_function=self._fs.exists,
+            glob_function=self._fs.glob,
+        )
+
+    def _load(self) -> pd.DataFrame:
+        """
+        Loads the Parquet file as a DataFrame.
+
+        Returns:
+            pd.DataFrame: The loaded DataFrame.
+        """
+        load_path = get_filepath_str(self._get_load_path(), self._protocol)
+        with self._fs.open(load_path, mode="rb") as f:
+            table = pq.read_table(f, **self._load_args)
+
+        return table_to_pandas(table, self._arrow_dtypes)
+
+    def _save(self, data: pd.DataFrame | Iterable[pd.DataFrame]) -> None:
+        """
+        Saves the DataFrame as a Parquet file with the explicit schema.
+
+        The DataFrame can also be saved in batches (e.g. `SpilledBatches`), which are written as row groups one at a
+        time. The batches are iterated twice, first to unify their schemas (e.g. a column with only null values in a
+        batch) and then to write them, so they must be re-iterable.
+
+        Args:
+            data (pd.DataFrame | Iterable[pd.DataFrame]): The DataFrame, or the batches of the DataFrame, to save.
+        """
+        save_path = get_filepath_str(self._get_save_path(), self._protocol)
+        if self._protocol == "file":
+            os.makedirs(os.path.dirname(save_path), exist_ok=True)
+
+        if isinstance(data, pd.DataFrame):
+            schema = get_schema(
+                data, self._categorical_columns, self._large_string_columns
+            )
+            table = pa.Table.from_pandas(data, schema=schema, preserve_index=False)
+            with self._fs.open(save_path, mode="wb") as f:
+                pq.write_table(table, f, **self._save_args)
+            return
+
+        schema = pa.unify_schemas(
+            [
+                get_schema(df, self._categorical_columns, self._large_string_columns)
+                for df in data
+            ]
+        )
+        save_args = dict(self._save_args)
+        row_group_size = save_args.pop("row_group_size", None)
+        with (
+            self._fs.open(save_path, mode="wb") as f,
+            pq.ParquetWriter(f, schema, **save_args) as writer,
+        ):
+            for df in data:
+                table = pa.Table.from_pandas(df, schema=schema, preserve_index=False)
+                writer.write_table(table, row_group_size=row_group_size)
+
+    def _describe(self) -> dict[str, Any]:
+        """Returns a dict that describes the attributes of the dataset."""
+        return dict(
+            filepath=self._filepath,
+            categorical_columns=self._categorical_columns,
+            large_string_columns=self._large_string_columns,
+            arrow_dtypes=self._arrow_dtypes,
+            save_args=self._save_args,
+            load_args=self._load_args,
+            version=self._version,
+            protocol=self._protocol,
+        )
+
+
+def get_schema(
+    df: pd.DataFrame, categorical_columns: list[str], large_string_columns: list[str]
+) -> pa.Schema:
+    """
+    Gets the Arrow schema of a DataFrame, with the given string columns dictionary encoded or stored as
+    `large_string`.
+
+    Only columns of strings (or null values) are encoded, so that a column that is missing or of another type (e.g.
+    a column with only NaN) keeps its inferred type.
+
+    Args:
+        df (pd.DataFrame): The DataFrame to get the schema of.
+        categorical_columns (list[str]): The low-cardinality string columns to dictionary encode.
+        large_string_columns (list[str]): The large text columns to store as `large_string`.
+
+    Returns:
+        pa.Schema: The Arrow schema of the DataFrame.
+    """
+    schema = pa.Schema.from_pandas(df, preserve_index=False)
+    for column in df.columns:
+        if isinstance(df[column].dtype, pd.CategoricalDtype):
+            is_string = pd.api.types.infer_dtype(df[column].cat.categories) in {
+                "string",
+                "empty",
+            }
+        else:
+            is_string = df[column].dtype == object and pd.api.types.infer_dtype(
+                df[column], skipna=True
+            ) in {"string", "empty"}
+        if not is_string:
+            continue
+
+        if column in categorical_columns:
+            field_type = pa.dictionary(pa.int32(), pa.string())
+        elif column in large_string_columns:
+            field_type = pa.large_string()
+        else:
+            continue
+        index = schema.get_field_index(column)
+        schema = schema.set(index, pa.field(column, field_type))
+
+    return schema
+
+
+def table_to_pandas(table: pa.Table, arrow_dtypes: bool = True) -> pd.DataFrame:
+    """
+    Converts an Arrow table saved by the `CompactParquetDataset` to a DataFrame.
+
+    Args:
+        table (pa.Table): The Arrow table.
+        arrow_dtypes (bool, optional): Whether to convert the dictionary encoded columns to `category` and the
+            `large_string` columns to Arrow-backed strings. If False, they are converted to Python strings. Defaults
+            to True.
+
+    Returns:
+        pd.DataFrame: The DataFrame.
+    """
+    if arrow_dtypes:
+        return table.to_pandas(
+            types_mapper={pa.large_string(): pd.ArrowDtype(pa.large_string())}.get
+        )
+
+    # Decode the dictionary encoded columns, so that null values are loaded as None instead of NaN
+    schema = pa.schema(
+        [
+            (
+                field.with_type(field.type.value_type)
+                if pa.types.is_dictionary(field.type)
+                else field
+            )
+            for field in table.schema
+        ],
+        metadata=table.schema.metadata,
+    )
+    return table.cast(schema).to_pandas()
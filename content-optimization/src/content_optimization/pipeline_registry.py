@@ -1,11 +1,26 @@
 """Project pipelines."""
 
+from pathlib import Path
 from typing import Dict
 
-from kedro.framework.project import find_pipelines
+from content_optimization.pipelines.data_processing import create_parallel_pipeline
+from kedro.framework.project import find_pipelines, settings
 from kedro.pipeline import Pipeline
 
 
+def get_content_categories() -> list[str]:
+    """Gets the content categories configured in the `columns_to_keep` parameters.
+
+    Returns:
+        The content categories to run a branch of the parallel pipeline for.
+    """
+    conf_source = Path(__file__).parents[2] / settings.CONF_SOURCE
+    config_loader = settings.CONFIG_LOADER_CLASS(
+        conf_source=str(conf_source), **settings.CONFIG_LOADER_ARGS
+    )
+    return list(config_loader["parameters"]["columns_to_keep"])
+
+
 def register_pipelines() -> Dict[str, Pipeline]:
     """Register the project's pipelines.
 
@@ -14,4 +29,8 @@ def register_pipelines() -> Dict[str, Pipeline]:
     """
     pipelines = find_pipelines()
     pipelines["__default__"] = sum(pipelines.values())
+    # Not part of the default pipeline, since it has the same outputs as `data_processing`
+    pipelines["data_processing_parallel"] = create_parallel_pipeline(
+        get_content_categories()
+    )
     return pipelines
@@ -21,7 +21,8 @@ def filter_articles(
     Args:
         merged_data (pd.DataFrame): DataFrame containing the merged article data.
         blacklist (List[int]): List of article IDs to be removed as duplicates.
-        whitelist (List[int]): List of article IDs that contain duplicated content/url but should be kept.
+        whitelist (List[int]): List of article IDs that contain duplicated content/url or are near duplicates but
+            should be kept.
         lengthy_articles (List[int]): List of article IDs for articles that are too lengthy and should be removed.
 
     Returns:
@@ -59,6 +60,12 @@ def filter_articles(
         | (filtered_data_rag["id"].isin(azure_whitelist))
     ]
 
+    # Remove 'Near Duplicate' from 'remove_type' column, except for specific 'id' values
+    filtered_data_rag = filtered_data_rag[
+        (filtered_data_rag["remove_type"] != "Near Duplicate")
+        | (filtered_data_rag["id"].isin(azure_whitelist))
+    ]
+
     # Remove the article that is too lengthy
     filtered_data_rag = filtered_data_rag[
         ~filtered_data_rag["id"].isin(lengthy_articles)
@@ -106,6 +113,41 @@ def _process_row(row):
     return processed_data_rag
 
 
+def get_section_chunks(
+    extracted_content_body: str, extracted_sections: List[Dict[str, Any]]
+) -> List[Dict[str, str]]:
+    """
+    Slices the sections of an article from its content body by its section tree, so that the article can be indexed
+    by section.
+
+    Args:
+        extracted_content_body (str): The extracted content body of the article.
+        extracted_sections (List[Dict[str, Any]]): The section tree of the article. See
+            `HTMLExtractor.extract_sections`.
+
+    Returns:
+        List[Dict[str, str]]: The non-empty sections, each with the path of its headers from the top-level header
+            (e.g. "Symptoms > Tremor", or "" for the text before the first header) and its content.
+    """
+    section_chunks = []
+    # The path of the headers of each section
+    headers = []
+
+    for section in extracted_sections:
+        # The root section has no header, and the parent of a section always precedes it
+        parent = section["parent"]
+        header_path = [] if parent == -1 else [*headers[parent], section["header"]]
+        headers.append(header_path)
+
+        content = extracted_content_body[section["start"] : section["end"]].strip()
+        if content:
+            section_chunks.append(
+                {"header": " > ".join(header_path), "content": content}
+            )
+
+    return section_chunks
+
+
 def extract_content(
     processed_data_rag: pd.DataFrame,
     article_content_columns: List[str],
@@ -125,6 +167,12 @@ def extract_content(
     # Prepare the dictionary to hold data
     json_data_rag = {}
 
+    # Missing values of the categorical and Arrow-backed columns of the merged data (e.g. `pr_name`) are NaN or pd.NA,
+    # which are not valid JSON, so they are converted to None
+    processed_data_rag = processed_data_rag.astype(object).where(
+        processed_data_rag.notna(), None
+    )
+
     # Loop through each row in the DataFrame using iterrows()
     for index, row in processed_data_rag.iterrows():
         row_id = row["id"]
@@ -137,6 +185,13 @@ def extract_content(
             extracted_data_content.pop("extracted_content_body")
         )
         extracted_data_content["id"] = str(row_id) + "_content"
+        # Add the sections sliced by the section tree, for the article to be indexed by section
+        extracted_sections = row.get("extracted_sections")
+        extracted_data_content["sections"] = (
+            get_section_chunks(extracted_data_content["content"], extracted_sections)
+            if extracted_sections is not None
+            else []
+        )
         content_key = str(row_id) + "_content"
 
         # Append to the dictionary under the unique key
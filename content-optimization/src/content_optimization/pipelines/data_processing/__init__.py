@@ -3,8 +3,8 @@
 generated using Kedro 0.19.6
 """
 
-from .pipeline import create_pipeline
+from .pipeline import create_parallel_pipeline, create_pipeline
 
-__all__ = ["create_pipeline"]
+__all__ = ["create_pipeline", "create_parallel_pipeline"]
 
 __version__ = "0.1"
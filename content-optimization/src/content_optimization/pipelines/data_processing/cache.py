@@ -0,0 +1,251 @@
+import hashlib
+import inspect
+import logging
+import os
+import pickle
+import platform
+import sqlite3
+import time
+from importlib import metadata
+from typing import Any, Optional
+
+import bs4
+from content_optimization.pipelines.data_processing import extractor, normalization
+
+# Set up logger in cache.py
+# Edit conf/logging.yml to see changes
+logger = logging.getLogger(__name__)
+
+# Seconds to wait for the lock on the database held by another process (e.g. a branch of the parallel pipeline)
+LOCK_TIMEOUT = 60
+
+# The modules whose source code is part of the extractor version stamp, i.e. `extractor.py` and the modules it
+# delegates the extraction to
+EXTRACTOR_MODULES = [extractor, normalization]
+
+
+def get_parser_version(parser: str) -> str:
+    """
+    Gets the version of the backend of a BeautifulSoup parser, since it determines the parsed trees.
+
+    Args:
+        parser (str): The BeautifulSoup parser, i.e. one of `HTMLExtractor.parsers`.
+
+    Returns:
+        str: The version of the parser backend, i.e. the Python version for "html.parser", the lxml and libxml2
+            versions for "lxml", and the html5lib version for "html5lib".
+    """
+    if parser == "html.parser":
+        return f"python {platform.python_version()}"
+
+    try:
+        version = f"{parser} {metadata.version(parser)}"
+    # The extraction fails with this parser anyway
+    except metadata.PackageNotFoundError:
+        return f"{parser} not installed"
+
+    if parser == "lxml":
+        from lxml import etree
+
+        version += f" libxml2 {etree.LIBXML_VERSION}"
+
+    return version
+
+
+def get_extractor_version(parser: str = "html.parser") -> str:
+    """
+    Computes the version stamp of the extractor.
+
+    The version stamp changes whenever the source code of the `EXTRACTOR_MODULES` (e.g. `extractor.py` and
+    `normalization.py`), the BeautifulSoup version, the parser or the version of its backend (see
+    `get_parser_version`) changes, so that cached extractions are never reused across different extractor versions.
+
+    Args:
+        parser (str): The BeautifulSoup parser used by `HTMLExtractor`. Defaults to "html.parser".
+
+    Returns:
+        str: The version stamp of the extractor.
+    """
+    source = "\n".join(inspect.getsource(module) for module in EXTRACTOR_MODULES)
+    stamp = f"{source}\n{bs4.__version__}\n{parser}\n{get_parser_version(parser)}"
+
+    return hashlib.sha256(stamp.encode("utf-8")).hexdigest()[:16]
+
+
+def hash_html(content_category: str, html_content: Optional[str]) -> str:
+    """
+    Computes the hash of the HTML content of an article.
+
+    The content category is part of the hash as it affects the extraction (e.g. "programs").
+
+    Args:
+        content_category (str): The category of the article
+        html_content (Optional[str]): The HTML content of the article
+
+    Returns:
+        str: The SHA-256 hash of the content category and HTML content.
+    """
+    return hashlib.sha256(f"{content_category}\n{html_content}".encode()).hexdigest()
+
+
+class ExtractionCache:
+    """
+    A persistent cache of extracted articles stored in a SQLite database.
+
+    Entries are keyed by the article id, the hash of the HTML content and the extractor version stamp.
+
+    Attributes:
+        filepath (str): The path to the SQLite database.
+        version (str): The extractor version stamp of the entries to look up and store.
+        hits (int): The number of cache hits since the cache was opened.
+        misses (int): The number of cache misses since the cache was opened.
+    """
+
+    def __init__(self, filepath: str, version: str) -> None:
+        """
+        Initializes the ExtractionCache and creates the SQLite database if it does not exist.
+
+        Args:
+            filepath (str): The path to the SQLite database.
+            version (str): The extractor version stamp. See `get_extractor_version`.
+        """
+        self.filepath = filepath
+        self.version = version
+        self.hits = 0
+        self.misses = 0
+
+        os.makedirs(os.path.dirname(filepath) or ".", exist_ok=True)
+        self._connection = sqlite3.connect(filepath, timeout=LOCK_TIMEOUT)
+        self._connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS extractions (
+                article_id INTEGER NOT NULL,
+                html_hash TEXT NOT NULL,
+                version TEXT NOT NULL,
+                data BLOB NOT NULL,
+                last_used REAL NOT NULL,
+                PRIMARY KEY (article_id, html_hash, version)
+            )
+            """
+        )
+        self._connection.commit()
+
+    def __enter__(self) -> "ExtractionCache":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def commit(self) -> None:
+        """Commits any pending changes, which releases the lock on the database for the other processes."""
+        self._connection.commit()
+
+    def close(self) -> None:
+        """Commits any pending changes and closes the connection to the database."""
+        self._connection.commit()
+        self._connection.close()
+
+    def get(self, article_id: int, html_hash: str) -> Optional[dict[str, Any]]:
+        """
+        Looks up the extracted data of an article.
+
+        Args:
+            article_id (int): The id of the article.
+            html_hash (str): The hash of the HTML content. See `hash_html`.
+
+        Returns:
+            Optional[dict[str, Any]]: The extracted data if found, None otherwise.
+        """
+        row = self._connection.execute(
+            "SELECT data FROM extractions WHERE article_id = ? AND html_hash = ? AND version = ?",
+            (int(article_id), html_hash, self.version),
+        ).fetchone()
+
+        if row is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self._connection.execute(
+            "UPDATE extractions SET last_used = ? WHERE article_id = ? AND html_hash = ? AND version = ?",
+            (time.time(), int(article_id), html_hash, self.version),
+        )
+
+        return pickle.loads(row[0])
+
+    def put(self, article_id: int, html_hash: str, data: dict[str, Any]) -> None:
+        """
+        Stores the extracted data of an article.
+
+        Args:
+            article_id (int): The id of the article.
+            html_hash (str): The hash of the HTML content. See `hash_html`.
+            data (dict[str, Any]): The extracted data of the article.
+        """
+        self._connection.execute(
+            "INSERT OR REPLACE INTO extractions VALUES (?, ?, ?, ?, ?)",
+            (
+                int(article_id),
+                html_hash,
+                self.version,
+                pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL),
+                time.time(),
+            ),
+        )
+
+    def log_stats(self, description: str) -> None:
+        """
+        Logs the number of cache hits and misses, and resets the counts.
+
+        Args:
+            description (str): The description to log the counts with (e.g. the content category).
+        """
+        logger.info(
+            f"Extraction Cache - {description}: {self.hits} hits, {self.misses} misses"
+        )
+        self._connection.commit()
+        self.hits = 0
+        self.misses = 0
+
+    def compact(self, max_age_days: Optional[float] = None) -> int:
+        """
+        Evicts stale entries and compacts the database.
+
+        The following entries are evicted:
+        1. Entries from other extractor versions.
+        2. Entries of older HTML content, i.e. all but the most recently used entry of each article.
+        3. Entries that were not used in the last `max_age_days` days, if provided.
+
+        Args:
+            max_age_days (Optional[float]): The maximum number of days since an entry was last used. Defaults to None.
+
+        Returns:
+            int: The number of evicted entries.
+        """
+        cursor = self._connection.cursor()
+        cursor.execute("DELETE FROM extractions WHERE version != ?", (self.version,))
+        evicted = cursor.rowcount
+        cursor.execute(
+            """
+            DELETE FROM extractions WHERE rowid NOT IN (
+                SELECT rowid FROM (
+                    SELECT rowid, ROW_NUMBER() OVER (
+                        PARTITION BY article_id ORDER BY last_used DESC
+                    ) AS recency FROM extractions
+                ) WHERE recency = 1
+            )
+            """
+        )
+        evicted += cursor.rowcount
+        if max_age_days is not None:
+            cursor.execute(
+                "DELETE FROM extractions WHERE last_used < ?",
+                (time.time() - max_age_days * 24 * 60 * 60,),
+            )
+            evicted += cursor.rowcount
+        self._connection.commit()
+
+        # Reclaim the space of the evicted entries
+        self._connection.execute("VACUUM")
+
+        return evicted
@@ -0,0 +1,234 @@
+"""
+Command line utilities for the 'data_processing' pipeline.
+
+Example usage:
+    python -m content_optimization.pipelines.data_processing.cli compact-cache --max-age-days 30
+    python -m content_optimization.pipelines.data_processing.cli export-text --content-category programs
+    python -m content_optimization.pipelines.data_processing.cli replay-slow --top 5 --cprofile 20
+"""
+
+import argparse
+import cProfile
+import os
+import pstats
+from argparse import Namespace
+
+import pandas as pd
+from content_optimization.datasets.packed_text import PackedTextStore
+from content_optimization.pipelines.data_processing.cache import (
+    ExtractionCache,
+    get_extractor_version,
+)
+from content_optimization.pipelines.data_processing.profiler import (
+    load_profile_report,
+    profile_article,
+)
+
+
+def compact_cache(args: Namespace) -> None:
+    """
+    Evicts stale entries from the extraction cache and compacts it.
+
+    Args:
+        args (Namespace): The parsed arguments of the `compact-cache` command.
+    """
+    with ExtractionCache(args.filepath, get_extractor_version(args.parser)) as cache:
+        evicted = cache.compact(args.max_age_days)
+
+    print(f"Evicted {evicted} entries from {args.filepath}")
+
+
+def export_text(args: Namespace) -> None:
+    """
+    Exports the packed extracted texts as loose text files.
+
+    Args:
+        args (Namespace): The parsed arguments of the `export-text` command.
+    """
+    exported = PackedTextStore(args.filepath).export(
+        args.output_dir, args.content_category
+    )
+
+    print(f"Exported {exported} text files to {args.output_dir}")
+
+
+def replay_slow(args: Namespace) -> None:
+    """
+    Replays the slowest articles of the extraction profile report through the `HTMLExtractor`.
+
+    Args:
+        args (Namespace): The parsed arguments of the `replay-slow` command.
+    """
+    report = load_profile_report(args.report).head(args.top)
+    profiler = cProfile.Profile() if args.cprofile else None
+
+    for content_category, articles in report.groupby("content_category", sort=False):
+        df = pd.read_parquet(
+            os.path.join(args.added_dir, f"{content_category}.parquet"),
+            columns=["id", "content_name", "full_url", "content_body"],
+        ).set_index("id")
+
+        for article in articles.itertuples():
+            row = df.loc[article.id]
+            profiles = []
+            for _ in range(args.repeat):
+                if profiler is not None:
+                    profiler.enable()
+                _, article_profile = profile_article(
+                    row["content_name"],
+                    content_category,
+                    row["full_url"],
+                    row["content_body"],
+                    args.parser,
+                )
+                if profiler is not None:
+                    profiler.disable()
+                profiles.append(article_profile)
+
+            # The best of the repeats is the least affected by noise
+            best = min(profiles, key=lambda profile: profile["total_seconds"])
+            steps = {
+                step: seconds
+                for step, seconds in best.items()
+                if step.endswith("_seconds") and step != "total_seconds"
+            }
+            slowest_step = max(steps, key=steps.get)
+            print(
+                f"#{article.rank} {content_category} {article.id}: {best['total_seconds'] * 1000:.1f} ms "
+                f"(was {article.total_seconds * 1000:.1f} ms), slowest step {slowest_step.removesuffix('_seconds')} "
+                f"{steps[slowest_step] * 1000:.1f} ms, {best['html_bytes']} bytes, {best['node_count']} nodes, "
+                f"depth {best['max_depth']}, {best['table_count']} tables"
+            )
+
+    if profiler is not None:
+        pstats.Stats(profiler).sort_stats("cumulative").print_stats(args.cprofile)
+
+
+def parse_arguments() -> Namespace:
+    """
+    A function that parses the arguments of the data processing commands.
+
+    Returns:
+        Namespace: The parsed arguments as a Namespace object.
+    """
+    parser = argparse.ArgumentParser(
+        description="utilities for the data_processing pipeline"
+    )
+    subparsers = parser.add_subparsers(required=True)
+
+    compact_cache_parser = subparsers.add_parser(
+        "compact-cache",
+        help="evict stale entries from the extraction cache and compact it",
+    )
+    compact_cache_parser.add_argument(
+        "--filepath",
+        type=str,
+        default="data/02_intermediate/extraction_cache/extraction_cache.db",
+        help="path to the extraction cache",
+    )
+    compact_cache_parser.add_argument(
+        "--parser",
+        type=str,
+        default="html.parser",
+        help="parser used for extraction, entries of other parsers are evicted",
+    )
+    compact_cache_parser.add_argument(
+        "--max-age-days",
+        type=float,
+        default=None,
+        help="evict entries that were not used in the last given number of days",
+    )
+    compact_cache_parser.set_defaults(func=compact_cache)
+
+    export_text_parser = subparsers.add_parser(
+        "export-text",
+        help="export the packed extracted texts as loose text files",
+    )
+    export_text_parser.add_argument(
+        "--filepath",
+        type=str,
+        default="data/02_intermediate/all_extracted_text.db",
+        help="path to the packed extracted texts",
+    )
+    export_text_parser.add_argument(
+        "--output-dir",
+        type=str,
+        default="data/02_intermediate/all_extracted_text",
+        help="directory to export the text files to",
+    )
+    export_text_parser.add_argument(
+        "--content-category",
+        type=str,
+        default=None,
+        help="only export the text files of the given content category",
+    )
+    export_text_parser.set_defaults(func=export_text)
+
+    replay_slow_parser = subparsers.add_parser(
+        "replay-slow",
+        help="replay the slowest articles of the extraction profile report",
+    )
+    replay_slow_parser.add_argument(
+        "--report",
+        type=str,
+        default="data/08_reporting/extraction_profile.csv",
+        help="path to the extraction profile report, the latest version is used if versioned; the reports of each "
+        "content category of the parallel pipeline in data/08_reporting/extraction_profile/ are merged if the "
+        "report is not found",
+    )
+    replay_slow_parser.add_argument(
+        "--added-dir",
+        type=str,
+        default="data/02_intermediate/all_contents_added",
+        help="directory of the partitions with the HTML content of the articles",
+    )
+    replay_slow_parser.add_argument(
+        "--top",
+        type=int,
+        default=10,
+        help="number of the slowest articles to replay",
+    )
+    replay_slow_parser.add_argument(
+        "--repeat",
+        type=int,
+        default=3,
+        help="number of times to replay each article, the fastest time is reported",
+    )
+    replay_slow_parser.add_argument(
+        "--parser",
+        type=str,
+        default="html.parser",
+        help="parser to replay the articles with",
+    )
+    replay_slow_parser.add_argument(
+        "--cprofile",
+        type=int,
+        default=0,
+        help="print the given number of functions with the highest cumulative time with cProfile",
+    )
+    replay_slow_parser.set_defaults(func=replay_slow)
+
+    return parser.parse_args()
+
+
+def main():
+    """
+    The main function that serves as the entry point. It parses command line arguments and runs the given command.
+    The following commands are available:
+
+    - compact-cache:
+        Evicts stale entries from the extraction cache and compacts it. Entries from other extractor versions, of
+        older HTML content and optionally, entries not used in the last `--max-age-days` days are evicted.
+    - export-text:
+        Exports the packed extracted texts as loose text files in `<output_dir>/<content_category>/<title>_<id>.txt`,
+        optionally only for the content category given by `--content-category`.
+    - replay-slow:
+        Replays the `--top` slowest articles of the extraction profile report through the `HTMLExtractor` and prints
+        the time taken by the slowest step of each article, optionally with the cProfile statistics of the replays.
+    """
+    args = parse_arguments()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+from typing import Any, Callable
+
+import pandas as pd
+
+# The columns of the corrections table
+CORRECTION_COLUMNS = [
+    "source",  # the parameter or dataset of the correction (e.g. "updated_urls")
+    "content_category",  # the content category of the article, or None for all content categories
+    "key_column",  # the column of the articles that the correction is keyed by (e.g. "id")
+    "key",
+    "column",  # the corrected column
+    "value",
+]
+
+
+def load_missing_contents(
+    missing_contents: dict[str, Callable[[], Any]],
+) -> dict[str, str]:
+    """
+    Loads the HTML content of the articles that were rejected by Excel due to a "Value exceeded maximum cell size"
+    error.
+
+    Args:
+        missing_contents (dict[str, Callable[[], Any]]): A dictionary where keys are file paths and values are functions
+            that load the content of text files.
+
+    Returns:
+        dict[str, str]: A dictionary that maps each article friendly url (i.e. the filename) to its content body.
+    """
+    excel_errors = {}
+    for file_path, load_func in missing_contents.items():
+        # Extract friendly url that is used as filename
+        friendly_url = file_path.split("/")[-1]
+        excel_errors[friendly_url] = load_func()
+
+    return excel_errors
+
+
+def get_corrections(
+    excel_errors: dict[str, str],
+    updated_urls: dict[str, dict[int, str]],
+    blacklist: dict[int, str] | None = None,
+) -> pd.DataFrame:
+    """
+    Collects the manual corrections of the articles into a single table, with a row per corrected column.
+
+    1. The missing content body of the articles with Excel errors, keyed by friendly url across all content categories.
+    2. The updated `full_url` and `full_url2` of the articles with known 404 errors, keyed by id in each content
+       category.
+    3. The reason to remove the blacklisted articles, keyed by id across all content categories. The blacklist is
+       applied after extraction by the `blacklist_rule`, and is only collected to report the unmatched corrections.
+
+    Args:
+        excel_errors (dict[str, str]): A dictionary that maps each article friendly url to the updated content body.
+            See `load_missing_contents`.
+        updated_urls (dict[str, dict[int, str]]): A dictionary where keys are content categories and values are
+            dictionaries mapping the article IDs to updated URLs.
+        blacklist (dict[int, str] | None): A dictionary containing the article IDs and the reason to remove it.
+            Defaults to None.
+
+    Returns:
+        pd.DataFrame: The corrections with the `CORRECTION_COLUMNS`. Later corrections of the same column of an article
+            take precedence.
+    """
+    rows = [
+        ("missing_contents", None, "friendly_url", friendly_url, "content_body", text)
+        for friendly_url, text in excel_errors.items()
+    ]
+    rows.extend(
+        ("updated_urls", content_category, "id", article_id, column, url)
+        for content_category, urls_dict in updated_urls.items()
+        for article_id, url in (urls_dict or {}).items()
+        for column in ["full_url", "full_url2"]
+    )
+    rows.extend(
+        ("blacklist", None, "id", article_id, "remove_type", reason)
+        for article_id, reason in (blacklist or {}).items()
+    )
+
+    return pd.DataFrame(rows, columns=CORRECTION_COLUMNS)
+
+
+def select_corrections(
+    corrections: pd.DataFrame, content_category: str
+) -> pd.DataFrame:
+    """
+    Selects the corrections that apply to the articles of a content category.
+
+    Args:
+        corrections (pd.DataFrame): The corrections. See `get_corrections`.
+        content_category (str): The content category of the articles.
+
+    Returns:
+        pd.DataFrame: The corrections of the content category and of all content categories.
+    """
+    return corrections[
+        corrections["content_category"].isna()
+        | (corrections["content_category"] == content_category)
+    ]
+
+
+def apply_corrections(
+    df: pd.DataFrame, corrections: pd.DataFrame, content_category: str
+) -> pd.DataFrame:
+    """
+    Applies the corrections of a content category to its articles, with a single join per key column.
+
+    The corrections are pivoted into a table indexed by key, with a column per corrected column, and joined with the
+    articles. The corrected values then replace the values of the matching articles.
+
+    Args:
+        df (pd.DataFrame): The DataFrame containing the articles.
+        corrections (pd.DataFrame): The corrections. See `get_corrections`.
+        content_category (str): The content category of the articles.
+
+    Returns:
+        pd.DataFrame: The DataFrame with the corrected values.
+    """
+    corrections = select_corrections(corrections, content_category)
+    # The blacklist is applied after extraction by the `blacklist_rule`
+    corrections = corrections[corrections["source"] != "blacklist"]
+
+    for key_column, group in corrections.groupby("key_column", sort=False):
+        values = group.drop_duplicates(["key", "column"], keep="last").pivot(
+            index="key", columns="column", values="value"
+        )
+        # Infer the dtype of the keys (e.g. `int64` for ids), so that they match the key column
+        values.index = pd.Index(values.index.tolist())
+        joined = df[[key_column]].join(values, on=key_column)
+
+        for column in values.columns:
+            matched = joined[column].notna()
+            df.loc[matched, column] = joined.loc[matched, column]
+
+    return df
+
+
+def get_unmatched_corrections(
+    corrections: pd.DataFrame, articles: pd.DataFrame
+) -> pd.DataFrame:
+    """
+    Gets the corrections that no longer match any article, e.g. because the article was removed from the CMS.
+
+    Args:
+        corrections (pd.DataFrame): The corrections. See `get_corrections`.
+        articles (pd.DataFrame): The `content_category` and the key columns (i.e. `id` and `friendly_url`) of all
+            articles.
+
+    Returns:
+        pd.DataFrame: The source, content category and key of each unmatched correction.
+    """
+    matched = pd.Series(False, index=corrections.index)
+
+    for key_column, group in corrections.groupby("key_column", sort=False):
+        # Corrections of all content categories match an article of any content category
+        any_category = group["content_category"].isna()
+        matched[group.index[any_category]] = group.loc[any_category, "key"].isin(
+            articles[key_column]
+        )
+        article_keys = pd.MultiIndex.from_frame(
+            articles[["content_category", key_column]]
+        )
+        matched[group.index[~any_category]] = pd.MultiIndex.from_frame(
+            group.loc[~any_category, ["content_category", "key"]]
+        ).isin(article_keys)
+
+    return (
+        corrections.loc[~matched, ["source", "content_category", "key_column", "key"]]
+        .drop_duplicates()
+        .reset_index(drop=True)
+    )
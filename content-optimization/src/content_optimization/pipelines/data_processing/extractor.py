@@ -1,29 +1,92 @@
 import logging
 import re
 import string
-import unicodedata
-from typing import Optional
+from typing import Any, Optional
 
 from bs4 import BeautifulSoup, NavigableString, PageElement, element
+from content_optimization.pipelines.data_processing.normalization import (
+    clean_text,
+    clean_texts,
+)
 
 # Set up logger in extractor.py
 # Edit conf/logging.yml to see changes
 logger = logging.getLogger(__name__)
 
+# Sentences about the HealthHub app and app stores, which are skipped
+APP_STORE_PATTERN = re.compile(r"(HealthHub app|Google Play|Apple Store|Parent Hub)")
+# Links to the footnotes of the references sections, which are skipped
+FOOTNOTE_PATTERN = re.compile(r"#footnote\w+")
+
+
+def find_header(text: str, header: str, start: int = 0) -> int:
+    """
+    Finds a header in the extracted text. The header is matched as a whole line, or else at the start of a line (as
+    the text after a header may be joined to it), so that a header that also appears within an earlier paragraph is
+    not matched there. Whole lines are preferred since the extracted lines are unique.
+
+    Args:
+        text (str): The extracted text.
+        header (str): The header to find.
+        start (int): The offset to start the search from. Defaults to 0.
+
+    Returns:
+        int: The offset of the header in the text, or -1 if it is not found.
+    """
+    line_start = -1
+    position = text.find(header, start)
+    while position != -1:
+        if position == 0 or text[position - 1] == "\n":
+            end = position + len(header)
+            if end == len(text) or text[end] == "\n":
+                return position
+            if line_start == -1:
+                line_start = position
+        position = text.find(header, position + 1)
+
+    return line_start
+
 
 class HTMLExtractor:
     """
     A class to extract and process various elements from HTML content using BeautifulSoup.
 
+    The read-only extractors (tables, images, links, headers and related sections) are collected in a single walk
+    of the parsed tree (see `traverse`). The public methods are views over the result of that walk. The section tree
+    (see `extract_sections`) is built from the headers and the content body once they are extracted.
+
     Attributes:
         content_name (str): The name of the article
         content_category (str): The category of the article
         url (str): The URL of the article
-        soup (BeautifulSoup): A BeautifulSoup object.
+        soup (BeautifulSoup | element.Tag): The root of the parsed HTML content.
     """
 
+    header_tags = ["h1", "h2", "h3", "h4", "h5", "h6"]
+    # BeautifulSoup tree builders that can be used to parse the HTML content
+    parsers = ["html.parser", "lxml", "html5lib"]
+    # The extracted column names and their extractor methods, in the order they are called by `extract_all`
+    # `extract_text` modifies the parsed tree, so it must be called after the read-only extractors
+    extractors = {
+        "has_table": "check_for_table",
+        "has_image": "check_for_image",
+        "related_sections": "extract_related_sections",
+        "extracted_tables": "extract_tables",
+        "extracted_raw_html_tables": "extract_raw_html_tables",
+        "extracted_links": "extract_links",
+        "extracted_headers": "extract_headers",
+        "extracted_images": "extract_img_links_and_alt_text",
+        "extracted_content_body": "extract_text",
+        "extracted_sections": "extract_sections",
+    }
+
     def __init__(
-        self, content_name: str, content_category: str, full_url: str, html_content: str
+        self,
+        content_name: str,
+        content_category: str,
+        full_url: str,
+        html_content: str,
+        parser: str = "html.parser",
     ) -> None:
         """
         Initializes the HTMLExtractor with the given HTML content.
@@ -33,6 +96,7 @@ def __init__(
             content_category (str): The category of the article
             full_url (str): The URL of the article
             html_content (str): The HTML content to be processed.
+            parser (str): The BeautifulSoup parser to use. Defaults to "html.parser".
         """
         logger.debug(
             f"Text Extraction - Extracting `{content_name}` within `{content_category}`. Link to article - `{full_url}`"
@@ -41,7 +105,9 @@ def __init__(
         self.content_name = content_name
         self.content_category = content_category
         self.url = full_url
-        self.soup = self.preprocess_html(html_content)
+        self.soup = self.preprocess_html(html_content, parser)
+        self._traversal = None
+        self._content_body = None
 
         # Check how many direct children the HTML content has for debugging purposes
         num_children = len(list(self.soup.children))
@@ -60,40 +126,45 @@ def clean_text(cls, text: str) -> str:
             str: The cleaned text.
 
         Note:
-            This method is being used in all extractor methods.
+            This method is being used in all extractor methods. See `normalization.py` for the implementation.
         """
-        # Replace dash in unicode
-        text = text.replace("\u2013", "-")  # Replace dashes
-
-        # Normalize Unicode characters
-        text = unicodedata.normalize("NFKD", text)
-        # Use ASCII encoding to handle special symbols e.g. copyright \xa9
-        text = text.encode("ascii", "ignore").decode("utf-8")
-
-        # Replace common problematic characters
-        text = text.replace("\xa0", " ")  # non-breaking space
-        text = text.replace("\u200b", "")  # zero-width space
-        text = text.replace("\u2028", "\n")  # line separator
-        text = text.replace("\u2029", "\n")  # paragraph separator
-        text = text.replace("_x000D_", "")  # Carriage return
-
-        # Replace multiple whitespace with single space
-        text = re.sub(r"\s+", " ", text)
-
-        return text.strip()
+        return clean_text(text)
 
     @classmethod
-    def preprocess_html(cls, html_content: str) -> BeautifulSoup:
+    def preprocess_html(
+        cls, html_content: str, parser: str = "html.parser"
+    ) -> BeautifulSoup | element.Tag:
         """
         Preprocesses the given HTML content by replacing all <br> tags with newline characters.
 
+        Parsers such as "lxml" and "html5lib" wrap the content in <html>, <head> and <body> tags. For these parsers,
+        the <body> tag is returned as the root instead, so that the parsed tree has the same top-level elements as
+        with "html.parser".
+
         Args:
             html_content (str): The HTML content to be preprocessed.
+            parser (str): The BeautifulSoup parser to use. Must be one of `HTMLExtractor.parsers`.
+                Defaults to "html.parser".
 
         Returns:
-            BeautifulSoup: The preprocessed HTML content as a BeautifulSoup object.
+            BeautifulSoup | element.Tag: The root of the preprocessed HTML content.
+
+        Raises:
+            ValueError: If the parser is not supported.
         """
-        soup = BeautifulSoup(html_content, "html.parser")
+        if parser not in cls.parsers:
+            raise ValueError(
+                f"Invalid parser `{parser}`. Parser must be one of {cls.parsers}."
+            )
+
+        soup = BeautifulSoup(html_content, parser)
+
+        if parser != "html.parser" and soup.body is not None:
+            # Move elements placed in <head> by the parser (e.g. <style>) back to the start of <body>
+            if soup.head is not None:
+                for child in reversed(list(soup.head.contents)):
+                    soup.body.insert(0, child.extract())
+            soup = soup.body
 
         # Find all <br> tags and replace them with newline
         # NOTE: These logs are commented out as it is only used during development
@@ -175,15 +246,22 @@ def extract_text(self) -> str:
         """
         Extracts the main content from the HTML content.
 
+        The result is computed on the first call and cached, since the parsed tree is modified (e.g. tables are
+        removed) and cannot be extracted again.
+
         Returns:
             str: The main content body extracted from the HTML content.
         """
+        if self._content_body is not None:
+            return self._content_body
+
         # Unwrap if the HTML content is contained in a div
         if self.soup.div is not None:
             self.soup.div.unwrap()
 
         # Remove all tables from the HTML text
-        for table in self.soup.find_all("table"):
+        # NOTE: The tree is walked before it is modified so that the other extractors are not affected
+        for table in self.traverse()["table_tags"]:
             table.extract()
 
         # Extract the main content
@@ -252,6 +330,7 @@ def extract_text(self) -> str:
 
         # Replace double newlines with single newlines and strip whitespace
         extracted_content_body = "\n".join(final_content).replace("\n\n", "\n").strip()
+        self._content_body = extracted_content_body
 
         return extracted_content_body
 
@@ -424,7 +503,7 @@ def _extract_text_from_strong(self, tag: PageElement, content: list[str]) -> Non
         # Find related section within strong
         cleaned_text = self.clean_text(tag.text)
         if "Related:" in cleaned_text:
-            cleaned_text = re.sub(r"\n", " ", cleaned_text)
+            cleaned_text = cleaned_text.replace("\n", " ")
             if len(content) > 0 and cleaned_text != content[-1]:
                 content.append(cleaned_text)
         elif "Read these next:" in cleaned_text:
@@ -484,7 +563,7 @@ def _extract_text_from_p(self, tag: PageElement, content: list[str]) -> None:
             This method is used in `extract_text` method.
         """
         # Skip sentences about HealthHub app, Google Play, and Apple Store
-        if re.search(r"(HealthHub app|Google Play|Apple Store|Parent Hub)", tag.text):
+        if APP_STORE_PATTERN.search(tag.text):
             return
         else:
             for child in tag.children:
@@ -764,6 +843,162 @@ def _extract_text_from_container(
             else:
                 self._extract_text_elements(child, content)
 
+    def traverse(self) -> dict[str, Any]:
+        """
+        Walks the parsed HTML tree once and collects the outputs of all read-only extractors.
+
+        The result is computed on the first call and cached, so subsequent calls (and the extractor methods that
+        are views over it) do not walk the tree again.
+
+        Returns:
+            dict[str, Any]: A dictionary containing the table tags and the outputs of `extract_related_sections`,
+                `extract_tables`, `extract_raw_html_tables`, `extract_links`, `extract_headers` and
+                `extract_img_links_and_alt_text`.
+        """
+        if self._traversal is not None:
+            return self._traversal
+
+        self._traversal = {
+            "table_tags": [],
+            "related_sections": [],
+            "tables": [],
+            "raw_html_tables": [],
+            "links": [],
+            "headers": [],
+            "images": [],
+            "read_these_next_ul": None,
+            # The number of headers before each table
+            "table_sections": [],
+        }
+
+        # Dispatch each tag to its visitor
+        visitors = {
+            "p": self._visit_p,
+            "ul": self._visit_ul,
+            "table": self._visit_table,
+            "a": self._visit_a,
+            "img": self._visit_img,
+            **{header_tag: self._visit_header for header_tag in self.header_tags},
+        }
+
+        for tag in self.soup.descendants:
+            visitor = visitors.get(tag.name)
+            if visitor is not None:
+                visitor(tag, self._traversal)
+
+        return self._traversal
+
+    def extract_all(self) -> dict[str, Any]:
+        """
+        Extracts all data from the HTML content.
+
+        Returns:
+            dict[str, Any]: A dictionary mapping the extracted column names to the extracted values.
+        """
+        return {
+            column: getattr(self, method)()
+            for column, method in self.extractors.items()
+        }
+
+    def _visit_p(self, tag: element.Tag, result: dict[str, Any]) -> None:
+        """
+        Visitor for p tags. Collects "Related:" sections and marks the list of "Read these next:" items.
+
+        Args:
+            tag (element.Tag): The p tag.
+            result (dict[str, Any]): The result of the traversal.
+        """
+        if tag.find("strong"):
+            cleaned_text = self.clean_text(tag.text)
+            if "Related:" in cleaned_text:
+                result["related_sections"].append(cleaned_text.replace("Related: ", ""))
+            elif "Read these next:" in cleaned_text:
+                result["read_these_next_ul"] = tag.find_next_sibling("ul")
+
+    def _visit_ul(self, tag: element.Tag, result: dict[str, Any]) -> None:
+        """
+        Visitor for ul tags. Collects the "Read these next:" items.
+
+        Args:
+            tag (element.Tag): The ul tag.
+            result (dict[str, Any]): The result of the traversal.
+        """
+        if tag == result["read_these_next_ul"]:
+            for li in tag.find_all("li"):
+                result["related_sections"].append(self.clean_text(li.text))
+
+    def _visit_table(self, tag: element.Tag, result: dict[str, Any]) -> None:
+        """
+        Visitor for table tags. Collects the processed and raw HTML tables, and the number of headers before them.
+
+        Args:
+            tag (element.Tag): The table tag.
+            result (dict[str, Any]): The result of the traversal.
+        """
+        result["table_sections"].append(len(result["headers"]))
+        result["table_tags"].append(tag)
+        result["tables"].append(self._process_table(tag))
+        result["raw_html_tables"].append(str(tag))
+
+    def _visit_a(self, tag: element.Tag, result: dict[str, Any]) -> None:
+        """
+        Visitor for anchor tags. Collects the title and URL of the link.
+
+        Args:
+            tag (element.Tag): The anchor tag.
+            result (dict[str, Any]): The result of the traversal.
+
+        Note:
+            Footnotes to references sections and online forms are ignored.
+        """
+        url = tag.get("href")
+        # Skip incorrectly formatted urls or footnotes
+        if url is None or FOOTNOTE_PATTERN.search(url):
+            return
+        # Extract text
+        text = tag.get("title") or tag.get_text()
+        cleaned_text = self.clean_text(text)
+        # Skip links to forms
+        if "online form" in cleaned_text:
+            return
+
+        # NOTE: These logs are commented out as it is only used during development
+        # logger.debug(f"Link Extraction - text: {cleaned_text}, url: {url}")
+
+        # Store text, url into extracted_links
+        record = cleaned_text, url
+        result["links"].append(record)
+
+    def _visit_header(self, tag: element.Tag, result: dict[str, Any]) -> None:
+        """
+        Visitor for header tags. Collects the text and tag name of the header.
+
+        Args:
+            tag (element.Tag): The header tag.
+            result (dict[str, Any]): The result of the traversal.
+        """
+        text = self.clean_text(tag.get_text())
+        record = text, tag.name
+        result["headers"].append(record)
+
+    def _visit_img(self, tag: element.Tag, result: dict[str, Any]) -> None:
+        """
+        Visitor for img tags. Collects the url and alternate text of the image.
+
+        Args:
+            tag (element.Tag): The img tag.
+            result (dict[str, Any]): The result of the traversal.
+        """
+        # NOTE: Attributes are treated as dictionaries
+        # Get image link from src attribute
+        image_url = tag.get("src", None)
+        # Get value of alt attribute
+        alt_text = tag.get("alt", "")
+        # Add text if not empty
+        cleaned_text = self.clean_text(alt_text)
+        record = cleaned_text, image_url
+        result["images"].append(record)
+
     def check_for_table(self) -> bool:
         """
         Check for the presence of table tags in an HTML document.
@@ -771,11 +1006,8 @@ def check_for_table(self) -> bool:
         Returns:
             bool: True if at least one table tag is found, False otherwise.
         """
-        # Find all table tags
-        tables = self.soup.find_all("table")
-
         # Return True if at least one table is found, False otherwise
-        return len(tables) > 0
+        return len(self.traverse()["table_tags"]) > 0
 
     def check_for_image(self) -> bool:
         """
@@ -784,11 +1016,8 @@ def check_for_image(self) -> bool:
         Returns:
             bool: True if at least one img tag is found, False otherwise.
         """
-        # Find all img tags
-        images = self.soup.find_all("img")
-
         # Return True if at least one image is found, False otherwise
-        return len(images) > 0
+        return len(self.traverse()["images"]) > 0
 
     def extract_related_sections(self) -> list[str]:
         """
@@ -797,21 +1026,7 @@ def extract_related_sections(self) -> list[str]:
         Returns:
             list[str]: A list of related sections and "Read these next:" items.
         """
-        related_sections = []
-        read_these_next_ul = None
-        # Extract "Related:" sections and "Read these next:" items
-        for tag in self.soup.find_all(["p", "ul"]):
-            if tag.name == "p" and tag.find("strong"):
-                cleaned_text = self.clean_text(tag.text)
-                if "Related:" in cleaned_text:
-                    related_sections.append(re.sub(r"Related: ", "", cleaned_text))
-                elif "Read these next:" in cleaned_text:
-                    read_these_next_ul = tag.find_next_sibling("ul")
-            elif tag == read_these_next_ul:
-                for li in tag.find_all("li"):
-                    related_sections.append(self.clean_text(li.text))
-
-        return related_sections
+        return self.traverse()["related_sections"]
 
     def extract_tables(self) -> Optional[list[list[list[str]]]]:
         """
@@ -821,10 +1036,7 @@ def extract_tables(self) -> Optional[list[list[list[str]]]]:
             list[list[list[str]]]: A list of processed tables, where each table is represented
                 as a list of rows, and each row is a list of cell values.
         """
-        tables = []
-        for table in self.soup.find_all("table"):
-            processed_table = self._process_table(table)
-            tables.append(processed_table)
+        tables = self.traverse()["tables"]
 
         return tables if tables else None
 
@@ -835,9 +1047,7 @@ def extract_raw_html_tables(self) -> Optional[list[str]]:
         Returns:
             list[str]: A list of tables in HTML format.
         """
-        tables = []
-        for table in self.soup.find_all("table"):
-            tables.append(str(table))
+        tables = self.traverse()["raw_html_tables"]
 
         return tables if tables else None
 
@@ -856,24 +1066,22 @@ def _process_table(self, table_html: PageElement) -> list[list[str]]:
         """
         # Note: Does not account for rowspan and colspan in processing the table
         table = []
+        rows = table_html.find_all("tr")
 
         # Skip empty tables - Empty table in All You Need to Know About Childhood Immunisations
-        if table_html.find_all("tr") == []:
+        if rows == []:
             return None
         # Process table headers
-        headers = [
-            self.clean_text(header.get_text())
-            for header in table_html.find_all("tr")[0]
-        ]
+        headers = clean_texts(header.get_text() for header in rows[0])
         # Remove empty headers
         headers = list(filter(lambda k: " " in k, headers))
         # Append headers
         table.append(headers)
 
         # Process table rows
-        for row in table_html.find_all("tr")[1:]:
+        for row in rows[1:]:
             cols = row.find_all("td")
-            cols = [self.clean_text(ele.get_text()) for ele in cols]
+            cols = clean_texts(ele.get_text() for ele in cols)
             table.append(cols)
 
         return table
@@ -889,29 +1097,7 @@ def extract_links(self) -> list[tuple[str, str]]:
         Note:
             Footnotes to references sections and online forms are ignored.
         """
-        extracted_links = []
-
-        # Extract title/text and links from anchor tags
-        for link in self.soup.find_all("a"):
-            url = link.get("href")
-            # Skip incorrectly formatted urls or footnotes
-            if url is None or re.search(r"#footnote\w+", url):
-                continue
-            # Extract text
-            text = link.get("title") or link.get_text()
-            cleaned_text = self.clean_text(text)
-            # Skip links to forms
-            if re.search(r"online form", cleaned_text):
-                continue
-
-            # NOTE: These logs are commented out as it is only used during development
-            # logger.debug(f"Link Extraction - text: {cleaned_text}, url: {url}")
-
-            # Store text, url into extracted_links
-            record = cleaned_text, url
-            extracted_links.append(record)
-
-        return extracted_links
+        return self.traverse()["links"]
 
     def extract_headers(self) -> list[tuple[str, str]]:
         """
@@ -922,15 +1108,80 @@ def extract_headers(self) -> list[tuple[str, str]]:
                 A list of tuples containing the text and tag name of
                 each header found in the HTML content.
         """
-        extracted_headers = []
+        return self.traverse()["headers"]
+
+    def extract_sections(self) -> list[dict[str, Any]]:
+        """
+        Extracts the section tree of the article from its headers and content body.
+
+        The sections are in document order. The first section is the root of the tree and holds the text before the
+        first header. Each non-empty header starts a section, whose parent is the closest preceding section of a
+        lower level. The paragraphs of a section are the lines of `extracted_content_body[start:end]`, without the
+        header, so that the downstream stages can slice a section instead of splitting the content body by the
+        headers. The headers are only matched at the start of a line of the content body (see `find_header`), so that
+        a header that also appears in an earlier paragraph is not matched there. A header that is not found in the content
+        body (e.g. a header within a table) has an empty span.
+
+        Returns:
+            list[dict[str, Any]]: The sections, each with its `level` (0 for the root and 1 to 6 for h1 to h6),
+                `header`, the `start` and `end` offsets of its paragraphs in `extracted_content_body`, the index of
+                its `parent` section (-1 for the root) and the indexes of its `tables` in `extracted_tables`.
+        """
+        content_body = self.extract_text()
+        traversal = self.traverse()
+
+        sections = [
+            {
+                "level": 0,
+                "header": "",
+                "start": 0,
+                "end": len(content_body),
+                "parent": -1,
+                "tables": [],
+            }
+        ]
+        # The section of each header, which is the previous section for empty headers
+        header_sections = []
+        # The paragraphs of the last section found in the content body end where the next header is found
+        last_found = 0
+        cursor = 0
+        for header, tag_name in traversal["headers"]:
+            if not header.strip():
+                header_sections.append(len(sections) - 1)
+                continue
 
-        for title in self.soup.find_all(["h1", "h2", "h3", "h4", "h5", "h6"]):
-            tag = title.name
-            text = self.clean_text(title.get_text())
-            record = text, tag
-            extracted_headers.append(record)
+            level = int(tag_name[1])
+            parent = len(sections) - 1
+            while sections[parent]["level"] >= level:
+                parent = sections[parent]["parent"]
 
-        return extracted_headers
+            position = find_header(content_body, header, cursor)
+            if position == -1:
+                start = end = cursor
+            else:
+                sections[last_found]["end"] = position
+                # Skip the line break after the header
+                start = cursor = min(position + len(header) + 1, len(content_body))
+                end = len(content_body)
+                last_found = len(sections)
+
+            header_sections.append(len(sections))
+            sections.append(
+                {
+                    "level": level,
+                    "header": header,
+                    "start": start,
+                    "end": end,
+                    "parent": parent,
+                    "tables": [],
+                }
+            )
+
+        for table_index, num_headers in enumerate(traversal["table_sections"]):
+            section = header_sections[num_headers - 1] if num_headers > 0 else 0
+            sections[section]["tables"].append(table_index)
+
+        return sections
 
     def extract_img_links_and_alt_text(self) -> list[tuple[str, str]]:
         """
@@ -941,17 +1192,4 @@ def extract_img_links_and_alt_text(self) -> list[tuple[str, str]]:
                 A list of tuples containing the image url and alternate text
         """
         # Note: In some articles, the img alternate text is the same as the header
-        extracted_links_and_alt_text = []
-        for img in self.soup.find_all("img"):
-            # NOTE: Attributes are treated as dictionaries
-            # Get image link from src attribute
-            image_url = img.get("src", None)
-            # Get value of alt attribute
-            alt_text = img.get("alt", "")
-            # Add text if not empty
-            cleaned_text = self.clean_text(alt_text)
-            record = cleaned_text, image_url
-            extracted_links_and_alt_text.append(record)
-
-        # Return unique elements
-        return extracted_links_and_alt_text
+        return self.traverse()["images"]
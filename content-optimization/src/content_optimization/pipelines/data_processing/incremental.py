@@ -0,0 +1,230 @@
+import hashlib
+import json
+import logging
+import os
+from glob import glob
+from pathlib import Path
+from typing import Any, Optional
+
+# Set up logger in incremental.py
+# Edit conf/logging.yml to see changes
+logger = logging.getLogger(__name__)
+
+
+def hash_file(path: str, block_size: int = 1 << 20) -> str:
+    """
+    Computes the SHA-256 hash of a file.
+
+    Args:
+        path (str): The path to the file.
+        block_size (int): The number of bytes to read at a time. Defaults to 1 MiB.
+
+    Returns:
+        str: The SHA-256 hash of the file.
+    """
+    sha256 = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(block_size), b""):
+            sha256.update(block)
+
+    return sha256.hexdigest()
+
+
+def get_pipeline_version() -> str:
+    """
+    Computes the version stamp of the `data_processing` pipeline from the source code of its modules.
+
+    Returns:
+        str: The version stamp of the pipeline.
+    """
+    sha256 = hashlib.sha256()
+    for path in sorted(Path(__file__).parent.glob("*.py")):
+        sha256.update(path.read_bytes())
+
+    return sha256.hexdigest()[:16]
+
+
+class IncrementalManifest:
+    """
+    A manifest of the fingerprints of the inputs of each stage of the `data_processing` pipeline.
+
+    Fingerprints are first staged by each node and only committed once the whole pipeline has run (see
+    `merge_data`), so that a failed run is recomputed in the next run. The content categories that were
+    recomputed by any node in the current run are tracked as pending, so that downstream nodes recompute
+    them too.
+
+    Attributes:
+        filepath (str): The path to the manifest stored as a JSON file.
+    """
+
+    def __init__(self, filepath: str) -> None:
+        """
+        Initializes the IncrementalManifest and loads the manifest if it exists.
+
+        Args:
+            filepath (str): The path to the manifest stored as a JSON file.
+        """
+        self.filepath = filepath
+        self._manifest = {
+            "committed": {"files": {}, "stages": {}},
+            "staged": {"files": {}, "stages": {}},
+            "pending": [],
+        }
+
+        if os.path.exists(filepath):
+            with open(filepath, encoding="utf-8") as f:
+                self._manifest = json.load(f)
+
+    def save(self) -> None:
+        """Saves the manifest as a JSON file."""
+        os.makedirs(os.path.dirname(self.filepath) or ".", exist_ok=True)
+        with open(self.filepath, "w", encoding="utf-8") as f:
+            json.dump(self._manifest, f, indent=2, sort_keys=True)
+
+    def fingerprint_file(self, path: str) -> dict[str, Any]:
+        """
+        Computes the fingerprint (size, mtime and content hash) of a file.
+
+        The content hash is only recomputed if the size or mtime of the file changed since the last commit.
+
+        Args:
+            path (str): The path to the file.
+
+        Returns:
+            dict[str, Any]: The fingerprint of the file.
+        """
+        stat = os.stat(path)
+        committed = self._manifest["committed"]["files"].get(path)
+
+        if (
+            committed is not None
+            and committed["size"] == stat.st_size
+            and committed["mtime"] == stat.st_mtime
+        ):
+            sha256 = committed["sha256"]
+        else:
+            sha256 = hash_file(path)
+
+        fingerprint = {"size": stat.st_size, "mtime": stat.st_mtime, "sha256": sha256}
+        self._manifest["staged"]["files"][path] = fingerprint
+
+        return fingerprint
+
+    def select_categories(self, stage: str, fingerprints: dict[str, Any]) -> set[str]:
+        """
+        Selects the content categories to recompute in a stage and marks them as pending.
+
+        A content category is recomputed if it is pending or if the fingerprint of its inputs changed since the
+        last commit.
+
+        Args:
+            stage (str): The name of the stage (e.g. "standardize").
+            fingerprints (dict[str, Any]): A dictionary mapping the content categories to the fingerprint of their
+                inputs. The fingerprints must be JSON serializable.
+
+        Returns:
+            set[str]: The content categories to recompute.
+        """
+        committed = self._manifest["committed"]["stages"].get(stage, {})
+        staged = self._manifest["staged"]["stages"].setdefault(stage, {})
+        pending = set(self._manifest["pending"])
+
+        selected = set()
+        for content_category, fingerprint in fingerprints.items():
+            digest = hashlib.sha256(
+                json.dumps(
+                    [get_pipeline_version(), fingerprint], sort_keys=True, default=str
+                ).encode()
+            ).hexdigest()
+            staged[content_category] = digest
+            if content_category in pending or committed.get(content_category) != digest:
+                selected.add(content_category)
+
+        self._manifest["pending"] = sorted(pending.union(selected))
+        self.save()
+
+        logger.info(
+            f"Incremental Run - {stage}: recomputing {len(selected)} of {len(fingerprints)} content categories "
+            f"{sorted(selected)}"
+        )
+
+        return selected
+
+    def commit(self) -> None:
+        """Commits the staged fingerprints and clears the pending content categories."""
+        committed, staged = self._manifest["committed"], self._manifest["staged"]
+        committed["files"].update(staged["files"])
+        for stage, digests in staged["stages"].items():
+            committed["stages"].setdefault(stage, {}).update(digests)
+
+        self._manifest["staged"] = {"files": {}, "stages": {}}
+        self._manifest["pending"] = []
+        self.save()
+
+
+def select_categories(
+    incremental: Optional[dict[str, Any]], stage: str, fingerprints: dict[str, Any]
+) -> Optional[set[str]]:
+    """
+    Selects the content categories to recompute in a stage if incremental runs are enabled.
+
+    Args:
+        incremental (Optional[dict[str, Any]]): The `incremental` parameters. See `parameters_data_processing.yml`.
+        stage (str): The name of the stage (e.g. "standardize").
+        fingerprints (dict[str, Any]): A dictionary mapping the content categories to the fingerprint of their inputs.
+
+    Returns:
+        Optional[set[str]]: The content categories to recompute, or None if incremental runs are disabled.
+    """
+    if not incremental or not incremental.get("enabled", False):
+        return None
+
+    manifest = IncrementalManifest(incremental["manifest_path"])
+
+    return manifest.select_categories(stage, fingerprints)
+
+
+def fingerprint_raw_partitions(
+    incremental: Optional[dict[str, Any]], partition_ids: list[str]
+) -> dict[str, list[str]]:
+    """
+    Computes the content hashes of the raw files of each partition if incremental runs are enabled.
+
+    Touching a raw file without changing its content does not change its content hash.
+
+    Args:
+        incremental (Optional[dict[str, Any]]): The `incremental` parameters. See `parameters_data_processing.yml`.
+        partition_ids (list[str]): The ids of the partitions in the raw `partitions.PartitionedDataset`.
+
+    Returns:
+        dict[str, list[str]]: A dictionary mapping the partition ids to the content hashes of their files.
+    """
+    if not incremental or not incremental.get("enabled", False):
+        return {}
+
+    manifest = IncrementalManifest(incremental["manifest_path"])
+    fingerprints = {
+        partition_id: [
+            manifest.fingerprint_file(path)["sha256"]
+            for path in sorted(
+                glob(os.path.join(incremental["raw_path"], f"{partition_id}.*"))
+            )
+        ]
+        for partition_id in partition_ids
+    }
+    manifest.save()
+
+    return fingerprints
+
+
+def commit_fingerprints(incremental: Optional[dict[str, Any]]) -> None:
+    """
+    Commits the staged fingerprints if incremental runs are enabled.
+
+    Args:
+        incremental (Optional[dict[str, Any]]): The `incremental` parameters. See `parameters_data_processing.yml`.
+    """
+    if not incremental or not incremental.get("enabled", False):
+        return
+
+    IncrementalManifest(incremental["manifest_path"]).commit()
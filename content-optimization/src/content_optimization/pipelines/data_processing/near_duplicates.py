@@ -0,0 +1,217 @@
+import logging
+from collections import defaultdict
+
+import numpy as np
+import pandas as pd
+
+# Set up logger in near_duplicates.py
+# Edit conf/logging.yml to see changes
+logger = logging.getLogger(__name__)
+
+# Odd multiplier of the polynomial hash of the word shingles
+SHINGLE_MULTIPLIER = np.uint64(0x9E3779B97F4A7C15)
+
+
+def get_shingles(texts: list[str], shingle_size: int) -> list[np.ndarray]:
+    """
+    Computes the sets of hashed word shingles of texts.
+
+    The words of all texts are factorized once, and the shingles are hashed as polynomials of the word codes, so
+    that no shingle string is built.
+
+    Args:
+        texts (list[str]): The texts to shingle.
+        shingle_size (int): The number of consecutive words in a shingle.
+
+    Returns:
+        list[np.ndarray]: The unique 32-bit hashes of the shingles of each text. Texts shorter than `shingle_size`
+            words form a single shingle.
+    """
+    words = [text.lower().split() for text in texts]
+    codes, _ = pd.factorize(np.array([w for ws in words for w in ws], dtype=object))
+    codes = codes.astype(np.uint64) + np.uint64(1)
+    offsets = np.cumsum([0] + [len(ws) for ws in words])
+
+    shingles = []
+    for start, end in zip(offsets[:-1], offsets[1:]):
+        text_codes = codes[start:end]
+        num_shingles = max(len(text_codes) - shingle_size + 1, 1)
+        hashes = np.zeros(num_shingles, dtype=np.uint64)
+        for i in range(min(shingle_size, len(text_codes))):
+            hashes = hashes * SHINGLE_MULTIPLIER + text_codes[i : i + num_shingles]
+        # Fold the 64-bit hashes into 32 bits
+        hashes = (hashes ^ (hashes >> np.uint64(32))) & np.uint64(0xFFFFFFFF)
+        shingles.append(np.unique(hashes))
+
+    return shingles
+
+
+def compute_minhash_signatures(
+    shingles: list[np.ndarray], num_perm: int, seed: int = 42
+) -> np.ndarray:
+    """
+    Computes the MinHash signatures of sets of hashed shingles.
+
+    Each permutation is approximated by a multiply-shift hash function `(a * x + b) mod 2^64 >> 32`, so the
+    signatures are deterministic for a given seed and no modulo is computed.
+
+    Args:
+        shingles (list[np.ndarray]): The hashed shingles of each text. See `get_shingles`.
+        num_perm (int): The number of permutations, i.e. the length of the signatures.
+        seed (int): The seed of the permutations. Defaults to 42.
+
+    Returns:
+        np.ndarray: The signatures as an array of shape (len(shingles), num_perm).
+    """
+    rng = np.random.default_rng(seed)
+    a = rng.integers(0, 1 << 63, size=(num_perm, 1), dtype=np.uint64) * np.uint64(
+        2
+    ) + np.uint64(1)
+    b = rng.integers(0, 1 << 63, size=(num_perm, 1), dtype=np.uint64)
+
+    signatures = np.empty((len(shingles), num_perm), dtype=np.uint64)
+    for i, hashes in enumerate(shingles):
+        signatures[i] = ((a * hashes[None, :] + b) >> np.uint64(32)).min(axis=1)
+
+    return signatures
+
+
+def choose_num_bands(num_perm: int, threshold: float, recall: float = 0.99) -> int:
+    """
+    Chooses the number of LSH bands for a Jaccard similarity threshold.
+
+    Two texts become candidates if their signatures agree on all rows of at least one band, which happens with
+    probability `1 - (1 - s^r)^b` for a Jaccard similarity `s`, `b` bands and `r` rows per band. The fewest bands
+    (i.e. the fewest false positive candidates) for which a pair at the threshold becomes a candidate with
+    probability `recall` are chosen.
+
+    Args:
+        num_perm (int): The number of permutations. See `compute_minhash_signatures`.
+        threshold (float): The Jaccard similarity threshold.
+        recall (float): The minimum probability of a pair at the threshold to become a candidate. Defaults to 0.99.
+
+    Returns:
+        int: The number of bands, which divides `num_perm`.
+    """
+    for num_bands in range(1, num_perm + 1):
+        if num_perm % num_bands != 0:
+            continue
+        rows = num_perm // num_bands
+        if 1 - (1 - threshold**rows) ** num_bands >= recall:
+            return num_bands
+
+    return num_perm
+
+
+def find_candidate_pairs(
+    signatures: np.ndarray, num_bands: int
+) -> set[tuple[int, int]]:
+    """
+    Finds the candidate pairs of texts whose signatures agree on all rows of at least one band.
+
+    Args:
+        signatures (np.ndarray): The MinHash signatures. See `compute_minhash_signatures`.
+        num_bands (int): The number of bands. See `choose_num_bands`.
+
+    Returns:
+        set[tuple[int, int]]: The candidate pairs as positions `(i, j)` in `signatures`, where `i < j`.
+    """
+    candidate_pairs = set()
+    for band in np.split(signatures, num_bands, axis=1):
+        buckets = defaultdict(list)
+        for i, row in enumerate(np.ascontiguousarray(band)):
+            buckets[row.tobytes()].append(i)
+        for bucket in buckets.values():
+            candidate_pairs.update(
+                (bucket[x], bucket[y])
+                for x in range(len(bucket))
+                for y in range(x + 1, len(bucket))
+            )
+
+    return candidate_pairs
+
+
+def flag_near_duplicates(
+    df: pd.DataFrame,
+    whitelist: list[int],
+    threshold: float = 0.9,
+    num_perm: int = 128,
+    shingle_size: int = 5,
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Flags near-duplicated articles in the given DataFrame based on the `extracted_content_body` column.
+
+    Candidate pairs are found with MinHash signatures and Locality-Sensitive Hashing (LSH) over word shingles, so
+    that not all pairs of articles are compared. The Jaccard similarity of the shingles of each candidate pair is
+    then computed exactly, and both articles of the pairs above the threshold are flagged.
+
+    Args:
+        df (pd.DataFrame): The DataFrame to flag near-duplicated rows in.
+        whitelist (list[int]): The list of article IDs to keep. See https://bitly.cx/IlwNV.
+        threshold (float): The Jaccard similarity threshold of near duplicates. Defaults to 0.9.
+        num_perm (int): The number of MinHash permutations. Defaults to 128.
+        shingle_size (int): The number of consecutive words in a shingle. Defaults to 5.
+
+    Returns:
+        tuple[pd.DataFrame, pd.DataFrame]:
+            The DataFrame with the `to_remove` and `remove_type` columns updated for articles with flagged
+            "Near Duplicate", and the near-duplicate pairs with their Jaccard similarity sorted by descending
+            similarity.
+    """
+    # Ignore articles that were already flagged (e.g. exact duplicates) and with no extracted content
+    candidates_df = df[
+        (~df["to_remove"])
+        & (df["extracted_content_body"].notna())
+        & (df["extracted_content_body"] != "")
+    ]
+
+    shingles = get_shingles(
+        candidates_df["extracted_content_body"].tolist(), shingle_size
+    )
+    signatures = compute_minhash_signatures(shingles, num_perm)
+    num_bands = choose_num_bands(num_perm, threshold)
+    candidate_pairs = find_candidate_pairs(signatures, num_bands)
+
+    pairs = []
+    for i, j in sorted(candidate_pairs):
+        similarity = len(np.intersect1d(shingles[i], shingles[j])) / len(
+            np.union1d(shingles[i], shingles[j])
+        )
+        if similarity >= threshold:
+            pairs.append((i, j, similarity))
+
+    logger.info(
+        f"Near Duplicates: {len(pairs)} of {len(candidate_pairs)} candidate pairs above the threshold "
+        f"({num_bands} bands of {num_perm // num_bands} rows)"
+    )
+
+    columns = ["id", "content_category", "title"]
+    first = candidates_df.iloc[[i for i, _, _ in pairs]][columns].reset_index(drop=True)
+    second = candidates_df.iloc[[j for _, j, _ in pairs]][columns].reset_index(
+        drop=True
+    )
+    near_duplicate_pairs = pd.concat(
+        [
+            first.add_suffix("_1"),
+            second.add_suffix("_2"),
+            pd.Series(
+                [similarity for _, _, similarity in pairs],
+                name="jaccard_similarity",
+                dtype=float,
+            ),
+        ],
+        axis=1,
+    ).sort_values("jaccard_similarity", ascending=False, ignore_index=True)
+
+    # Get all rows for near-duplicated content, ignoring whitelisted articles
+    flag_mask = df.index.isin(
+        candidates_df.index[[i for pair in pairs for i in pair[:2]]]
+    ) & (~df["id"].isin(whitelist))
+
+    # Update `to_remove`
+    df.loc[flag_mask, "to_remove"] = True
+
+    # Set `remove_type` for all rows
+    df.loc[flag_mask, "remove_type"] = "Near Duplicate"
+
+    return df, near_duplicate_pairs
@@ -3,29 +3,64 @@
 generated using Kedro 0.19.6
 """
 
+import logging
 import os
-import re
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from functools import partial
 from typing import Any, Callable
 
 import pandas as pd
-from content_optimization.pipelines.data_processing.extractor import HTMLExtractor
+from content_optimization.pipelines.data_processing.cache import (
+    ExtractionCache,
+    get_extractor_version,
+)
+from content_optimization.pipelines.data_processing.corrections import (
+    apply_corrections,
+    get_corrections,
+    get_unmatched_corrections,
+    load_missing_contents,
+    select_corrections,
+)
+from content_optimization.pipelines.data_processing.incremental import (
+    commit_fingerprints,
+    fingerprint_raw_partitions,
+    select_categories,
+)
+from content_optimization.pipelines.data_processing.near_duplicates import (
+    flag_near_duplicates,
+)
+from content_optimization.pipelines.data_processing.profiler import (
+    get_profile_report,
+    log_profile_report,
+)
+from content_optimization.pipelines.data_processing.spill import SpilledTexts
 from content_optimization.pipelines.data_processing.utils import (
-    add_content_body,
-    add_updated_urls,
+    extract_contents,
+    extract_contents_in_batches,
     flag_articles_to_remove_after_extraction,
     flag_articles_to_remove_before_extraction,
+    flag_duplicated,
+    get_content_category,
     invert_ia_mappings,
-    map_category_names,
+    map_all_category_names,
     select_and_rename_columns,
+    strip_whitespaces,
 )
 from tqdm import tqdm
 
+# Set up logger in nodes.py
+# Edit conf/logging.yml to see changes
+logger = logging.getLogger(__name__)
+
 
 def standardize_columns(
     all_contents: dict[str, Callable[[], Any]],
     columns_to_add_cfg: dict[str, list[str]],
     columns_to_keep_cfg: dict[str, list[str]],
     default_columns: list[str],
+    incremental: dict[str, Any] | None = None,
 ) -> dict[str, pd.DataFrame]:
     """
     Standardizes the columns of multiple dataframes in a dictionary.
@@ -41,6 +76,10 @@ def standardize_columns(
 
     The function returns a dictionary mapping content categories to the standardized dataframes.
 
+    If incremental runs are enabled, only the content categories whose raw files or parameters changed since the last
+    complete run are standardized (and then recomputed by the downstream nodes). The other content categories are
+    omitted from the output, so their partitions from the last run are reused.
+
     Args:
         all_contents (dict[str, Callable[[], Any]]):
             A dictionary containing the raw `partitions.PartitionedDataset`where the keys are the filenames and the
@@ -55,6 +94,9 @@ def standardize_columns(
         default_columns (list[str]):
             A list of default column names to rename the columns of the dataframes to.
 
+        incremental (dict[str, Any] | None):
+            The `incremental` parameters. See `incremental.py`. Defaults to None (full run).
+
     Returns:
         dict[str, pd.DataFrame]:
             A dictionary that contains the standardized dataframes stored as partitioned parquet files, where the keys
@@ -62,11 +104,26 @@ def standardize_columns(
     """
     all_contents_standardized = {}
 
+    # Fingerprint the raw files and the parameters of each content category
+    raw_fingerprints = fingerprint_raw_partitions(incremental, list(all_contents))
+    fingerprints = {}
+    for filename in all_contents:
+        content_category = get_content_category(filename)
+        fingerprints[content_category] = {
+            "files": raw_fingerprints.get(filename),
+            "columns_to_add": columns_to_add_cfg.get(content_category),
+            "columns_to_keep": columns_to_keep_cfg.get(content_category),
+            "default_columns": default_columns,
+        }
+    selected = select_categories(incremental, "standardize", fingerprints)
+
     pbar = tqdm(all_contents.items())
 
     for filename, partition_load_func in pbar:
         # Get content category from filename
-        content_category = re.sub(r"export-published-", "", filename.split("_")[0])
+        content_category = get_content_category(filename)
+        if selected is not None and content_category not in selected:
+            continue
         pbar.set_description(f"Standardizing: {content_category}")
 
         # Load partition data
@@ -83,7 +140,7 @@ def standardize_columns(
 
         # Strip all whitespaces across all strings in dataframe
         # See: https://github.com/Wilsven/healthhub-content-optimization/issues/53
-        df = df.map(lambda x: x.strip() if isinstance(x, str) else x)
+        df = strip_whitespaces(df)
 
         all_contents_standardized[content_category] = df
 
@@ -94,14 +151,16 @@ def add_data(
     all_contents_standardized: dict[str, Callable[[], Any]],
     missing_contents: dict[str, Callable[[], Any]],
     updated_urls: dict[str, dict[int, str]],
+    incremental: dict[str, Any] | None = None,
 ) -> dict[str, Callable[[], Any]]:
     """
     Process and add data to standardized content, incorporating missing contents and updated URLs.
 
     This function performs the following operations:
     1. Fetches missing content from text files to correct Excel errors.
-    2. Adds content body to the dataframe for each content category.
-    3. Updates URLs in the dataframe.
+    2. Collects the missing content and the updated URLs into a single table of corrections (see `corrections.py`).
+    3. Applies the corrections to the dataframe of each content category, i.e. adds the content body and updates
+       the URLs.
     4. Flags articles that should be removed before extraction.
 
     Args:
@@ -111,42 +170,110 @@ def add_data(
             that load the content of text files.
         updated_urls (dict[str, dict[int, str]]): A dictionary where keys are content categories and values are
             dictionaries mapping the article IDs to updated URLs.
+        incremental (dict[str, Any] | None): The `incremental` parameters. See `incremental.py`. Defaults to None
+            (full run).
 
     Returns:
         dict[str, Callable[[], Any]]: A dictionary where keys are content categories and values are functions that return
-            processed dataframes with added data.
+            processed dataframes with added data. If incremental runs are enabled, only the recomputed content
+            categories are returned.
+
+    Note:
+        - The partitions are processed lazily: each partition is only loaded and processed when its function is
+          called, i.e. when `partitions.PartitionedDataset` saves it. So only one partition is held in memory at a
+          time.
     """
-    excel_errors = {}
     all_contents_added = {}
 
     # Fetch all txt files from 01_raw to correct the Excel error
-    for file_path, load_func in missing_contents.items():
-        text = load_func()
-        # Extract friendly url that is used as filename
-        friendly_url = file_path.split("/")[-1]
-        # Store in dictionary
-        excel_errors[friendly_url] = text
+    excel_errors = load_missing_contents(missing_contents)
+    corrections = get_corrections(excel_errors, updated_urls)
+
+    # Missing contents are added by friendly url across all content categories
+    selected = select_categories(
+        incremental,
+        "add",
+        {
+            content_category: {
+                "missing_contents": excel_errors,
+                "updated_urls": updated_urls.get(content_category),
+            }
+            for content_category in all_contents_standardized
+        },
+    )
+
+    for content_category, partition_load_func in all_contents_standardized.items():
+        if selected is not None and content_category not in selected:
+            continue
+        # Each partition is only loaded and processed when it is saved
+        all_contents_added[content_category] = partial(
+            _add_partition_data,
+            content_category,
+            partition_load_func,
+            select_corrections(corrections, content_category),
+        )
 
-    pbar = tqdm(all_contents_standardized.items())
+    return all_contents_added
 
-    for content_category, partition_load_func in pbar:
-        pbar.set_description(f"Adding: {content_category}")
-        df = partition_load_func()
 
-        # Add back contents that are previously indicated as excel errors into the `content_body` column
-        df = add_content_body(df, excel_errors)
+def _add_partition_data(
+    content_category: str,
+    partition_load_func: Callable[[], Any],
+    corrections: pd.DataFrame,
+) -> pd.DataFrame:
+    logger.info(f"Adding: {content_category}")
+    df = partition_load_func()
 
-        # Add updated urls into the `full_url` column
-        urls_dict = updated_urls.get(content_category, {})
-        df = add_updated_urls(df, urls_dict)
+    # Add back contents that are previously indicated as excel errors into the `content_body` column, and add
+    # updated urls into the `full_url` and `full_url2` columns
+    df = apply_corrections(df, corrections, content_category)
 
-        # Mark articles with no content, was rejected by Excel due to a "Value
-        # exceeded maximum cell size" error or with dummy content in `to_remove` column
-        df = flag_articles_to_remove_before_extraction(df)
+    # Mark articles with no content, was rejected by Excel due to a "Value
+    # exceeded maximum cell size" error or with dummy content in `to_remove` column
+    return flag_articles_to_remove_before_extraction(df)
 
-        all_contents_added[content_category] = df
 
-    return all_contents_added
+def report_corrections(
+    all_contents_added: dict[str, Callable[[], Any]],
+    missing_contents: dict[str, Callable[[], Any]],
+    updated_urls: dict[str, dict[int, str]],
+    blacklist: dict[int, str],
+) -> pd.DataFrame:
+    """
+    Reports the manual corrections that no longer match any article, i.e. the missing contents, updated URLs and
+    blacklisted articles that can be removed from the raw data and the parameters.
+
+    Args:
+        all_contents_added (dict[str, Callable[[], Any]]): A dictionary where keys are content categories and values
+            are functions that return dataframes with added data.
+        missing_contents (dict[str, Callable[[], Any]]): A dictionary where keys are file paths and values are functions
+            that load the content of text files.
+        updated_urls (dict[str, dict[int, str]]): A dictionary where keys are content categories and values are
+            dictionaries mapping the article IDs to updated URLs.
+        blacklist (dict[int, str]): A dictionary containing the article IDs and the reason to remove it.
+
+    Returns:
+        pd.DataFrame: The source, content category and key of each unmatched correction.
+    """
+    corrections = get_corrections(
+        load_missing_contents(missing_contents), updated_urls, blacklist
+    )
+    # Only the key columns of the articles are kept in memory
+    articles = pd.concat(
+        [
+            partition_load_func()[["content_category", "id", "friendly_url"]]
+            for partition_load_func in all_contents_added.values()
+        ],
+        ignore_index=True,
+    )
+
+    unmatched_corrections = get_unmatched_corrections(corrections, articles)
+    if not unmatched_corrections.empty:
+        logger.warning(
+            f"{len(unmatched_corrections)} corrections no longer match any article:\n{unmatched_corrections}"
+        )
+
+    return unmatched_corrections
 
 
 def extract_data(
@@ -154,11 +281,37 @@ def extract_data(
     word_count_cutoff: int,
     whitelist: list[int],
     blacklist: dict[int, str],
-) -> tuple[dict[str, pd.DataFrame], dict[str, str]]:
+    workers: int = 1,
+    chunksize: int = 32,
+    parser: str = "html.parser",
+    cache_path: str | None = None,
+    profile: bool = False,
+    batch_size: int | None = None,
+    url_check: dict[str, Any] | None = None,
+    incremental: dict[str, Any] | None = None,
+) -> tuple[dict[str, pd.DataFrame], dict[str, str], pd.DataFrame]:
     """
     Extracts data from processed content and stores it in parquet files
     and text files.
 
+    Articles are extracted in the main process by default. If `workers` is greater than 1 (or -1 to use all cores),
+    the articles are sent to a process pool in chunks of `chunksize` articles instead. The output is the same in
+    both modes.
+
+    If `cache_path` is provided, each article is first looked up in the extraction cache by its id, the hash of its
+    HTML content and the extractor version stamp. Only the articles that are not found are extracted and then added
+    to the cache. See `cache.py` to evict stale entries and compact the cache.
+
+    If `profile` is True, the parse, the tree walk and each extractor method are timed for every article, together
+    with the size of its HTML content and parsed tree. The cache is not looked up, so that every article is profiled.
+    See `profiler.py` and the `replay-slow` command of `cli.py` to replay the slowest articles.
+
+    If `batch_size` is provided, the articles of each content category are extracted `batch_size` articles at a time.
+    Each extracted batch and its texts are spilled to a temporary directory, so that only one batch is held in memory
+    with the columns needed to flag the articles. The batches are flagged once the whole content category is
+    extracted, and are loaded back one at a time when they are saved as Parquet row groups. The output is the same
+    as when each content category is extracted at once. See `spill.py`.
+
     Args:
         all_contents_added (dict[str, Callable[[], Any]]):
             A dictionary containing the standardized `partitions.PartitionedDataset` where the keys are the content
@@ -166,106 +319,123 @@ def extract_data(
         word_count_cutoff (int): The minimum number of words in an article to be considered before flagging for removal.
         whitelist (list[int]): The list of article IDs to keep. See https://bitly.cx/IlwNV.
         blacklist (dict[int, str]): A dictionary containing the article IDs and the reason to remove it. See https://bitly.cx/f8FIk.
+        workers (int): The number of processes used for extraction. Defaults to 1 (no process pool).
+        chunksize (int): The number of articles sent to a worker process at a time. Defaults to 32.
+        parser (str): The BeautifulSoup parser used by `HTMLExtractor` (e.g. "html.parser" or "lxml").
+            Defaults to "html.parser".
+        cache_path (str | None): The path to the extraction cache. Defaults to None (no cache).
+        profile (bool): Whether to profile the extraction of each article. Defaults to False.
+        batch_size (int | None): The number of articles extracted and spilled to disk at a time. Defaults to None
+            (each content category is extracted at once).
+        url_check (dict[str, Any] | None): The `url_check` parameters passed to the `URLChecker`. See `url_checker.py`.
+            Defaults to None.
+        incremental (dict[str, Any] | None): The `incremental` parameters. See `incremental.py`. Defaults to None
+            (full run). If enabled, only the recomputed content categories are returned.
 
     Returns:
-        tuple[dict[str, pd.DataFrame], dict[str, str]]: A tuple containing two dictionaries. The first dictionary
-            contains the extracted data stored as partitioned parquet files, where the keys are the content categories
-            and the values are the corresponding dataframes.
-            The second dictionary contains the extracted text stored as partitioned text files, where the keys are the
-            file paths and the values are the extracted text.
+        tuple[dict[str, pd.DataFrame], dict[str, str], pd.DataFrame]: A tuple containing two dictionaries and a
+            dataframe. The first dictionary contains the extracted data stored as partitioned parquet files, where the
+            keys are the content categories and the values are the corresponding dataframes (or `SpilledBatches` if
+            `batch_size` is provided).
+            The second dictionary contains the extracted text packed in a single database (see `PackedTextDataset`),
+            where the keys are the file paths of the text files and the values are the extracted text (or
+            `SpilledTexts` if `batch_size` is provided).
+            The dataframe is the profile report ranked from the slowest article (empty if `profile` is False).
     """
     all_contents_extracted = {}  # to store as partitioned parquet files
-    all_extracted_text = {}  # to store as partitioned text files
-
-    pbar = tqdm(all_contents_added.items())
-
-    for content_category, partition_load_func in pbar:
-        pbar.set_description(f"Extracting: {content_category}")
-        # Load partition data
-        df = partition_load_func()
-
-        # Initialise new columns in dataframe to store extracted data
-        df["has_table"] = False
-        df["has_image"] = False
-        df["related_sections"] = None
-        df["extracted_tables"] = None
-        df["extracted_raw_html_tables"] = None
-        df["extracted_links"] = None
-        df["extracted_headers"] = None
-        df["extracted_images"] = None
-        df["extracted_content_body"] = None
-
-        for index, row in df.iterrows():
-            # Skip extraction for those articles flagged for removal unless whitelisted
-            if row["to_remove"]:
-                # Check if the article is in the whitelist
-                if row["id"] not in whitelist:
-                    continue
-                else:
-                    # Whitelist article
-                    df.at[index, "to_remove"] = False
-
-            # Replace all forward slashes with hyphens to avoid saving as folders
-            title = re.sub(r"\/", "-", row["title"]).strip()
-
-            # Get the HTML content for extraction and relevant data for logging
-            content_name = row["content_name"]
-            full_url = row["full_url"]
-            html_content = row["content_body"]
-
-            # Extract text from HTML using the HTMLExtractor Class
-            extractor = HTMLExtractor(
-                content_name, content_category, full_url, html_content
+    # to store as packed text
+    all_extracted_text = (
+        SpilledTexts(tempfile.TemporaryDirectory(prefix="extraction_spill_"))
+        if batch_size is not None
+        else {}
+    )
+    profiles = []  # to store as the profile report
+
+    # The flagging parameters apply to all content categories
+    selected = select_categories(
+        incremental,
+        "extract",
+        {
+            content_category: {
+                "word_count_cutoff": word_count_cutoff,
+                "whitelist": whitelist,
+                "blacklist": blacklist,
+                "parser": parser,
+            }
+            for content_category in all_contents_added
+        },
+    )
+
+    if workers == -1:
+        workers = os.cpu_count() or 1
+
+    # A single process pool is shared across all content categories
+    pool = ProcessPoolExecutor(max_workers=workers) if workers > 1 else nullcontext()
+    extraction_cache = (
+        ExtractionCache(cache_path, get_extractor_version(parser))
+        if cache_path is not None
+        else nullcontext()
+    )
+
+    with pool as executor, extraction_cache as cache:
+        pbar = tqdm(all_contents_added.items())
+
+        for content_category, partition_load_func in pbar:
+            if selected is not None and content_category not in selected:
+                continue
+            pbar.set_description(f"Extracting: {content_category}")
+            # Load partition data
+            df = partition_load_func()
+
+            extract = partial(
+                extract_contents,
+                content_category=content_category,
+                whitelist=whitelist,
+                cache=cache,
+                executor=executor,
+                chunksize=chunksize,
+                parser=parser,
+                profile=profile,
             )
-            has_table = extractor.check_for_table()
-            has_image = extractor.check_for_image()
-            related_sections = extractor.extract_related_sections()
-            extracted_tables = extractor.extract_tables()
-            extracted_raw_html_tables = extractor.extract_raw_html_tables()
-            extracted_links = extractor.extract_links()
-            extracted_headers = extractor.extract_headers()
-            extracted_img_alt_text = extractor.extract_img_links_and_alt_text()
-            extracted_content_body = extractor.extract_text()
-
-            # Store extracted data into the dataframe
-            df.at[index, "has_table"] = has_table
-            df.at[index, "has_image"] = has_image
-            df.at[index, "related_sections"] = related_sections
-            df.at[index, "extracted_tables"] = extracted_tables
-            df.at[index, "extracted_raw_html_tables"] = extracted_raw_html_tables
-            df.at[index, "extracted_links"] = extracted_links
-            df.at[index, "extracted_headers"] = extracted_headers
-            df.at[index, "extracted_images"] = extracted_img_alt_text
-            df.at[index, "extracted_content_body"] = extracted_content_body
-
-            # Substitute forbidden characters for filenames with _
-            title = re.sub(r'[<>:"/\\|?*]', "_", title)
-
-            # Truncate title to 25 characters and append the id
-            # See: https://github.com/Wilsven/healthhub-content-optimization/issues/42
-            title = title[:25] + f"_{row['id']}"
-
-            # Store text files in its own folder named `content_category`
-            all_extracted_text[os.path.join(content_category, title)] = (
-                extracted_content_body
+            # After extraction, we flag to remove articles with no content,
+            # duplicated content, duplicated URL or below word count cutoff
+            flag = partial(
+                flag_articles_to_remove_after_extraction,
+                word_count_cutoff=word_count_cutoff,
+                whitelist=whitelist,
+                blacklist=blacklist,
+                url_check=url_check,
             )
 
-        # After extraction, we flag to remove articles with no content,
-        # duplicated content, duplicated URL or below word count cutoff
-        df = flag_articles_to_remove_after_extraction(
-            df, word_count_cutoff, whitelist, blacklist
-        )
+            if batch_size is None:
+                df, extracted_text, article_profiles = extract(df)
+                all_extracted_text.update(extracted_text)
+                df = flag(df)
+            else:
+                # Spill the extracted batches to disk, and save them as row groups
+                df, article_profiles = extract_contents_in_batches(
+                    df, batch_size, extract, flag, all_extracted_text
+                )
+            profiles.extend(article_profiles)
+
+            if cache is not None:
+                cache.log_stats(content_category)
 
-        # Store dataframes in a parquet file named `content_category`
-        all_contents_extracted[content_category] = df
+            # Store dataframes in a parquet file named `content_category`
+            all_contents_extracted[content_category] = df
 
-    return all_contents_extracted, all_extracted_text
+    extraction_profile = get_profile_report(profiles)
+    if profile:
+        log_profile_report(extraction_profile)
+
+    return all_contents_extracted, all_extracted_text, extraction_profile
 
 
 def map_data(
     all_contents_extracted: dict[str, Callable[[], Any]],
     l1_mappings: dict[str, dict[str, list[str]]],
     l2_mappings: dict[str, dict[str, list[str]]],
+    incremental: dict[str, Any] | None = None,
 ) -> dict[str, Callable[[], Any]]:
     """
     Map extracted content data to L1 and L2 Information Architecture (IA) categories.
@@ -282,53 +452,75 @@ def map_data(
             source (old) categories.
         l2_mappings (dict[str, dict[str, list[str]]]): A dictionary of L2 category mappings, structured similarly to
             l1_mappings.
+        incremental (dict[str, Any] | None): The `incremental` parameters. See `incremental.py`. Defaults to None
+            (full run).
 
     Returns:
         dict[str, Callable[[], Any]]: A dictionary where keys are content categories and values are functions that return
             dataframes with mapped L1 and L2 categories. The returned dataframes include new columns for the mapped categories.
+            If incremental runs are enabled, only the recomputed content categories are returned.
 
     Note:
-        - This function uses the `invert_ia_mappings` and `map_category_names` helper functions.
+        - This function uses the `invert_ia_mappings` and `map_all_category_names` helper functions.
+        - The partitions are mapped lazily, when `partitions.PartitionedDataset` saves them (see `add_data`).
     """
     all_contents_mapped = {}
     inverted_l1_mappings = invert_ia_mappings(l1_mappings)
     inverted_l2_mappings = invert_ia_mappings(l2_mappings)
 
-    pbar = tqdm(all_contents_extracted.items())
-
-    for content_category, partition_load_func in pbar:
-        pbar.set_description(f"Mapping: {content_category}")
-        # Load partition data
-        df = partition_load_func()
-
-        # Map the values from the `article_category_names` column to the new L1 IA mapping
-        mapped_l1_df = map_category_names(
-            inverted_l1_mappings,
-            df,
-            "content_category",
-            "article_category_names",
-            "l1_mappings",
+    selected = select_categories(
+        incremental,
+        "map",
+        {
+            content_category: {
+                "l1_mappings": l1_mappings.get(content_category),
+                "l2_mappings": l2_mappings.get(content_category),
+            }
+            for content_category in all_contents_extracted
+        },
+    )
+
+    for content_category, partition_load_func in all_contents_extracted.items():
+        if selected is not None and content_category not in selected:
+            continue
+        # Each partition is only loaded and mapped when it is saved
+        all_contents_mapped[content_category] = partial(
+            _map_partition_data,
+            content_category,
+            partition_load_func,
+            {
+                "l1_mappings": inverted_l1_mappings,
+                "l2_mappings": inverted_l2_mappings,
+            },
         )
 
-        # Map the values from the `article_category_names` column to the new L2 IA mapping
-        mapped_df = map_category_names(
-            inverted_l2_mappings,
-            mapped_l1_df,
-            "content_category",
-            "article_category_names",
-            "l2_mappings",
-        )
+    return all_contents_mapped
 
-        all_contents_mapped[content_category] = mapped_df
 
-    return all_contents_mapped
+def _map_partition_data(
+    content_category: str,
+    partition_load_func: Callable[[], Any],
+    inverted_mappings: dict[str, dict[str, dict[str, str]]],
+) -> pd.DataFrame:
+    logger.info(f"Mapping: {content_category}")
+    # Load partition data
+    df = partition_load_func()
+
+    # Map the values from the `article_category_names` column to the new L1 and L2 IA mappings at once
+    return map_all_category_names(
+        inverted_mappings, df, "content_category", "article_category_names"
+    )
 
 
 def merge_data(
     all_contents_mapped: dict[str, Callable[[], Any]],
     google_analytics_data: dict[str, pd.DataFrame],
     google_analytics_columns: dict[str, str],
-) -> pd.DataFrame:
+    whitelist: list[int] | None = None,
+    flag_duplicates_across_categories: bool = False,
+    near_duplicates: dict[str, Any] | None = None,
+    incremental: dict[str, Any] | None = None,
+) -> tuple[pd.DataFrame, pd.DataFrame]:
     """
     Merge the data from multiple partitioned dataframes into a single `pandas.DataFrame`.
 
@@ -342,10 +534,24 @@ def merge_data(
 
         google_analytics_columns (dict[str, str]): A mapping to default column names for the Google Analytics data.
 
+        whitelist (list[int] | None): The list of article IDs to keep. See https://bitly.cx/IlwNV. Defaults to None.
+
+        flag_duplicates_across_categories (bool):
+            Whether to also flag duplicated content and URLs across all content categories in the merged data, in
+            addition to the duplicates flagged within each content category in `extract_data`. Defaults to False.
+
+        near_duplicates (dict[str, Any] | None):
+            The `near_duplicates` parameters. If enabled, near-duplicated articles across all content categories are
+            flagged. See `near_duplicates.py`. Defaults to None (disabled).
+
+        incremental (dict[str, Any] | None): The `incremental` parameters. See `incremental.py`. Defaults to None
+            (full run). If enabled, the fingerprints of this run are committed after merging all content categories.
+
     Returns:
-        pd.DataFrame: The merged dataframe with updated Google Analytics data.
+        tuple[pd.DataFrame, pd.DataFrame]: The merged dataframe with updated Google Analytics data, and the
+            near-duplicate pairs with their Jaccard similarity (empty if disabled).
     """
-    merged_df = pd.DataFrame()
+    merged_dfs = []
     for content_category, ga_df in google_analytics_data.items():
         # Rename columns and remove unnecessary columns
         df = ga_df.rename(columns=google_analytics_columns)
@@ -355,7 +561,267 @@ def merge_data(
         # Drop outdated Google Analytics data columns
         orig_df = orig_df.drop(list(google_analytics_columns.values()), axis=1)
         # Merge data with updated Google Analytics statistics
-        tmp = orig_df.merge(df, on="id")
-        merged_df = pd.concat([merged_df, tmp], axis=0, ignore_index=True)
+        merged_dfs.append(orig_df.merge(df, on="id"))
+
+    # Concatenate all content categories at once, so that each row is only copied once
+    merged_df = (
+        pd.concat(merged_dfs, axis=0, ignore_index=True)
+        if merged_dfs
+        else pd.DataFrame()
+    )
+    del merged_dfs
+
+    if flag_duplicates_across_categories:
+        merged_df = flag_duplicated(
+            merged_df, whitelist or [], column="extracted_content_body"
+        )
+        merged_df = flag_duplicated(merged_df, whitelist or [], column="full_url")
+
+    near_duplicate_pairs = pd.DataFrame(
+        columns=[
+            *[
+                f"{column}_{i}"
+                for i in [1, 2]
+                for column in ["id", "content_category", "title"]
+            ],
+            "jaccard_similarity",
+        ]
+    )
+    if near_duplicates and near_duplicates.get("enabled", False):
+        merged_df, near_duplicate_pairs = flag_near_duplicates(
+            merged_df,
+            whitelist or [],
+            threshold=near_duplicates["threshold"],
+            num_perm=near_duplicates["num_perm"],
+            shingle_size=near_duplicates["shingle_size"],
+        )
+
+    # All partitions are up to date, so the next run only recomputes the content categories that change
+    commit_fingerprints(incremental)
+
+    return merged_df, near_duplicate_pairs
+
 
-    return merged_df
+def _as_partitions(
+    content_category: str, df: pd.DataFrame
+) -> dict[str, Callable[[], Any]]:
+    # The nodes above load partitions lazily, as `partitions.PartitionedDataset` does
+    return {content_category: lambda: df}
+
+
+def standardize_category(
+    content_category: str,
+    all_contents: dict[str, Callable[[], Any]],
+    columns_to_add_cfg: dict[str, list[str]],
+    columns_to_keep_cfg: dict[str, list[str]],
+    default_columns: list[str],
+) -> pd.DataFrame:
+    """
+    Standardizes the raw partition of a single content category. See `standardize_columns`.
+
+    This and the other `*_category` nodes are the nodes of the per-category branches of the parallel pipeline (see
+    `create_parallel_pipeline`). Only the raw partition of `content_category` is loaded.
+
+    Args:
+        content_category (str): The content category of the branch.
+        all_contents (dict[str, Callable[[], Any]]): The raw partitions keyed by filename.
+        columns_to_add_cfg (dict[str, list[str]]): The columns to add for each content category.
+        columns_to_keep_cfg (dict[str, list[str]]): The columns to keep for each content category.
+        default_columns (list[str]): The default column names.
+
+    Returns:
+        pd.DataFrame: The standardized dataframe of the content category.
+
+    Raises:
+        ValueError: If there is no raw partition of the content category.
+    """
+    partitions = {
+        filename: partition_load_func
+        for filename, partition_load_func in all_contents.items()
+        if get_content_category(filename) == content_category
+    }
+    if not partitions:
+        raise ValueError(f"No raw partition found for '{content_category}'")
+
+    return standardize_columns(
+        partitions, columns_to_add_cfg, columns_to_keep_cfg, default_columns
+    )[content_category]
+
+
+def add_category(
+    content_category: str,
+    df: pd.DataFrame,
+    missing_contents: dict[str, Callable[[], Any]],
+    updated_urls: dict[str, dict[int, str]],
+) -> pd.DataFrame:
+    """
+    Adds the missing data of a single content category. See `add_data`.
+
+    Args:
+        content_category (str): The content category of the branch.
+        df (pd.DataFrame): The standardized dataframe of the content category.
+        missing_contents (dict[str, Callable[[], Any]]): A dictionary where keys are file paths and values are functions
+            that load the content of text files.
+        updated_urls (dict[str, dict[int, str]]): A dictionary where keys are content categories and values are
+            dictionaries mapping the article IDs to updated URLs.
+
+    Returns:
+        pd.DataFrame: The dataframe of the content category with added data.
+    """
+    return add_data(
+        _as_partitions(content_category, df), missing_contents, updated_urls
+    )[content_category]()
+
+
+def report_categories_corrections(
+    content_categories: list[str],
+    missing_contents: dict[str, Callable[[], Any]],
+    updated_urls: dict[str, dict[int, str]],
+    blacklist: dict[int, str],
+    *all_contents_added: pd.DataFrame,
+) -> pd.DataFrame:
+    """
+    Reports the manual corrections that no longer match any article of the per-category branches. See
+    `report_corrections`.
+
+    Args:
+        content_categories (list[str]): The content categories of the branches.
+        missing_contents (dict[str, Callable[[], Any]]): A dictionary where keys are file paths and values are functions
+            that load the content of text files.
+        updated_urls (dict[str, dict[int, str]]): A dictionary where keys are content categories and values are
+            dictionaries mapping the article IDs to updated URLs.
+        blacklist (dict[int, str]): A dictionary containing the article IDs and the reason to remove it.
+        *all_contents_added (pd.DataFrame): The dataframe with added data of each branch, in the same order as
+            `content_categories`.
+
+    Returns:
+        pd.DataFrame: The source, content category and key of each unmatched correction.
+    """
+    partitions = {}
+    for content_category, df in zip(content_categories, all_contents_added):
+        partitions.update(_as_partitions(content_category, df))
+
+    return report_corrections(partitions, missing_contents, updated_urls, blacklist)
+
+
+def extract_category(
+    content_category: str,
+    df: pd.DataFrame,
+    word_count_cutoff: int,
+    whitelist: list[int],
+    blacklist: dict[int, str],
+    workers: int = 1,
+    chunksize: int = 32,
+    parser: str = "html.parser",
+    cache_path: str | None = None,
+    profile: bool = False,
+    batch_size: int | None = None,
+    url_check: dict[str, Any] | None = None,
+) -> tuple[pd.DataFrame, dict[str, str], pd.DataFrame]:
+    """
+    Extracts the articles of a single content category. See `extract_data`.
+
+    The extraction cache and the packed text database are shared by the branches, which only hold the lock on the
+    database while they write to it.
+
+    Args:
+        content_category (str): The content category of the branch.
+        df (pd.DataFrame): The dataframe of the content category with added data.
+        word_count_cutoff (int): The minimum number of words in an article to be considered before flagging for removal.
+        whitelist (list[int]): The list of article IDs to keep. See https://bitly.cx/IlwNV.
+        blacklist (dict[int, str]): A dictionary containing the article IDs and the reason to remove it.
+        workers (int): The number of processes used for extraction. Defaults to 1 (no process pool).
+        chunksize (int): The number of articles sent to a worker process at a time. Defaults to 32.
+        parser (str): The BeautifulSoup parser used by `HTMLExtractor`. Defaults to "html.parser".
+        cache_path (str | None): The path to the extraction cache. Defaults to None (no cache).
+        profile (bool): Whether to profile the extraction of each article. Defaults to False.
+        batch_size (int | None): The number of articles extracted and spilled to disk at a time. Defaults to None.
+        url_check (dict[str, Any] | None): The `url_check` parameters passed to the `URLChecker`. Defaults to None.
+
+    Returns:
+        tuple[pd.DataFrame, dict[str, str], pd.DataFrame]: The extracted dataframe of the content category (or
+            `SpilledBatches` if `batch_size` is provided), its extracted text and its profile report.
+    """
+    all_contents_extracted, all_extracted_text, extraction_profile = extract_data(
+        _as_partitions(content_category, df),
+        word_count_cutoff,
+        whitelist,
+        blacklist,
+        workers,
+        chunksize,
+        parser,
+        cache_path,
+        profile,
+        batch_size,
+        url_check,
+    )
+
+    return (
+        all_contents_extracted[content_category],
+        all_extracted_text,
+        extraction_profile,
+    )
+
+
+def map_category(
+    content_category: str,
+    df: pd.DataFrame,
+    l1_mappings: dict[str, dict[str, list[str]]],
+    l2_mappings: dict[str, dict[str, list[str]]],
+) -> pd.DataFrame:
+    """
+    Maps the extracted data of a single content category to the L1 and L2 IA categories. See `map_data`.
+
+    Args:
+        content_category (str): The content category of the branch.
+        df (pd.DataFrame): The extracted dataframe of the content category.
+        l1_mappings (dict[str, dict[str, list[str]]]): A dictionary of L1 category mappings.
+        l2_mappings (dict[str, dict[str, list[str]]]): A dictionary of L2 category mappings.
+
+    Returns:
+        pd.DataFrame: The dataframe of the content category with mapped L1 and L2 categories.
+    """
+    return map_data(_as_partitions(content_category, df), l1_mappings, l2_mappings)[
+        content_category
+    ]()
+
+
+def merge_categories(
+    content_categories: list[str],
+    google_analytics_data: dict[str, pd.DataFrame],
+    google_analytics_columns: dict[str, str],
+    whitelist: list[int] | None,
+    flag_duplicates_across_categories: bool,
+    near_duplicates: dict[str, Any] | None,
+    *all_contents_mapped: pd.DataFrame,
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Merges the mapped data of the per-category branches, once all branches are done. See `merge_data`.
+
+    Args:
+        content_categories (list[str]): The content categories of the branches.
+        google_analytics_data (dict[str, pd.DataFrame]): The Google Analytics data keyed by content category.
+        google_analytics_columns (dict[str, str]): A mapping to default column names for the Google Analytics data.
+        whitelist (list[int] | None): The list of article IDs to keep. See https://bitly.cx/IlwNV.
+        flag_duplicates_across_categories (bool): Whether to also flag duplicated content and URLs across all content
+            categories.
+        near_duplicates (dict[str, Any] | None): The `near_duplicates` parameters. See `near_duplicates.py`.
+        *all_contents_mapped (pd.DataFrame): The mapped dataframe of each branch, in the same order as
+            `content_categories`.
+
+    Returns:
+        tuple[pd.DataFrame, pd.DataFrame]: The merged dataframe with updated Google Analytics data, and the
+            near-duplicate pairs with their Jaccard similarity (empty if disabled).
+    """
+    partitions = {}
+    for content_category, df in zip(content_categories, all_contents_mapped):
+        partitions.update(_as_partitions(content_category, df))
+
+    return merge_data(
+        partitions,
+        google_analytics_data,
+        google_analytics_columns,
+        whitelist,
+        flag_duplicates_across_categories,
+        near_duplicates,
+    )
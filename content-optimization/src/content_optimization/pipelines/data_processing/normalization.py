@@ -0,0 +1,71 @@
+import unicodedata
+from collections.abc import Iterable
+
+import pandas as pd
+
+# Characters replaced before the Unicode normalization, since NFKD does not decompose them into ASCII
+PUNCTUATION_REPLACEMENTS = {"\u2013": "-"}  # en dash
+
+# Carriage returns escaped by Excel
+CARRIAGE_RETURN = "_x000D_"
+
+
+def clean_text(text: str) -> str:
+    """
+    Cleans the given text by normalizing Unicode characters, handling special symbols, replacing problematic characters,
+    and removing multiple whitespace. See `HTMLExtractor.clean_text`.
+
+    Pure ASCII text skips the Unicode normalization, which would not change it. Otherwise, the text is normalized with
+    NFKD and encoded to ASCII, so that accents and special symbols (e.g. copyright \\xa9) are dropped, non-breaking
+    spaces become spaces, and zero-width spaces and line and paragraph separators are removed.
+
+    Args:
+        text (str): The input text to be cleaned.
+
+    Returns:
+        str: The cleaned text.
+    """
+    if not text.isascii():
+        for char, replacement in PUNCTUATION_REPLACEMENTS.items():
+            text = text.replace(char, replacement)
+        text = (
+            unicodedata.normalize("NFKD", text)
+            .encode("ascii", "ignore")
+            .decode("ascii")
+        )
+
+    if CARRIAGE_RETURN in text:
+        text = text.replace(CARRIAGE_RETURN, "")
+
+    # Replace multiple whitespace with single space and strip the text
+    # `str.split` splits on the same whitespace characters as `\s` in `re`
+    return " ".join(text.split())
+
+
+def clean_texts(texts: Iterable[str]) -> list[str]:
+    """
+    Cleans a batch of texts. See `clean_text`.
+
+    Args:
+        texts (Iterable[str]): The texts to be cleaned.
+
+    Returns:
+        list[str]: The cleaned texts, in the same order as `texts`.
+    """
+    return [clean_text(text) for text in texts]
+
+
+def clean_column(series: pd.Series) -> pd.Series:
+    """
+    Cleans a column of texts. Each distinct text is cleaned once, and the missing values are kept as they are.
+
+    Args:
+        series (pd.Series): The column of texts to be cleaned.
+
+    Returns:
+        pd.Series: The cleaned column, with the same index as `series`.
+    """
+    texts = series.dropna().unique()
+    cleaned_texts = dict(zip(texts, clean_texts(texts)))
+
+    return series.map(cleaned_texts, na_action="ignore")
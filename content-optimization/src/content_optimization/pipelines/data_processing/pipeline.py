@@ -3,11 +3,20 @@
 generated using Kedro 0.19.6
 """
 
+from functools import partial
+
 from content_optimization.pipelines.data_processing.nodes import (
+    add_category,
     add_data,
+    extract_category,
     extract_data,
+    map_category,
     map_data,
+    merge_categories,
     merge_data,
+    report_categories_corrections,
+    report_corrections,
+    standardize_category,
     standardize_columns,
 )
 from kedro.pipeline import Pipeline, node, pipeline
@@ -23,6 +32,7 @@ def create_pipeline(**kwargs) -> Pipeline:
                     "params:columns_to_add",
                     "params:columns_to_keep",
                     "params:default_columns",
+                    "params:incremental",
                 ],
                 outputs="all_contents_standardized",
                 name="standardize_columns_node",
@@ -33,10 +43,22 @@ def create_pipeline(**kwargs) -> Pipeline:
                     "all_contents_standardized",
                     "missing_contents",
                     "params:updated_urls",
+                    "params:incremental",
                 ],
                 outputs="all_contents_added",
                 name="add_data_node",
             ),
+            node(
+                func=report_corrections,
+                inputs=[
+                    "all_contents_added",
+                    "missing_contents",
+                    "params:updated_urls",
+                    "params:blacklist",
+                ],
+                outputs="unmatched_corrections",
+                name="report_corrections_node",
+            ),
             node(
                 func=extract_data,
                 inputs=[
@@ -44,8 +66,20 @@ def create_pipeline(**kwargs) -> Pipeline:
                     "params:word_count_cutoff",
                     "params:whitelist",
                     "params:blacklist",
+                    "params:extraction.workers",
+                    "params:extraction.chunksize",
+                    "params:extraction.parser",
+                    "params:extraction.cache_path",
+                    "params:extraction.profile",
+                    "params:extraction.batch_size",
+                    "params:url_check",
+                    "params:incremental",
+                ],
+                outputs=[
+                    "all_contents_extracted",
+                    "all_extracted_text",
+                    "extraction_profile",
                 ],
-                outputs=["all_contents_extracted", "all_extracted_text"],
                 name="extract_data_node",
             ),
             node(
@@ -54,6 +88,7 @@ def create_pipeline(**kwargs) -> Pipeline:
                     "all_contents_extracted",
                     "params:l1_mappings",
                     "params:l2_mappings",
+                    "params:incremental",
                 ],
                 outputs="all_contents_mapped",
                 name="map_data_node",
@@ -64,8 +99,162 @@ def create_pipeline(**kwargs) -> Pipeline:
                     "all_contents_mapped",
                     "google_analytics_data",
                     "params:google_analytics_columns",
+                    "params:whitelist",
+                    "params:flag_duplicates_across_categories",
+                    "params:near_duplicates",
+                    "params:incremental",
+                ],
+                outputs=["merged_data", "near_duplicate_pairs"],
+                name="merge_data_node",
+            ),
+        ]
+    )
+
+
+def create_category_pipeline(content_category: str) -> Pipeline:
+    """
+    Creates the branch of the parallel pipeline that standardizes, adds, extracts and maps a single content category.
+
+    The branch is a modular pipeline namespaced by the content category, e.g. its outputs are
+    `<content_category>.all_contents_extracted`. The raw inputs and the parameters are shared by all branches.
+
+    Args:
+        content_category (str): The content category of the branch.
+
+    Returns:
+        Pipeline: The namespaced pipeline of the content category.
+    """
+    return pipeline(
+        [
+            node(
+                func=partial(standardize_category, content_category),
+                inputs=[
+                    "all_contents",
+                    "params:columns_to_add",
+                    "params:columns_to_keep",
+                    "params:default_columns",
+                ],
+                outputs="all_contents_standardized",
+                name="standardize_columns_node",
+            ),
+            node(
+                func=partial(add_category, content_category),
+                inputs=[
+                    "all_contents_standardized",
+                    "missing_contents",
+                    "params:updated_urls",
+                ],
+                outputs="all_contents_added",
+                name="add_data_node",
+            ),
+            node(
+                func=partial(extract_category, content_category),
+                inputs=[
+                    "all_contents_added",
+                    "params:word_count_cutoff",
+                    "params:whitelist",
+                    "params:blacklist",
+                    "params:extraction.workers",
+                    "params:extraction.chunksize",
+                    "params:extraction.parser",
+                    "params:extraction.cache_path",
+                    "params:extraction.profile",
+                    "params:extraction.batch_size",
+                    "params:url_check",
+                ],
+                outputs=[
+                    "all_contents_extracted",
+                    "all_extracted_text",
+                    "extraction_profile",
+                ],
+                name="extract_data_node",
+            ),
+            node(
+                func=partial(map_category, content_category),
+                inputs=[
+                    "all_contents_extracted",
+                    "params:l1_mappings",
+                    "params:l2_mappings",
+                ],
+                outputs="all_contents_mapped",
+                name="map_data_node",
+            ),
+        ],
+        namespace=content_category,
+        inputs={"all_contents", "missing_contents"},
+        parameters={
+            "columns_to_add",
+            "columns_to_keep",
+            "default_columns",
+            "updated_urls",
+            "word_count_cutoff",
+            "whitelist",
+            "blacklist",
+            "extraction.workers",
+            "extraction.chunksize",
+            "extraction.parser",
+            "extraction.cache_path",
+            "extraction.profile",
+            "extraction.batch_size",
+            "url_check",
+            "l1_mappings",
+            "l2_mappings",
+        },
+    )
+
+
+def create_parallel_pipeline(content_categories: list[str]) -> Pipeline:
+    """
+    Creates the data processing pipeline with an independent branch per content category, so that the branches can
+    be run concurrently with `kedro run --runner=ParallelRunner`. The branches fan in to a single merge node, and to
+    the node that reports the unmatched corrections.
+
+    The output is the same as the `data_processing` pipeline, except that incremental runs are not supported.
+
+    Args:
+        content_categories (list[str]): The content categories to run a branch for.
+
+    Returns:
+        Pipeline: The parallel data processing pipeline.
+    """
+    branches = sum(
+        (
+            create_category_pipeline(content_category)
+            for content_category in content_categories
+        ),
+        Pipeline([]),
+    )
+
+    return branches + pipeline(
+        [
+            node(
+                func=partial(report_categories_corrections, content_categories),
+                inputs=[
+                    "missing_contents",
+                    "params:updated_urls",
+                    "params:blacklist",
+                    *[
+                        f"{content_category}.all_contents_added"
+                        for content_category in content_categories
+                    ],
+                ],
+                outputs="unmatched_corrections",
+                name="report_corrections_node",
+            ),
+            node(
+                func=partial(merge_categories, content_categories),
+                inputs=[
+                    "google_analytics_data",
+                    "params:google_analytics_columns",
+                    "params:whitelist",
+                    "params:flag_duplicates_across_categories",
+                    "params:near_duplicates",
+                    *[
+                        f"{content_category}.all_contents_mapped"
+                        for content_category in content_categories
+                    ],
                 ],
-                outputs="merged_data",
+                outputs=["merged_data", "near_duplicate_pairs"],
                 name="merge_data_node",
             ),
         ]
@@ -0,0 +1,261 @@
+import glob
+import logging
+import os
+import time
+from concurrent.futures import Executor
+from typing import Any
+
+import pandas as pd
+from bs4 import element
+from content_optimization.pipelines.data_processing.extractor import HTMLExtractor
+
+# Set up logger in profiler.py
+# Edit conf/logging.yml to see changes
+logger = logging.getLogger(__name__)
+
+# The columns of the profile report, in order
+PROFILE_COLUMNS = [
+    "rank",
+    "id",
+    "content_category",
+    "content_name",
+    "full_url",
+    "total_seconds",
+    "parse_seconds",
+    "traverse_seconds",
+    *[f"{method}_seconds" for method in HTMLExtractor.extractors.values()],
+    "html_bytes",
+    "node_count",
+    "max_depth",
+    "table_count",
+]
+
+
+def get_tree_stats(soup: element.Tag) -> tuple[int, int]:
+    """
+    Counts the tags of a parsed HTML tree and its maximum depth.
+
+    Args:
+        soup (element.Tag): The root of the parsed HTML content.
+
+    Returns:
+        tuple[int, int]: The number of tags and the maximum depth of the tree.
+    """
+    node_count = 0
+    max_depth = 0
+    stack = [(soup, 0)]
+    while stack:
+        tag, depth = stack.pop()
+        max_depth = max(max_depth, depth)
+        for child in tag.children:
+            if isinstance(child, element.Tag):
+                node_count += 1
+                stack.append((child, depth + 1))
+
+    return node_count, max_depth
+
+
+def profile_article(
+    content_name: str,
+    content_category: str,
+    full_url: str,
+    html_content: str,
+    parser: str = "html.parser",
+) -> tuple[dict[str, Any], dict[str, Any]]:
+    """
+    Extracts all data from the HTML content of a single article, and records the time taken by each step.
+
+    The parse, the walk of the parsed tree (see `HTMLExtractor.traverse`) and each extractor method are timed
+    separately, in the same order as `HTMLExtractor.extract_all`. The size of the HTML content and of the parsed
+    tree are measured outside of the timed steps.
+
+    This function is defined at the module level so that it can be pickled and sent to worker processes.
+
+    Args:
+        content_name (str): The name of the article
+        content_category (str): The category of the article
+        full_url (str): The URL of the article
+        html_content (str): The HTML content to be processed.
+        parser (str): The BeautifulSoup parser to use. Defaults to "html.parser".
+
+    Returns:
+        tuple[dict[str, Any], dict[str, Any]]: The extracted data, the same as `HTMLExtractor.extract_all`, and the
+            profile of the article.
+    """
+    start = time.perf_counter()
+    extractor = HTMLExtractor(
+        content_name, content_category, full_url, html_content, parser
+    )
+    profile = {"parse_seconds": time.perf_counter() - start}
+
+    # `extract_text` modifies the parsed tree, so the tree is measured before extraction
+    node_count, max_depth = get_tree_stats(extractor.soup)
+
+    start = time.perf_counter()
+    traversal = extractor.traverse()
+    profile["traverse_seconds"] = time.perf_counter() - start
+
+    extracted = {}
+    for column, method in HTMLExtractor.extractors.items():
+        start = time.perf_counter()
+        extracted[column] = getattr(extractor, method)()
+        profile[f"{method}_seconds"] = time.perf_counter() - start
+
+    profile["total_seconds"] = sum(profile.values())
+    profile["html_bytes"] = (
+        len(html_content.encode("utf-8")) if isinstance(html_content, str) else 0
+    )
+    profile["node_count"] = node_count
+    profile["max_depth"] = max_depth
+    profile["table_count"] = len(traversal["table_tags"])
+
+    return extracted, profile
+
+
+def profile_articles(
+    articles: list[tuple[str, str, str, str]],
+    executor: Executor | None = None,
+    chunksize: int = 32,
+    parser: str = "html.parser",
+) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+    """
+    Extracts all data from a list of articles and profiles each article, optionally using an executor (e.g. a
+    process pool). See `extract_articles`.
+
+    Args:
+        articles (list[tuple[str, str, str, str]]): A list of `(content_name, content_category, full_url, html_content)`
+            tuples to extract.
+        executor (Executor | None): The executor to send the articles to. If None, the articles are extracted in the
+            current process. Defaults to None.
+        chunksize (int): The number of articles sent to a worker at a time. Defaults to 32.
+        parser (str): The BeautifulSoup parser to use. Defaults to "html.parser".
+
+    Returns:
+        tuple[list[dict[str, Any]], list[dict[str, Any]]]: The extracted data and the profile of each article, with
+            its content category, name and URL, in the same order as `articles`.
+    """
+    articles = [(*article, parser) for article in articles]
+
+    if executor is None or len(articles) == 0:
+        results = [profile_article(*article) for article in articles]
+    else:
+        results = list(
+            executor.map(profile_article, *zip(*articles), chunksize=chunksize)
+        )
+
+    profiles = [
+        {
+            "content_category": content_category,
+            "content_name": content_name,
+            "full_url": full_url,
+            **profile,
+        }
+        for (content_name, content_category, full_url, *_), (_, profile) in zip(
+            articles, results
+        )
+    ]
+
+    return [extracted for extracted, _ in results], profiles
+
+
+def get_profile_report(profiles: list[dict[str, Any]]) -> pd.DataFrame:
+    """
+    Ranks the profiled articles from the slowest to the fastest.
+
+    Args:
+        profiles (list[dict[str, Any]]): The profiles of the articles, with their id, content category, name and URL.
+
+    Returns:
+        pd.DataFrame: The profile report, ranked by the total time taken to extract each article.
+    """
+    report = pd.DataFrame(profiles, columns=PROFILE_COLUMNS[1:])
+    report = report.sort_values("total_seconds", ascending=False, ignore_index=True)
+    report.insert(0, "rank", range(1, len(report) + 1))
+
+    return report
+
+
+def log_profile_report(report: pd.DataFrame, top_n: int = 10) -> None:
+    """
+    Logs the slowest articles of the profile report.
+
+    Args:
+        report (pd.DataFrame): The profile report. See `get_profile_report`.
+        top_n (int): The number of articles to log. Defaults to 10.
+    """
+    logger.info(
+        f"Extraction Profile: {len(report)} articles extracted in {report['total_seconds'].sum():.2f} s"
+    )
+    for row in report.head(top_n).itertuples():
+        logger.info(
+            f"Extraction Profile - #{row.rank} {row.content_category} {row.id}: {row.total_seconds * 1000:.1f} ms "
+            f"(parse {row.parse_seconds * 1000:.1f} ms, {row.html_bytes} bytes, {row.node_count} nodes, "
+            f"depth {row.max_depth}, {row.table_count} tables)"
+        )
+
+
+def load_latest_report(filepath: str) -> pd.DataFrame | None:
+    """
+    Loads a profile report, or its latest version that profiled at least one article if it is versioned (i.e.
+    `filepath` is a directory of versions), since runs without profiling save an empty report.
+
+    Args:
+        filepath (str): The path to the profile report, e.g. "data/08_reporting/extraction_profile.csv".
+
+    Returns:
+        pd.DataFrame | None: The profile report, or None if no report with at least one article is found.
+    """
+    if os.path.isfile(filepath):
+        return pd.read_csv(filepath)
+
+    filename = os.path.basename(filepath)
+    for version_path in sorted(
+        glob.glob(os.path.join(filepath, "*", filename)), reverse=True
+    ):
+        report = pd.read_csv(version_path)
+        if len(report) > 0:
+            return report
+
+    return None
+
+
+def load_profile_report(filepath: str) -> pd.DataFrame:
+    """
+    Loads a profile report saved by the `extract_data_node`.
+
+    The `data_processing` pipeline saves a single report (e.g. "data/08_reporting/extraction_profile.csv"), while the
+    parallel pipeline saves a report per content category in a directory (e.g.
+    "data/08_reporting/extraction_profile/<content_category>.csv"). If `filepath` is such a directory, or the single
+    report is not found but the directory of the same name without the ".csv" suffix is, the latest version of each
+    content category is loaded and the reports are ranked together. See `load_latest_report`.
+
+    Args:
+        filepath (str): The path to the profile report, e.g. "data/08_reporting/extraction_profile.csv", or to the
+            directory of the reports of each content category, e.g. "data/08_reporting/extraction_profile".
+
+    Returns:
+        pd.DataFrame: The profile report. See `get_profile_report`.
+
+    Raises:
+        FileNotFoundError: If no profile report with at least one article is found.
+    """
+    if filepath.endswith(".csv"):
+        report = load_latest_report(filepath)
+        if report is not None:
+            return report
+
+    category_dir = filepath.removesuffix(".csv")
+    reports = [
+        report
+        for report_path in sorted(glob.glob(os.path.join(category_dir, "*.csv")))
+        if (report := load_latest_report(report_path)) is not None
+    ]
+    if reports:
+        report = pd.concat(reports, ignore_index=True).drop(columns="rank")
+        report = report.sort_values("total_seconds", ascending=False, ignore_index=True)
+        report.insert(0, "rank", range(1, len(report) + 1))
+        return report
+
+    raise FileNotFoundError(
+        f"No profile report found in {filepath}. Set `extraction.profile` to true and run the `extract_data_node`."
+    )
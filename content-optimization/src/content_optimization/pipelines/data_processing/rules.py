@@ -0,0 +1,390 @@
+import logging
+import time
+from typing import Any, Callable
+
+import pandas as pd
+from content_optimization.pipelines.data_processing.url_checker import URLChecker
+from pandas.util import hash_pandas_object
+
+# Set up logger in rules.py
+# Edit conf/logging.yml to see changes
+logger = logging.getLogger(__name__)
+
+# The features computed from `extracted_content_body`, which can be computed for batches of articles and passed to
+# the `FlagRuleEngine` instead of the extracted content body itself
+CONTENT_FEATURES = [
+    "has_content",
+    "empty_content",
+    "recipe_content",
+    "word_count",
+    "content_digest",
+]
+
+
+class ArticleFeatures:
+    """
+    The precomputed columns of the articles that the flag rules are declared over.
+
+    Each feature is computed at most once, on first access, and shared by all rules. The raw columns of the
+    articles (e.g. `title`) are also available as features. Features can also be precomputed (e.g. the
+    `CONTENT_FEATURES` of batches of articles), so that the columns they are computed from are not needed.
+
+    Attributes:
+        df (pd.DataFrame): The DataFrame containing the articles.
+        whitelist (list[int]): The list of article IDs to keep. See https://bitly.cx/IlwNV.
+    """
+
+    def __init__(
+        self,
+        df: pd.DataFrame,
+        whitelist: list[int],
+        features: dict[str, pd.Series] | None = None,
+    ) -> None:
+        self.df = df
+        self.whitelist = whitelist
+        self._features = dict(features or {})
+        self._computations = {
+            "whitelisted": lambda: self.df["id"].isin(self.whitelist),
+            "has_content": lambda: self.df["extracted_content_body"].notna(),
+            "empty_content": lambda: self.df["extracted_content_body"] == "",
+            "content_lower": lambda: self.text("extracted_content_body").str.lower(),
+            "recipe_content": lambda: self["content_lower"].str.contains(
+                r"what [do ]?you need", na=False
+            )
+            & self["content_lower"].str.contains(r"how to cook [this dish]*", na=False),
+            "word_count": self._word_count,
+            "content_digest": lambda: hash_pandas_object(
+                self.df["extracted_content_body"], index=False
+            ),
+            "url_digest": lambda: hash_pandas_object(self.df["full_url"], index=False),
+        }
+
+    def __getitem__(self, name: str) -> pd.Series:
+        if name not in self._features:
+            if name in self._computations:
+                self._features[name] = self._computations[name]()
+            else:
+                self._features[name] = self.df[name]
+
+        return self._features[name]
+
+    def _word_count(self) -> pd.Series:
+        # Use the word count emitted at extraction, if any (see `add_text_stats`)
+        if "word_count" in self.df:
+            return self.df["word_count"].astype(float).fillna(0)
+
+        return (
+            self.text("extracted_content_body")
+            .str.split()
+            .str.len()
+            .astype(float)
+            .fillna(0)
+        )
+
+    def text(self, column: str) -> pd.Series:
+        """
+        Gets a column as an object column, so that the `.str` accessor also works for columns with only null values.
+
+        Args:
+            column (str): The name of the column.
+
+        Returns:
+            pd.Series: The column as an object column.
+        """
+        return self.df[column].astype(object)
+
+
+class FlagRule:
+    """
+    A rule that flags articles to remove, declared as a boolean mask over the `ArticleFeatures`.
+
+    Attributes:
+        name (str): The name of the rule used in the logs.
+        mask (Callable[[ArticleFeatures, pd.Series], pd.Series]): A function that takes the features and the current
+            `to_remove` column, and returns the boolean mask of the articles to flag.
+        remove_type (str | Callable[[ArticleFeatures], pd.Series]): The `remove_type` of the flagged articles, or a
+            function that returns the `remove_type` of each article.
+        skip_flagged (bool): Whether to ignore articles that were already flagged. If False, the `remove_type` of
+            flagged articles is overwritten.
+        respect_whitelist (bool): Whether to ignore whitelisted articles.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        mask: Callable[[ArticleFeatures, pd.Series], pd.Series],
+        remove_type: str | Callable[[ArticleFeatures], pd.Series],
+        skip_flagged: bool = True,
+        respect_whitelist: bool = True,
+    ) -> None:
+        self.name = name
+        self.mask = mask
+        self.remove_type = remove_type
+        self.skip_flagged = skip_flagged
+        self.respect_whitelist = respect_whitelist
+
+
+class FlagRuleEngine:
+    """
+    Applies flag rules to articles in order of precedence.
+
+    Each rule is evaluated as a single vectorized mask over the shared `ArticleFeatures`. Rules are applied in
+    order, so a rule that skips flagged articles never overwrites an earlier rule, and a rule that does not skip
+    flagged articles overrides all earlier rules. Whitelisted articles are ignored by the rules that respect the
+    whitelist.
+
+    Attributes:
+        rules (list[FlagRule]): The rules in order of precedence.
+        stats (list[dict[str, Any]]): The number of flagged articles and the time taken by each rule in the last run.
+    """
+
+    def __init__(self, rules: list[FlagRule]) -> None:
+        self.rules = rules
+        self.stats = []
+
+    def apply(
+        self,
+        df: pd.DataFrame,
+        whitelist: list[int],
+        features: dict[str, pd.Series] | None = None,
+    ) -> pd.DataFrame:
+        """
+        Applies the rules to the articles.
+
+        Args:
+            df (pd.DataFrame): The DataFrame containing the articles.
+            whitelist (list[int]): The list of article IDs to keep. See https://bitly.cx/IlwNV.
+            features (dict[str, pd.Series] | None): The precomputed features of the articles. See `ArticleFeatures`.
+                Defaults to None.
+
+        Returns:
+            pd.DataFrame: The DataFrame with the `to_remove` and `remove_type` columns updated.
+        """
+        features = ArticleFeatures(df, whitelist, features)
+        to_remove = df["to_remove"].copy()
+        remove_type = df["remove_type"].copy()
+
+        self.stats = []
+        for rule in self.rules:
+            start = time.perf_counter()
+            mask = rule.mask(features, to_remove).fillna(False).astype(bool)
+            if rule.skip_flagged:
+                mask &= ~to_remove.astype(bool)
+            if rule.respect_whitelist:
+                mask &= ~features["whitelisted"]
+
+            # Update `to_remove`
+            to_remove[mask] = True
+
+            # Set `remove_type` for all flagged articles
+            remove_type[mask] = (
+                rule.remove_type
+                if isinstance(rule.remove_type, str)
+                else rule.remove_type(features)[mask]
+            )
+
+            seconds = time.perf_counter() - start
+            self.stats.append(
+                {"rule": rule.name, "flagged": int(mask.sum()), "seconds": seconds}
+            )
+            logger.debug(
+                f"Flag Rule - {rule.name}: {int(mask.sum())} flagged in {seconds * 1000:.1f} ms"
+            )
+
+        df["to_remove"] = to_remove
+        df["remove_type"] = remove_type
+
+        return df
+
+    def log_stats(self, description: str) -> None:
+        """
+        Logs the number of flagged articles and the time taken by each rule in the last run.
+
+        Args:
+            description (str): The description to log the stats with (e.g. the content category).
+        """
+        summary = ", ".join(
+            f"{stat['rule']}: {stat['flagged']} ({stat['seconds'] * 1000:.1f} ms)"
+            for stat in self.stats
+        )
+        logger.info(f"Flag Rules - {description}: {summary}")
+
+
+def no_extracted_content_mask(features: ArticleFeatures, _: pd.Series) -> pd.Series:
+    return features["empty_content"]
+
+
+def recipe_mask(features: ArticleFeatures, _: pd.Series) -> pd.Series:
+    # `title` and `keywords` column
+    title_keywords = features.text("title").str.contains(
+        r"[rR]ecipes?", na=False
+    ) | features.text("keywords").str.contains(r"[rR]ecipes?", na=False)
+
+    # `extracted_content_body` column
+    return title_keywords | features["recipe_content"]
+
+
+def duplicated_mask(
+    digests: pd.Series,
+    not_null: pd.Series,
+    to_remove: pd.Series,
+    empty: pd.Series | None = None,
+) -> pd.Series:
+    """
+    Gets the mask of all occurrences (including the first instance) of the values that are duplicated among the
+    articles that were not flagged yet.
+
+    Args:
+        digests (pd.Series): The 64-bit hashes of the values, so that each value is only compared by its digest.
+        not_null (pd.Series): The mask of the values that are not null.
+        to_remove (pd.Series): The current `to_remove` column.
+        empty (pd.Series | None): The mask of the empty values to ignore. Defaults to None (empty values are not
+            ignored).
+
+    Returns:
+        pd.Series: The mask of the duplicated articles that were not flagged yet.
+    """
+    duplicated = (
+        (digests.duplicated(keep="first"))  # first instance is not a duplicate
+        & not_null  # ignore null values
+        & (~to_remove.astype(bool))  # ignore articles that were already flagged
+    )
+    if empty is not None:
+        duplicated &= ~empty  # ignore empty extracted content
+
+    return digests.isin(digests[duplicated]) & not_null
+
+
+def duplicated_content_mask(
+    features: ArticleFeatures, to_remove: pd.Series
+) -> pd.Series:
+    return duplicated_mask(
+        features["content_digest"],
+        features["has_content"],
+        to_remove,
+        features["empty_content"],
+    )
+
+
+def duplicated_url_mask(features: ArticleFeatures, to_remove: pd.Series) -> pd.Series:
+    return duplicated_mask(
+        features["url_digest"], features["full_url"].notna(), to_remove
+    )
+
+
+def multilingual_mask(features: ArticleFeatures, _: pd.Series) -> pd.Series:
+    # Get the last word from the friendly_url
+    check_lang = (
+        features.text("friendly_url").str.split("_").str[-1].str.split("-").str[-1]
+    )
+    return check_lang.str.lower().str.contains("(?:chinese|tamil|malay)", na=False)
+
+
+NO_EXTRACTED_CONTENT = FlagRule(
+    "No Extracted Content",
+    no_extracted_content_mask,
+    "No Extracted Content",
+    skip_flagged=False,
+)
+RECIPE = FlagRule("Recipe", recipe_mask, "Recipe")
+DUPLICATED_CONTENT = FlagRule(
+    "Duplicated Content", duplicated_content_mask, "Duplicated Content"
+)
+DUPLICATED_URL = FlagRule("Duplicated URL", duplicated_url_mask, "Duplicated URL")
+MULTILINGUAL = FlagRule("Multilingual", multilingual_mask, "Multilingual")
+
+
+def below_word_count_rule(word_count_cutoff: int) -> FlagRule:
+    """
+    Creates the rule that flags articles with a word count in the extracted content body below the cutoff.
+
+    Args:
+        word_count_cutoff (int): The word count threshold for flagging articles.
+
+    Returns:
+        FlagRule: The rule with the `remove_type` of "Below Word Count".
+    """
+
+    def mask(features: ArticleFeatures, _: pd.Series) -> pd.Series:
+        word_count = features["word_count"]
+        return (word_count > 0) & (word_count <= word_count_cutoff)
+
+    return FlagRule("Below Word Count", mask, "Below Word Count")
+
+
+def blacklist_rule(blacklist: dict[int, str]) -> FlagRule:
+    """
+    Creates the rule that flags blacklisted articles. This rule overrides all other rules and the whitelist.
+
+    Args:
+        blacklist (dict[int, str]): A dictionary containing the article IDs and the reason to remove it.
+            See https://bitly.cx/f8FIk.
+
+    Returns:
+        FlagRule: The rule with the `remove_type` of the reason to remove each article.
+    """
+    return FlagRule(
+        "Blacklist",
+        lambda features, _: features["id"].isin(blacklist),
+        lambda features: features["id"].map(blacklist),
+        skip_flagged=False,
+        respect_whitelist=False,
+    )
+
+
+def url_error_rule(url_check: dict[str, Any] | None = None) -> FlagRule:
+    """
+    Creates the rule that flags articles whose URL returns an error, such as a 404, 400 or exception error. This rule
+    overrides all other rules.
+
+    Args:
+        url_check (dict[str, Any] | None): The keyword arguments of the `URLChecker`. Defaults to None.
+
+    Returns:
+        FlagRule: The rule with the `remove_type` of "URL Error".
+    """
+
+    def mask(features: ArticleFeatures, _: pd.Series) -> pd.Series:
+        # Safely retrieve 'full_url', defaulting to an empty string if not found
+        df = features.df
+        urls = df.get("full_url", pd.Series("", index=df.index)).astype(object)
+        # Exclude whitelisted articles for URL 404 error check
+        checked = ~features["whitelisted"] & urls.map(bool)
+        # Non-string URLs (e.g. NaN) are checked as strings and flagged as invalid URLs
+        urls = urls[checked].map(str)
+
+        results = URLChecker(**(url_check or {})).check_urls(urls.tolist())
+
+        # If URL returns (1) 404, (2) 400 or (3) request exception error
+        url_exists = urls.map(lambda url: results[url][0])
+        return checked & ~url_exists.reindex(df.index, fill_value=True)
+
+    return FlagRule("URL Error", mask, "URL Error", skip_flagged=False)
+
+
+def get_post_extraction_rules(
+    word_count_cutoff: int,
+    blacklist: dict[int, str],
+    url_check: dict[str, Any] | None = None,
+) -> list[FlagRule]:
+    """
+    Gets the rules that flag articles to remove after extraction, in order of precedence.
+
+    Args:
+        word_count_cutoff (int): The word count threshold for flagging articles.
+        blacklist (dict[int, str]): The list of article IDs to remove. See https://bitly.cx/f8FIk.
+        url_check (dict[str, Any] | None): The keyword arguments of the `URLChecker`. Defaults to None.
+
+    Returns:
+        list[FlagRule]: The rules in order of precedence.
+    """
+    return [
+        NO_EXTRACTED_CONTENT,
+        RECIPE,
+        DUPLICATED_CONTENT,
+        DUPLICATED_URL,
+        MULTILINGUAL,
+        below_word_count_rule(word_count_cutoff),
+        blacklist_rule(blacklist),
+        url_error_rule(url_check),
+    ]
@@ -0,0 +1,142 @@
+import pickle
+import tempfile
+from collections.abc import Iterator, Mapping
+
+import pandas as pd
+
+
+def spill(directory: tempfile.TemporaryDirectory, data: object) -> str:
+    """
+    Pickles data to a new file in the spill directory.
+
+    Args:
+        directory (tempfile.TemporaryDirectory): The spill directory.
+        data (object): The data to spill.
+
+    Returns:
+        str: The path to the spilled file.
+    """
+    with tempfile.NamedTemporaryFile(
+        dir=directory.name, suffix=".pkl", delete=False
+    ) as f:
+        pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    return f.name
+
+
+def unspill(filepath: str) -> object:
+    """
+    Loads data spilled by `spill`.
+
+    Args:
+        filepath (str): The path to the spilled file.
+
+    Returns:
+        object: The spilled data.
+    """
+    with open(filepath, "rb") as f:
+        return pickle.load(f)
+
+
+class SpilledBatches:
+    """
+    The batches of a DataFrame spilled to disk, which are loaded back one at a time on each iteration.
+
+    Columns can be overridden after the batches are spilled (e.g. the flags computed over all batches), and are set
+    on each batch as it is loaded. The `CompactParquetDataset` saves the batches as row groups, without loading them
+    all into memory.
+
+    The spilled files are removed together with the spill directory, when it is no longer referenced.
+
+    Attributes:
+        directory (tempfile.TemporaryDirectory): The spill directory.
+    """
+
+    def __init__(self, directory: tempfile.TemporaryDirectory) -> None:
+        self.directory = directory
+        self._filepaths = []
+        self._overrides = None
+
+    def append(self, df: pd.DataFrame) -> None:
+        """
+        Spills a batch.
+
+        Args:
+            df (pd.DataFrame): The batch to spill.
+        """
+        self._filepaths.append(spill(self.directory, df))
+
+    def override(self, df: pd.DataFrame) -> None:
+        """
+        Overrides columns of the spilled batches.
+
+        Args:
+            df (pd.DataFrame): The columns to override, with the same index as the concatenated batches.
+        """
+        self._overrides = df
+
+    def __iter__(self) -> Iterator[pd.DataFrame]:
+        for filepath in self._filepaths:
+            df = unspill(filepath)
+            if self._overrides is not None:
+                for column in self._overrides.columns:
+                    df[column] = self._overrides.loc[df.index, column]
+            yield df
+
+    def __len__(self) -> int:
+        return len(self._filepaths)
+
+
+class SpilledTexts(Mapping[str, str]):
+    """
+    The extracted texts spilled to disk in batches, which are loaded back one batch at a time.
+
+    The `PackedTextDataset` saves the texts with `items`, without loading them all into memory. Looking up a single
+    text scans the batches, so prefer `items` to iterate over the texts.
+
+    Attributes:
+        directory (tempfile.TemporaryDirectory): The spill directory.
+    """
+
+    def __init__(self, directory: tempfile.TemporaryDirectory) -> None:
+        self.directory = directory
+        self._filepaths = []
+        self._len = 0
+
+    def append(self, texts: dict[str, str]) -> None:
+        """
+        Spills a batch of texts.
+
+        Args:
+            texts (dict[str, str]): The texts keyed by the path of the text file without the suffix.
+        """
+        self._filepaths.append(spill(self.directory, texts))
+        self._len += len(texts)
+
+    def _iter_batches(self) -> Iterator[dict[str, str]]:
+        for filepath in self._filepaths:
+            yield unspill(filepath)
+
+    def __getitem__(self, key: str) -> str:
+        for texts in self._iter_batches():
+            if key in texts:
+                return texts[key]
+
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        for texts in self._iter_batches():
+            yield from texts
+
+    def __len__(self) -> int:
+        return self._len
+
+    def items(self) -> Iterator[tuple[str, str]]:
+        """
+        Streams the texts in the order they were spilled.
+
+        Yields:
+            tuple[str, str]: The key and the text.
+        """
+        for texts in self._iter_batches():
+            yield from texts.items()
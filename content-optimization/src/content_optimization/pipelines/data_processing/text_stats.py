@@ -0,0 +1,122 @@
+import html
+import re
+import string
+
+import pandas as pd
+
+# The text statistics added to the extracted data, in order
+TEXT_STATS_COLUMNS = [
+    "word_count",
+    "char_count",
+    "sentence_count",
+    "readability_word_count",
+    "letter_count",
+    "latin_ratio",
+    "han_ratio",
+    "tamil_ratio",
+]
+
+# Hyperlinks are removed before the readability inputs are counted
+HYPERLINK_PATTERN = r"https?:\/\/[^\s]+"
+PUNCTUATION = re.escape(string.punctuation)
+# A sentence is a run of characters between newlines and sentence delimiters, with at least one non-whitespace
+SENTENCE_PATTERN = r"[^\n.!?\S]*[^\n.!?\s][^\n.!?]*"
+# A word is a run of characters between whitespace and sentence delimiters, with at least one non-punctuation
+WORD_PATTERN = rf"[^\s.!?]*[^\s{PUNCTUATION}][^\s.!?]*"
+LETTER_PATTERN = rf"[^\s{PUNCTUATION}]"
+
+# The scripts of the languages of the articles (Malay is written in the Latin script)
+SCRIPT_PATTERNS = {
+    "latin": "[A-Za-zÀ-ɏ]",  # Basic Latin, Latin-1 Supplement and Latin Extended-A/B
+    "han": "[㐀-䶿一-鿿]",  # CJK Unified Ideographs and Extension A
+    "tamil": "[஀-௿]",
+}
+TAG_PATTERN = r"<[^>]*>"
+
+
+def get_text_stats(texts: pd.Series) -> pd.DataFrame:
+    """
+    Counts the words, characters and readability inputs of the extracted texts in a vectorized pass.
+
+    `word_count` is the number of whitespace-delimited words, as in `len(text.split())`. The readability inputs
+    (`sentence_count`, `readability_word_count` and `letter_count`) are counted as in the Hemingway readability score
+    of the article harmonisation (see `hemmingway_score` in `article-harmonisation/utils/evaluations.py`), i.e.
+    without hyperlinks, with sentences split on newlines and ".!?", and with punctuation removed from the words.
+    Missing texts are counted as empty texts.
+
+    Args:
+        texts (pd.Series): The extracted texts (e.g. `extracted_content_body`).
+
+    Returns:
+        pd.DataFrame: The word, character, sentence and letter counts of each text, with the same index as `texts`.
+    """
+    texts = texts.astype(object).fillna("")
+    filtered_texts = texts.str.replace(HYPERLINK_PATTERN, "", regex=True)
+
+    return pd.DataFrame(
+        {
+            "word_count": texts.str.count(r"\S+"),
+            "char_count": texts.str.len(),
+            "sentence_count": filtered_texts.str.count(SENTENCE_PATTERN),
+            "readability_word_count": filtered_texts.str.count(WORD_PATTERN),
+            "letter_count": filtered_texts.str.count(LETTER_PATTERN),
+        },
+        index=texts.index,
+        dtype="int64",
+    )
+
+
+def get_script_ratios(html_contents: pd.Series) -> pd.DataFrame:
+    """
+    Computes the share of the Latin, Han and Tamil scripts among the characters of these scripts in the HTML content.
+
+    The ratios are computed on the visible text of the HTML content, since the extracted text is normalized to ASCII.
+    The ratios are NaN if the HTML content has no characters of these scripts.
+
+    Args:
+        html_contents (pd.Series): The HTML contents (e.g. `content_body`).
+
+    Returns:
+        pd.DataFrame: The `<script>_ratio` of each HTML content, with the same index as `html_contents`.
+    """
+    visible_texts = (
+        html_contents.astype(object)
+        .fillna("")
+        .str.replace(TAG_PATTERN, " ", regex=True)
+        .map(html.unescape)
+    )
+    counts = pd.DataFrame(
+        {
+            script: visible_texts.str.count(pattern)
+            for script, pattern in SCRIPT_PATTERNS.items()
+        },
+        index=html_contents.index,
+        dtype="float64",
+    )
+    totals = counts.sum(axis=1).replace(0, float("nan"))
+
+    return counts.div(totals, axis=0).add_suffix("_ratio")
+
+
+def add_text_stats(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Adds the `TEXT_STATS_COLUMNS` of the extracted articles, so that they are computed once at extraction and read by
+    the downstream stages instead of recounting each article.
+
+    Args:
+        df (pd.DataFrame): The DataFrame containing the articles with `content_body` and `extracted_content_body`.
+
+    Returns:
+        pd.DataFrame: The DataFrame with the text statistics columns.
+    """
+    stats = pd.concat(
+        [
+            get_text_stats(df["extracted_content_body"]),
+            get_script_ratios(df["content_body"]),
+        ],
+        axis=1,
+    )
+    for column in TEXT_STATS_COLUMNS:
+        df[column] = stats[column]
+
+    return df
@@ -0,0 +1,271 @@
+import asyncio
+import logging
+import os
+import sqlite3
+import time
+from collections import defaultdict
+from typing import Optional
+from urllib.parse import urlsplit
+
+import aiohttp
+
+# Set up logger in url_checker.py
+# Edit conf/logging.yml to see changes
+logger = logging.getLogger(__name__)
+
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/58.0.3029.110 Safari/537.36"
+}
+
+# Constant variable of where error status is 400 or above
+ERROR_STATUS_CODE = 400
+
+# Status codes of responses that are retried with backoff
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+class URLChecker:
+    """
+    An asynchronous URL checker that flags URLs that return an error, such as a 404, 400 or exception error.
+
+    All URLs are checked concurrently over a pool of keep-alive connections, with a limit on the number of
+    connections per host. A request only starts once a connection is free, so that its timeout does not include the
+    time spent waiting for the other requests to the same host. If `soft_404_markers` is set, each URL is downloaded
+    with a single GET request, so that soft "404 error" pages served with a 200 status are found. Otherwise, each URL
+    is checked with a HEAD request, without downloading the page, and with a GET request if the HEAD request returns
+    an error (e.g. servers that do not allow HEAD requests). Requests that fail or return a transient error are
+    retried with exponential backoff.
+
+    If `cache_path` is provided, the results of URLs that responded are stored in a SQLite database and reused
+    for `ttl_hours` hours. Requests that raised an exception are never cached.
+
+    Attributes:
+        cache_path (Optional[str]): The path to the SQLite database of results. None to disable the cache.
+        ttl_hours (float): The number of hours a cached result is reused for.
+        max_connections (int): The maximum number of concurrent connections.
+        max_connections_per_host (int): The maximum number of concurrent connections per host.
+        timeout (float): The timeout of each request in seconds.
+        retries (int): The number of retries of a failed request.
+        backoff (float): The delay in seconds before the first retry, doubled for every subsequent retry.
+        soft_404_markers (list[str]): The lowercase texts that mark a page as not found. If empty, the URLs are
+            checked with HEAD requests and pages are never downloaded.
+    """
+
+    def __init__(
+        self,
+        cache_path: Optional[str] = None,
+        ttl_hours: float = 24,
+        max_connections: int = 32,
+        max_connections_per_host: int = 8,
+        timeout: float = 15,
+        retries: int = 2,
+        backoff: float = 0.5,
+        soft_404_markers: Optional[list[str]] = None,
+    ) -> None:
+        self.cache_path = cache_path
+        self.ttl_hours = ttl_hours
+        self.max_connections = max_connections
+        self.max_connections_per_host = max_connections_per_host
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.soft_404_markers = (
+            ["404 error"] if soft_404_markers is None else soft_404_markers
+        )
+
+    def check_urls(self, urls: list[str]) -> dict[str, tuple[bool, str]]:
+        """
+        Checks if the URLs exist.
+
+        Args:
+            urls (list[str]): The URLs to check. Duplicated URLs are only checked once.
+
+        Returns:
+            dict[str, tuple[bool, str]]: A dictionary mapping the URLs to whether they exist and the status, which is
+                one of "URL exists", "404 error", "400 error" or the exception message.
+        """
+        urls = list(dict.fromkeys(urls))
+        results = self._load_cached_results(urls)
+        unchecked = [url for url in urls if url not in results]
+
+        if unchecked:
+            checked = asyncio.run(self._check_urls(unchecked))
+            self._store_results(checked)
+            results.update({url: result for url, (result, _) in checked.items()})
+
+        logger.info(
+            f"URL Checker: checked {len(unchecked)} URLs, reused {len(urls) - len(unchecked)} cached results"
+        )
+
+        return results
+
+    async def _check_urls(
+        self, urls: list[str]
+    ) -> dict[str, tuple[tuple[bool, str], bool]]:
+        """
+        Checks the URLs concurrently over a shared connection pool.
+
+        Args:
+            urls (list[str]): The URLs to check.
+
+        Returns:
+            dict[str, tuple[tuple[bool, str], bool]]: A dictionary mapping the URLs to the result and whether the
+                result can be cached.
+        """
+        connector = aiohttp.TCPConnector(
+            limit=self.max_connections, limit_per_host=self.max_connections_per_host
+        )
+        timeout = aiohttp.ClientTimeout(total=self.timeout)
+        # The requests wait for a free connection before their timeout starts
+        self._semaphore = asyncio.Semaphore(self.max_connections)
+        self._host_semaphores = defaultdict(
+            lambda: asyncio.Semaphore(self.max_connections_per_host)
+        )
+
+        async with aiohttp.ClientSession(
+            connector=connector, timeout=timeout, headers=HEADERS
+        ) as session:
+            results = await asyncio.gather(
+                *[self._check_url(session, url) for url in urls]
+            )
+
+        return dict(zip(urls, results))
+
+    async def _request(
+        self, session: aiohttp.ClientSession, method: str, url: str
+    ) -> tuple[int, str]:
+        """
+        Sends a request once a connection to the host of the URL is free.
+
+        Args:
+            session (aiohttp.ClientSession): The session to send the request with.
+            method (str): The method of the request, i.e. "GET" or "HEAD".
+            url (str): The URL to request.
+
+        Returns:
+            tuple[int, str]: The status code and the lowercase page content, which is empty for HEAD requests.
+        """
+        host_semaphore = self._host_semaphores[urlsplit(url).netloc]
+        async with self._semaphore, host_semaphore:
+            async with session.request(method, url, allow_redirects=True) as response:
+                page_content = (
+                    (await response.text(errors="replace")).lower()
+                    if method == "GET"
+                    else ""
+                )
+                return response.status, page_content
+
+    async def _check_url(
+        self, session: aiohttp.ClientSession, url: str
+    ) -> tuple[tuple[bool, str], bool]:
+        """
+        Checks if a URL exists with a GET request, or with a HEAD request if there are no `soft_404_markers`, falling
+        back to a GET request if the HEAD request returns an error.
+
+        Args:
+            session (aiohttp.ClientSession): The session to send the requests with.
+            url (str): The URL to check.
+
+        Returns:
+            tuple[tuple[bool, str], bool]: The result and whether the result can be cached.
+        """
+        for attempt in range(self.retries + 1):
+            if attempt > 0:
+                await asyncio.sleep(self.backoff * 2 ** (attempt - 1))
+            try:
+                if self.soft_404_markers:
+                    # Get page content to check if it contains 404 error
+                    status, page_content = await self._request(session, "GET", url)
+                else:
+                    # The page content is not needed without soft 404 markers
+                    status, page_content = await self._request(session, "HEAD", url)
+                    # Some servers reject HEAD requests (e.g. 405 or 501), so confirm errors with a GET request
+                    if status >= ERROR_STATUS_CODE:
+                        status, _ = await self._request(session, "GET", url)
+                if status in RETRY_STATUS_CODES and attempt < self.retries:
+                    continue
+
+                # Check if page contains "404 error" in its content
+                if any(marker in page_content for marker in self.soft_404_markers):
+                    return (False, "404 error"), True
+                # If response is error status code, treat it as not existing
+                elif status >= ERROR_STATUS_CODE:
+                    return (False, "400 error"), True
+                else:
+                    return (True, "URL exists"), True
+            # If exception is raised, treat it as not existing
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                if attempt == self.retries:
+                    return (False, str(e) or type(e).__name__), False
+
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Connects to the SQLite database of results and creates it if it does not exist.
+
+        Returns:
+            sqlite3.Connection: The connection to the database.
+        """
+        os.makedirs(os.path.dirname(self.cache_path) or ".", exist_ok=True)
+        connection = sqlite3.connect(self.cache_path)
+        connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS url_checks (
+                url TEXT PRIMARY KEY,
+                url_exists INTEGER NOT NULL,
+                status TEXT NOT NULL,
+                checked_at REAL NOT NULL
+            )
+            """
+        )
+
+        return connection
+
+    def _load_cached_results(self, urls: list[str]) -> dict[str, tuple[bool, str]]:
+        """
+        Loads the cached results of the URLs that were checked in the last `ttl_hours` hours.
+
+        Args:
+            urls (list[str]): The URLs to look up.
+
+        Returns:
+            dict[str, tuple[bool, str]]: A dictionary mapping the URLs found in the cache to their results.
+        """
+        if self.cache_path is None:
+            return {}
+
+        results = {}
+        expiry = time.time() - self.ttl_hours * 60 * 60
+        connection = self._connect()
+        for url in urls:
+            row = connection.execute(
+                "SELECT url_exists, status FROM url_checks WHERE url = ? AND checked_at >= ?",
+                (url, expiry),
+            ).fetchone()
+            if row is not None:
+                results[url] = (bool(row[0]), row[1])
+        connection.close()
+
+        return results
+
+    def _store_results(self, checked: dict[str, tuple[tuple[bool, str], bool]]) -> None:
+        """
+        Stores the cacheable results of the checked URLs.
+
+        Args:
+            checked (dict[str, tuple[tuple[bool, str], bool]]): A dictionary mapping the URLs to the result and
+                whether the result can be cached.
+        """
+        if self.cache_path is None:
+            return
+
+        connection = self._connect()
+        connection.executemany(
+            "INSERT OR REPLACE INTO url_checks VALUES (?, ?, ?, ?)",
+            [
+                (url, int(url_exists), status, time.time())
+                for url, ((url_exists, status), cacheable) in checked.items()
+                if cacheable
+            ],
+        )
+        connection.commit()
+        connection.close()
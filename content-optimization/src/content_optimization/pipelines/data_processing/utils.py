@@ -1,9 +1,35 @@
+import os
 import re
 import warnings
+from concurrent.futures import Executor
+from typing import Any, Callable
 
-import numpy as np
 import pandas as pd
-import requests
+from content_optimization.pipelines.data_processing.cache import (
+    ExtractionCache,
+    hash_html,
+)
+from content_optimization.pipelines.data_processing.extractor import HTMLExtractor
+from content_optimization.pipelines.data_processing.profiler import profile_articles
+from content_optimization.pipelines.data_processing.rules import (
+    CONTENT_FEATURES,
+    DUPLICATED_CONTENT,
+    DUPLICATED_URL,
+    MULTILINGUAL,
+    NO_EXTRACTED_CONTENT,
+    RECIPE,
+    ArticleFeatures,
+    FlagRuleEngine,
+    below_word_count_rule,
+    blacklist_rule,
+    get_post_extraction_rules,
+    url_error_rule,
+)
+from content_optimization.pipelines.data_processing.spill import (
+    SpilledBatches,
+    SpilledTexts,
+)
+from content_optimization.pipelines.data_processing.text_stats import add_text_stats
 from pandas.errors import SettingWithCopyWarning
 
 warnings.filterwarnings("ignore", category=SettingWithCopyWarning)
@@ -62,6 +88,348 @@ def select_and_rename_columns(
     return df
 
 
+def strip_whitespaces(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Strips the leading and trailing whitespaces of all strings in a DataFrame.
+
+    This is equivalent to `df.map(lambda x: x.strip() if isinstance(x, str) else x)`, but only the object columns
+    are visited. Columns of strings are stripped with the vectorized `str.strip`, which keeps the null values (None
+    or NaN) as they are, and columns that mix strings with other types are stripped elementwise.
+
+    Args:
+        df (pd.DataFrame): The DataFrame to strip.
+
+    Returns:
+        pd.DataFrame: The DataFrame with all strings stripped.
+    """
+    for column in df.columns[df.dtypes == object]:
+        series = df[column]
+        if pd.api.types.infer_dtype(series, skipna=True) == "string":
+            df[column] = series.str.strip()
+        else:
+            # Same as `df.map`, including the inference of the dtype (e.g. null values only become float)
+            df[column] = series.map(lambda x: x.strip() if isinstance(x, str) else x)
+
+    return df
+
+
+def extract_article(
+    content_name: str,
+    content_category: str,
+    full_url: str,
+    html_content: str,
+    parser: str = "html.parser",
+) -> dict[str, Any]:
+    """
+    Extracts all data from the HTML content of a single article.
+
+    This function is defined at the module level so that it can be pickled and sent to worker processes.
+
+    Args:
+        content_name (str): The name of the article
+        content_category (str): The category of the article
+        full_url (str): The URL of the article
+        html_content (str): The HTML content to be processed.
+        parser (str): The BeautifulSoup parser to use. Defaults to "html.parser".
+
+    Returns:
+        dict[str, Any]: A dictionary mapping the extracted column names to the extracted values.
+    """
+    extractor = HTMLExtractor(
+        content_name, content_category, full_url, html_content, parser
+    )
+
+    return extractor.extract_all()
+
+
+def extract_articles(
+    articles: list[tuple[str, str, str, str]],
+    executor: Executor | None = None,
+    chunksize: int = 32,
+    parser: str = "html.parser",
+) -> list[dict[str, Any]]:
+    """
+    Extracts all data from a list of articles, optionally using an executor (e.g. a process pool).
+
+    Args:
+        articles (list[tuple[str, str, str, str]]): A list of `(content_name, content_category, full_url, html_content)`
+            tuples to extract.
+        executor (Executor | None): The executor to send the articles to. If None, the articles are extracted in the
+            current process. Defaults to None.
+        chunksize (int): The number of articles sent to a worker at a time. Defaults to 32.
+        parser (str): The BeautifulSoup parser to use. Defaults to "html.parser".
+
+    Returns:
+        list[dict[str, Any]]: The extracted data of each article, in the same order as `articles`.
+    """
+    articles = [(*article, parser) for article in articles]
+
+    if executor is None or len(articles) == 0:
+        return [extract_article(*article) for article in articles]
+
+    return list(executor.map(extract_article, *zip(*articles), chunksize=chunksize))
+
+
+def extract_articles_with_cache(
+    articles: list[tuple[str, str, str, str]],
+    ids: list[int],
+    cache: ExtractionCache | None = None,
+    executor: Executor | None = None,
+    chunksize: int = 32,
+    parser: str = "html.parser",
+    profile: bool = False,
+) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+    """
+    Extracts all data from a list of articles, looking up each article in the extraction cache first.
+
+    Only the articles that are not found in the cache are extracted (see `extract_articles`) and then added to the
+    cache. If `profile` is True, the cache is not looked up and every article is profiled instead (see
+    `profile_articles`), but the extracted data is still added to the cache.
+
+    Args:
+        articles (list[tuple[str, str, str, str]]): A list of `(content_name, content_category, full_url, html_content)`
+            tuples to extract.
+        ids (list[int]): The id of each article, in the same order as `articles`.
+        cache (ExtractionCache | None): The extraction cache. Defaults to None (no cache).
+        executor (Executor | None): The executor to send the articles to. Defaults to None.
+        chunksize (int): The number of articles sent to a worker at a time. Defaults to 32.
+        parser (str): The BeautifulSoup parser to use. Defaults to "html.parser".
+        profile (bool): Whether to profile the extraction of each article. Defaults to False.
+
+    Returns:
+        tuple[list[dict[str, Any]], list[dict[str, Any]]]: The extracted data of each article, in the same order as
+            `articles`, and the profile of each article with its id (empty if `profile` is False).
+    """
+    extracted_articles = [None] * len(articles)
+    if cache is not None:
+        html_hashes = [hash_html(article[1], article[3]) for article in articles]
+    if cache is not None and not profile:
+        extracted_articles = [
+            cache.get(article_id, html_hash)
+            for article_id, html_hash in zip(ids, html_hashes)
+        ]
+        # Do not hold the lock on the cache while extracting
+        cache.commit()
+    misses = [i for i, extracted in enumerate(extracted_articles) if extracted is None]
+
+    profiles = []
+    if profile:
+        extracted_misses, article_profiles = profile_articles(
+            [articles[i] for i in misses], executor, chunksize, parser
+        )
+        profiles = [
+            {"id": ids[i], **article_profile}
+            for i, article_profile in zip(misses, article_profiles)
+        ]
+    else:
+        extracted_misses = extract_articles(
+            [articles[i] for i in misses], executor, chunksize, parser
+        )
+
+    for i, extracted in zip(misses, extracted_misses):
+        extracted_articles[i] = extracted
+        if cache is not None:
+            cache.put(ids[i], html_hashes[i], extracted)
+    if cache is not None:
+        cache.commit()
+
+    return extracted_articles, profiles
+
+
+def get_content_category(filename: str) -> str:
+    """
+    Gets the content category of a raw partition from its filename.
+
+    Args:
+        filename (str): The filename of the raw partition (e.g. "export-published-programs_<date>").
+
+    Returns:
+        str: The content category (e.g. "programs").
+    """
+    return re.sub(r"export-published-", "", filename.split("_")[0])
+
+
+def get_text_key(content_category: str, title: str, article_id: int) -> str:
+    """
+    Gets the key of the extracted text of an article, i.e. the path of its text file without the suffix.
+
+    Args:
+        content_category (str): The category of the article.
+        title (str): The title of the article.
+        article_id (int): The id of the article.
+
+    Returns:
+        str: The key of the extracted text, i.e. "<content_category>/<title>_<id>".
+    """
+    # Replace all forward slashes with hyphens to avoid saving as folders
+    title = re.sub(r"\/", "-", title).strip()
+
+    # Substitute forbidden characters for filenames with _
+    title = re.sub(r'[<>:"/\\|?*]', "_", title)
+
+    # Truncate title to 25 characters and append the id
+    # See: https://github.com/Wilsven/healthhub-content-optimization/issues/42
+    title = title[:25] + f"_{article_id}"
+
+    # Store text files in its own folder named `content_category`
+    return os.path.join(content_category, title)
+
+
+def extract_contents(
+    df: pd.DataFrame,
+    content_category: str,
+    whitelist: list[int],
+    cache: ExtractionCache | None = None,
+    executor: Executor | None = None,
+    chunksize: int = 32,
+    parser: str = "html.parser",
+    profile: bool = False,
+) -> tuple[pd.DataFrame, dict[str, str], list[dict[str, Any]]]:
+    """
+    Extracts the articles of a content category and stores the extracted data in new columns.
+
+    Articles flagged for removal are not extracted, unless they are whitelisted. See `extract_articles_with_cache`.
+    The text statistics of the extracted articles are added as the `TEXT_STATS_COLUMNS`. See `add_text_stats`.
+
+    Args:
+        df (pd.DataFrame): The DataFrame containing the articles.
+        content_category (str): The content category of the articles.
+        whitelist (list[int]): The list of article IDs to keep. See https://bitly.cx/IlwNV.
+        cache (ExtractionCache | None): The extraction cache. Defaults to None (no cache).
+        executor (Executor | None): The executor to send the articles to. Defaults to None.
+        chunksize (int): The number of articles sent to a worker at a time. Defaults to 32.
+        parser (str): The BeautifulSoup parser to use. Defaults to "html.parser".
+        profile (bool): Whether to profile the extraction of each article. Defaults to False.
+
+    Returns:
+        tuple[pd.DataFrame, dict[str, str], list[dict[str, Any]]]: The DataFrame with the extracted data, the
+            extracted text keyed by `get_text_key`, and the profile of each article (empty if `profile` is False).
+    """
+    # Initialise new columns in dataframe to store extracted data
+    df["has_table"] = False
+    df["has_image"] = False
+    df["related_sections"] = None
+    df["extracted_tables"] = None
+    df["extracted_raw_html_tables"] = None
+    df["extracted_links"] = None
+    df["extracted_headers"] = None
+    df["extracted_images"] = None
+    df["extracted_content_body"] = None
+    df["extracted_sections"] = None
+
+    # Collect the articles to extract
+    indexes = []
+    articles = []
+    for index, row in df.iterrows():
+        # Skip extraction for those articles flagged for removal unless whitelisted
+        if row["to_remove"]:
+            # Check if the article is in the whitelist
+            if row["id"] not in whitelist:
+                continue
+            else:
+                # Whitelist article
+                df.at[index, "to_remove"] = False
+
+        # Get the HTML content for extraction and relevant data for logging
+        indexes.append(index)
+        articles.append(
+            (
+                row["content_name"],
+                content_category,
+                row["full_url"],
+                row["content_body"],
+            )
+        )
+
+    # Extract text from HTML using the HTMLExtractor Class, unless found in the extraction cache
+    extracted_articles, profiles = extract_articles_with_cache(
+        articles,
+        [df.at[index, "id"] for index in indexes],
+        cache,
+        executor,
+        chunksize,
+        parser,
+        profile,
+    )
+
+    extracted_text = {}
+    for index, extracted in zip(indexes, extracted_articles):
+        # Store extracted data into the dataframe
+        for column, value in extracted.items():
+            df.at[index, column] = value
+
+        key = get_text_key(content_category, df.at[index, "title"], df.at[index, "id"])
+        extracted_text[key] = extracted["extracted_content_body"]
+
+    # Compute the text statistics once, for the downstream stages to read
+    df = add_text_stats(df)
+
+    return df, extracted_text, profiles
+
+
+def extract_contents_in_batches(
+    df: pd.DataFrame,
+    batch_size: int,
+    extract: Callable[
+        [pd.DataFrame], tuple[pd.DataFrame, dict[str, str], list[dict[str, Any]]]
+    ],
+    flag: Callable[..., pd.DataFrame],
+    texts: SpilledTexts,
+) -> tuple[SpilledBatches, list[dict[str, Any]]]:
+    """
+    Extracts the articles of a content category in batches, and spills each extracted batch and its texts to disk.
+
+    Only the columns needed to flag the articles after extraction are kept in memory, together with the
+    `CONTENT_FEATURES` of each batch. The articles are flagged once all batches are extracted, so that the flags are
+    the same as when the content category is extracted at once. The flags are set on each batch when it is loaded
+    back (e.g. when it is saved).
+
+    Args:
+        df (pd.DataFrame): The DataFrame containing the articles.
+        batch_size (int): The number of articles extracted at a time.
+        extract (Callable[[pd.DataFrame], tuple[pd.DataFrame, dict[str, str], list[dict[str, Any]]]]): The function
+            that extracts a batch of articles. See `extract_contents`.
+        flag (Callable[..., pd.DataFrame]): The function that flags the articles after extraction, given the
+            articles without their content and the precomputed content `features`. See
+            `flag_articles_to_remove_after_extraction`.
+        texts (SpilledTexts): The spilled texts to add the extracted texts of each batch to.
+
+    Returns:
+        tuple[SpilledBatches, list[dict[str, Any]]]: The spilled batches with their flags, and the profile of each
+            article.
+    """
+    heavy_columns = ["content_body", *HTMLExtractor.extractors]
+    batches = SpilledBatches(texts.directory)
+    flag_frames = []
+    feature_frames = []
+    profiles = []
+
+    # An empty content category is extracted as a single empty batch
+    for start in range(0, max(len(df), 1), batch_size):
+        batch, extracted_text, batch_profiles = extract(
+            df.iloc[start : start + batch_size].copy()
+        )
+        texts.append(extracted_text)
+        profiles.extend(batch_profiles)
+
+        # The content features do not depend on the whitelist
+        features = ArticleFeatures(batch, [])
+        feature_frames.append(
+            pd.DataFrame({name: features[name] for name in CONTENT_FEATURES})
+        )
+        flag_frames.append(batch.drop(columns=heavy_columns))
+        batches.append(batch)
+        del batch, extracted_text
+
+    flagged = flag(
+        pd.concat(flag_frames),
+        features=pd.concat(feature_frames).to_dict(orient="series"),
+    )
+    batches.override(flagged[["to_remove", "remove_type"]])
+
+    return batches, profiles
+
+
 def flag_articles_to_remove_before_extraction(
     df: pd.DataFrame, regex: str = r"(<[div|p|h2].*?>)"
 ) -> pd.DataFrame:
@@ -128,23 +496,7 @@ def flag_no_extracted_content(df: pd.DataFrame, whitelist: list[int]) -> pd.Data
             The modified DataFrame with the `to_remove` and `remove_type` columns updated. The `remove_type` column is
             updated with the type of "No Extracted Content".
     """
-    # All content ids without extracted content
-    no_extracted_content_ids = set(
-        df[df["extracted_content_body"] == ""].id.to_list()
-    ).difference(set(whitelist))
-
-    # All content without extracted content indexes
-    no_extracted_content_indexes = df.query(
-        f"id in {list(no_extracted_content_ids)}"
-    ).index
-
-    # Update `to_remove`
-    df.loc[no_extracted_content_indexes, "to_remove"] = True
-
-    # Set `remove_type` for all indexes
-    df.loc[no_extracted_content_indexes, "remove_type"] = "No Extracted Content"
-
-    return df
+    return FlagRuleEngine([NO_EXTRACTED_CONTENT]).apply(df, whitelist)
 
 
 def flag_duplicated(
@@ -172,47 +524,9 @@ def flag_duplicated(
     assert column is not None, "`column` cannot be None"
     assert column in ["extracted_content_body", "full_url"], "Invalid column"
 
-    if column == "extracted_content_body":
-        duplicated_df = df[
-            (
-                df[column].duplicated(keep="first")
-            )  # we want duplicated articles, first instance is not flagged
-            & (df[column].notna())  # ignore null values
-            & (df[column] != "")  # ignore empty extracted content
-            & (~df["to_remove"])  # ignore articles that were already flagged
-        ]
+    rule = DUPLICATED_CONTENT if column == "extracted_content_body" else DUPLICATED_URL
 
-        value = "Duplicated Content"
-
-    elif column == "full_url":
-        duplicated_df = df[
-            (
-                df[column].duplicated(keep="first")
-            )  # we want duplicated URLs, first instance is not flagged
-            & (df[column].notna())  # ignore null values
-            & (~df["to_remove"])  # ignore articles that were already flagged
-        ]
-
-        value = "Duplicated URL"
-
-    for i in range(len(duplicated_df)):
-        # Get all indexes for duplicated content or URL
-        duplicated_indexes = df[df[column] == duplicated_df.iloc[i][column]].index
-
-        # Note: We could simply update all at once at `duplicated_indexes`
-        # However, we'd overwrite the previous flags. This is kept as is, for now.
-        for j in duplicated_indexes:
-            if not df.iloc[j]["to_remove"]:
-                # Ignore whitelisted articles
-                if df.iloc[j]["id"] in whitelist:
-                    continue
-                # Update `to_remove`
-                df.at[j, "to_remove"] = True
-
-                # Set `remove_type` for all indexes (either "Duplicated Content" or "Duplicated URL")
-                df.at[j, "remove_type"] = value
-
-    return df
+    return FlagRuleEngine([rule]).apply(df, whitelist)
 
 
 def flag_recipe_articles(df: pd.DataFrame, whitelist: list[int]) -> pd.DataFrame:
@@ -229,62 +543,7 @@ def flag_recipe_articles(df: pd.DataFrame, whitelist: list[int]) -> pd.DataFrame
             The modified DataFrame with the `to_remove` and `remove_type` columns updated. The `remove_type` column is
             updated with the type of "Recipe".
     """
-
-    # `title` and `keywords` column
-    recipe_title_keywords_indexes = np.argwhere(
-        [
-            (
-                True
-                if (
-                    (title is not None and re.search(r"[rR]ecipes?", title))
-                    or (keywords is not None and re.search(r"[rR]ecipes?", keywords))
-                )
-                and (not to_remove)
-                else False
-            )
-            for title, keywords, to_remove in zip(
-                df["title"], df["keywords"], df["to_remove"]
-            )
-        ]
-    ).flatten()
-
-    # `extracted_content_body` column
-    recipe_content_indexes = np.argwhere(
-        [
-            (
-                True
-                if (
-                    content is not None
-                    and re.search(r"what [do ]?you need", content.lower())
-                    and re.search(r"how to cook [this dish]*", content.lower())
-                )
-                and (not to_remove)
-                else False
-            )
-            for content, to_remove in zip(df["extracted_content_body"], df["to_remove"])
-        ]
-    ).flatten()
-
-    # All recipe article indexes
-    all_recipe_indexes = list(
-        set(recipe_title_keywords_indexes).union(set(recipe_content_indexes))
-    )
-
-    # All content ids that are flagged as recipes
-    recipe_ids = set(df.iloc[all_recipe_indexes].id.to_list()).difference(
-        set(whitelist)
-    )
-
-    # All content below word count cutoff indexes
-    recipe_indexes = df.query(f"id in {list(recipe_ids)}").index
-
-    # Update `to_remove`
-    df.loc[recipe_indexes, "to_remove"] = True
-
-    # Set `remove_type` for all indexes
-    df.loc[recipe_indexes, "remove_type"] = "Recipe"
-
-    return df
+    return FlagRuleEngine([RECIPE]).apply(df, whitelist)
 
 
 def flag_below_word_count_cutoff(
@@ -304,29 +563,10 @@ def flag_below_word_count_cutoff(
             The DataFrame with a new column `to_remove` indicating whether an article should be removed. The `remove_type`
             column is also updated with the type of "Below Word Count".
     """
-    indexes = df.query("to_remove != True")["extracted_content_body"].apply(
-        lambda x: len(x.split()) > 0 and len(x.split()) <= word_count_cutoff
+    return FlagRuleEngine([below_word_count_rule(word_count_cutoff)]).apply(
+        df, whitelist
     )
 
-    # Get the indexes of the True values
-    all_word_count_indexes = indexes[indexes].index
-
-    # All content ids below word count cutoff
-    word_count_ids = set(df.iloc[all_word_count_indexes].id.to_list()).difference(
-        set(whitelist)
-    )
-
-    # All content below word count cutoff indexes
-    word_count_indexes = df.query(f"id in {list(word_count_ids)}").index
-
-    # Update `to_remove`
-    df.loc[word_count_indexes, "to_remove"] = True
-
-    # Set `remove_type` for all indexes
-    df.loc[word_count_indexes, "remove_type"] = "Below Word Count"
-
-    return df
-
 
 def flag_multilingual_content(df: pd.DataFrame, whitelist: list[int]) -> pd.DataFrame:
     """
@@ -341,52 +581,7 @@ def flag_multilingual_content(df: pd.DataFrame, whitelist: list[int]) -> pd.Data
             The DataFrame with a new column `to_remove` indicating whether an article should be removed. The `remove_type`
             column is also updated with the type of "Multilingual".
     """
-
-    def find_multilingual(friendly_url: str | None = None) -> bool:
-        """
-        A function that checks if a friendly URL is purely Chinese, Malay, or Tamil.
-
-        Args:
-            friendly_url (str | None): The friendly URL to check.
-
-        Returns:
-            bool: True if the friendly URL is purely Chinese, Malay, or Tamil, False otherwise.
-        """
-        # Return false if value is None
-        if friendly_url is None:
-            return False
-
-        # Get the last word from the friendly_url
-        check_lang = friendly_url.split("_")[-1].split("-")[-1]
-        return True if re.search("(chinese|tamil|malay)", check_lang.lower()) else False
-
-    # Find articles that are purely Chinese, Malay or Tamil
-    all_multilingual_indexes = df.index[
-        df["friendly_url"].apply(find_multilingual)
-    ].to_list()
-
-    # Find articles that are already considered as `to_remove`
-    removed_indexes = df.index[df["to_remove"]].to_list()
-
-    # Filter out `removed_indexes` from all_multilingual_indexes
-    filtered_multilingual_indexes = list(
-        set(all_multilingual_indexes).difference(set(removed_indexes))
-    )
-    # Filter out multilingual articles that are not whitelisted
-    multilingual_ids = set(
-        df.iloc[filtered_multilingual_indexes].id.to_list()
-    ).difference(set(whitelist))
-
-    # All content mulitlingual indexes
-    multilingual_indexes = df.query(f"id in {list(multilingual_ids)}").index
-
-    # Update `to_remove`
-    df.loc[multilingual_indexes, "to_remove"] = True
-
-    # Set `remove_type` for all indexes
-    df.loc[multilingual_indexes, "remove_type"] = "Multilingual"
-
-    return df
+    return FlagRuleEngine([MULTILINGUAL]).apply(df, whitelist)
 
 
 def flag_articles_via_blacklist(
@@ -402,81 +597,29 @@ def flag_articles_via_blacklist(
     Returns:
         pd.DataFrame: The DataFrame with updated flags for articles to remove.
     """
-    for article_id, remove_type in blacklist.items():
-        idx = df.loc[df["id"] == article_id].index
-        df.loc[idx, "to_remove"] = True
-        df.loc[idx, "remove_type"] = remove_type
-
-    return df
+    return FlagRuleEngine([blacklist_rule(blacklist)]).apply(df, [])
 
 
-def flag_url_error(df: pd.DataFrame, whitelist: list[int]) -> pd.DataFrame:
+def flag_url_error(
+    df: pd.DataFrame, whitelist: list[int], url_check: dict[str, Any] | None = None
+) -> pd.DataFrame:
     """
     Flags rows in the given DataFrame where the URL returns an error, such as a 404, 400 or exception error.
 
+    The URLs are checked concurrently by the `URLChecker`. See `url_checker.py`.
+
     Args:
         df (pd.DataFrame): The DataFrame containing the articles.
         whitelist (list[int]): The list of article IDs to keep. See https://bitly.cx/IlwNV.
+        url_check (dict[str, Any] | None): The keyword arguments of the `URLChecker` (e.g. connection limits,
+            retries and the result cache). Defaults to None (default `URLChecker` without a result cache).
 
     Returns:
         pd.DataFrame:
             The modified DataFrame with the `to_remove` and `remove_type` columns updated for articles with flagged URL Error.
             The `remove_type` column is updated with the type of "URL Error".
     """
-
-    # Function to check if URL exists via requests
-    def check_url_exists(url):
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/58.0.3029.110 Safari/537.36"
-        }
-        try:
-            # Get response of URL
-            response = requests.get(
-                url, headers=headers, allow_redirects=True, timeout=15
-            )
-            # Get page content to check if it contains 404 error
-            page_content = response.text.lower()
-            # Constant variable of where error status is 400 or above
-            errorStatusCode = 400
-            # Check if page contains "404 error" in its content
-            if "404 error" in page_content:
-                return False, "404 error"
-            # If response is error status code, treat it as not existing
-            elif response.status_code >= errorStatusCode:
-                return False, "400 error"
-            # If no exception is raised, URL exists
-            else:
-                return True, "URL exists"
-        # If exception is raised, treat it as not existing
-        except requests.RequestException as e:
-            return False, str(e)
-
-    no_url_error_content_ids = []
-    # Load through merged_dataset to check validity of URLs
-    for idx, row in df.iterrows():
-        # Exclude whitelisted articles for URL 404 error check
-        if row["id"] not in whitelist:
-            url = row.get(
-                "full_url", ""
-            )  # Safely retrieve 'full_url', defaulting to an empty string if not found
-            if url:
-                url_exists, status = check_url_exists(url)
-                # If URL returns (1) 404, (2) 400 or (3) request exception error
-                if not url_exists:
-                    no_url_error_content_ids.append(row["id"])
-
-    # All article urls with 404 errors indexes
-    no_url_error_content_indexes = df.query(
-        f"id in {list(no_url_error_content_ids)}"
-    ).index
-
-    # Update `to_remove`
-    df.loc[no_url_error_content_indexes, "to_remove"] = True
-
-    # Set `remove_type` for all indexes, rewrite for those that are already flagged
-    df.loc[no_url_error_content_indexes, "remove_type"] = "URL Error"
-
-    return df
+    return FlagRuleEngine([url_error_rule(url_check)]).apply(df, whitelist)
 
 
 def flag_articles_to_remove_after_extraction(
@@ -484,72 +627,36 @@ def flag_articles_to_remove_after_extraction(
     word_count_cutoff: int,
     whitelist: list[int],
     blacklist: dict[int, str],
+    url_check: dict[str, Any] | None = None,
+    features: dict[str, pd.Series] | None = None,
 ) -> pd.DataFrame:
     """
     Flags articles to remove after extraction based on several different criteria.
 
+    The criteria are declared as rules in `rules.py` and applied by the `FlagRuleEngine` in order of precedence. The
+    number of flagged articles and the time taken by each rule are logged.
+
     Args:
         df (pd.DataFrame): The DataFrame containing the articles.
         word_count_cutoff (int): The word count threshold for flagging articles.
         whitelist (list[int]): The list of article IDs to keep. See https://bitly.cx/IlwNV.
         blacklist (dict[int, str]): The list of article IDs to remove. See https://bitly.cx/f8FIk.
+        url_check (dict[str, Any] | None): The keyword arguments of the `URLChecker`. Defaults to None.
+        features (dict[str, pd.Series] | None): The precomputed `CONTENT_FEATURES` of the articles, if the DataFrame
+            does not contain the extracted content body. Defaults to None.
 
     Returns:
         pd.DataFrame: The DataFrame with updated flags for articles to remove.
     """
-    df = flag_no_extracted_content(df, whitelist)
-    df = flag_recipe_articles(df, whitelist)
-    df = flag_duplicated(df, whitelist, column="extracted_content_body")
-    df = flag_duplicated(df, whitelist, column="full_url")
-    df = flag_multilingual_content(df, whitelist)
-    df = flag_below_word_count_cutoff(df, word_count_cutoff, whitelist)
-    df = flag_articles_via_blacklist(df, blacklist)
-    df = flag_url_error(df, whitelist)
-
-    return df
-
-
-def add_content_body(df: pd.DataFrame, excel_errors: dict[str, str]) -> pd.DataFrame:
-    """
-    Args:
-        df (pd.DataFrame): The DataFrame containing the articles
-        excel_errors (dict[str,str]): A dictionary that maps each article friendly url to the updated content body
-
-    Returns:
-        pd.DataFrame: The DataFrame with updated content body for articles with Excel errors.
-    """
-    for friendly_url, text in excel_errors.items():
-        # Fetch rows where `friendly_url` column value must match filename
-        article_index = df.index[df["friendly_url"] == friendly_url]
-        # Skip if the index is empty
-        if article_index.empty:
-            continue
-        # Assign Raw HTML content to `content_body` column
-        df.loc[article_index, "content_body"] = text
-
-    return df
-
-
-def add_updated_urls(
-    df: pd.DataFrame, new_urls: dict[str, dict[str, str]]
-) -> pd.DataFrame:
-    """
-    Args:
-        df (pd.DataFrame): The DataFrame containing the articles
-        new_urls: A dictionary that maps each article id to the updated full_url
-
-    Returns:
-        pd.DataFrame: The DataFrame with updated full_url for articles with known 404 errors
-    """
-    for article_id, url in new_urls.items():
-        # Fetch rows where `id` column value must match article_id
-        article_index = df.index[df["id"] == article_id]
-        # Skip if the index is empty
-        if article_index.empty:
-            continue
-        # Assign updated_url to `full_url` and `full_url2` column
-        df.loc[article_index, "full_url"] = url
-        df.loc[article_index, "full_url2"] = url
+    engine = FlagRuleEngine(
+        get_post_extraction_rules(word_count_cutoff, blacklist, url_check)
+    )
+    df = engine.apply(df, whitelist, features)
+    engine.log_stats(
+        ", ".join(df["content_category"].dropna().unique())
+        if "content_category" in df.columns
+        else "all articles"
+    )
 
     return df
 
@@ -647,3 +754,91 @@ def map_category_names(
             )
 
     return df
+
+
+def map_all_category_names(
+    mappings: dict[str, dict[str, dict[str, str]]],
+    df: pd.DataFrame,
+    content_category_column: str,
+    reference_column: str,
+) -> pd.DataFrame:
+    """
+    Vectorized version of `map_category_names` that maps multiple IA mapping levels (e.g. L1 and L2) at once.
+
+    The reference column is split and exploded once, and joined with a single lookup table of all levels. The
+    mapped values are then de-duplicated in the order of their first occurrence and aggregated back into
+    " | "-joined strings.
+
+    Args:
+        mappings (dict[str, dict[str, dict[str, str]]]): A dictionary that maps the newly created column names for the
+            IA mappings to the inverted mappings of each level. See `invert_ia_mappings`.
+        df (pd.DataFrame): The DataFrame containing the articles
+        content_category_column (str): Refer to the column name of the content category (i.e. "content_category")
+        reference_column (str): Refer to the column name of the article category (i.e. "article_category_names")
+
+    Returns:
+        pd.DataFrame: The DataFrame with updated IA mappings for each content category
+    """
+    # Initially assign the new columns to None
+    for new_column_name in mappings:
+        df[new_column_name] = None
+
+    # Replace Ampersand symbol ("&") to "and" for string values only
+    is_string = df[reference_column].map(lambda x: isinstance(x, str)).astype(bool)
+    category_strings = (
+        df.loc[is_string, reference_column]
+        .astype(str)
+        .str.replace("&", "and", regex=False)
+    )
+    if is_string.any():
+        df.loc[is_string, reference_column] = category_strings
+
+    # Split all category strings once and remove empty strings
+    category_names = category_strings.str.split(",").explode()
+    category_names = category_names[category_names.str.strip().str.len() > 0]
+    exploded_df = pd.DataFrame(
+        {
+            "row": category_names.index,
+            content_category_column: df.loc[
+                category_names.index, content_category_column
+            ].to_numpy(),
+            reference_column: category_names.to_numpy(),
+        }
+    )
+
+    # Lookup table of the IA mappings of all levels
+    lookup_df = None
+    for new_column_name, inverted_mappings in mappings.items():
+        level_df = pd.DataFrame(
+            [
+                (content_category, category_name, ia_map.strip())
+                for content_category, category_map in inverted_mappings.items()
+                for category_name, ia_map in category_map.items()
+            ],
+            columns=[content_category_column, reference_column, new_column_name],
+        )
+        lookup_df = (
+            level_df
+            if lookup_df is None
+            else lookup_df.merge(
+                level_df, on=[content_category_column, reference_column], how="outer"
+            )
+        )
+
+    if lookup_df is None or exploded_df.empty:
+        return df
+
+    mapped_df = exploded_df.merge(
+        lookup_df, on=[content_category_column, reference_column], how="left"
+    )
+
+    for new_column_name in mappings:
+        # Keep unique and non-null values only, in the order of their first occurrence
+        mapped = mapped_df[["row", new_column_name]].dropna().drop_duplicates()
+        # Assign the new mappings as a joined string and assign a null value if empty string
+        joined = mapped.groupby("row", sort=False)[new_column_name].agg(" | ".join)
+        joined = joined.str.strip()
+        joined = joined[joined != ""]
+        df.loc[joined.index, new_column_name] = joined.to_numpy()
+
+    return df
@@ -170,7 +170,8 @@ def generate_embeddings(
             for id in embeddings_data["id"].unique():
                 text = embeddings_data.query("id == @id")[col_name].values[0]
 
-                if not text:
+                # Null text may be loaded as `pd.NA` from Arrow-backed strings
+                if pd.isna(text) or not text:
                     # Store empty array
                     dim = sentence_transformer.get_sentence_embedding_dimension()
                     embeddings = np.empty((dim,), dtype=np.float32)
@@ -0,0 +1,56 @@
+from pathlib import Path
+from typing import Any
+
+from content_optimization.service.pool import ExtractionPool
+from content_optimization.service.routes.extract.extract_router import extractRouter
+from fastapi import FastAPI
+from kedro.framework.project import settings
+from kedro.framework.startup import bootstrap_project
+
+
+def load_parameters() -> dict[str, Any]:
+    """
+    Loads the parameters of the project, as in a `kedro run`.
+
+    :return: dict[str, Any]
+    """
+    project_path = Path(__file__).resolve().parents[3]
+    bootstrap_project(project_path)
+    conf_source = project_path / settings.CONF_SOURCE
+    config_loader = settings.CONFIG_LOADER_CLASS(
+        conf_source=str(conf_source), **settings.CONFIG_LOADER_ARGS
+    )
+
+    return config_loader["parameters"]
+
+
+class AppBuilder:
+
+    @classmethod
+    def get_instance(cls) -> FastAPI:
+        """
+        Produces the FastAPI instance of the extraction service and registers
+        its routers. The warm extraction pool is started with the application.
+
+        :return: FastAPI
+        """
+
+        app = FastAPI()
+
+        # Startup and shutdown events and injections
+        @app.on_event("startup")
+        async def startup_event():
+            parameters = load_parameters()
+            app.state.extraction_pool = ExtractionPool(
+                parameters["extraction_service"]["workers"],
+                parameters["extraction"]["parser"],
+            )
+
+        @app.on_event("shutdown")
+        async def shutdown_event():
+            app.state.extraction_pool.shutdown()
+
+        # Register routers here
+        app.include_router(extractRouter)
+
+        return app
@@ -0,0 +1,6 @@
+from content_optimization.service.pool import ExtractionPool
+from fastapi import Request
+
+
+def get_pool(request: Request) -> ExtractionPool:
+    return request.app.state.extraction_pool
@@ -0,0 +1,27 @@
+"""
+On-demand extraction service, which extracts all data from a batch of articles with a warm pool of `HTMLExtractor`
+worker processes.
+
+Run from the `content-optimization` directory:
+
+    python -m content_optimization.service.main
+"""
+
+import uvicorn
+from content_optimization.service.app_builder import AppBuilder
+
+app = AppBuilder.get_instance()
+
+
+def dev():
+    uvicorn.run(
+        "content_optimization.service.main:app",
+        host="127.0.0.1",
+        port=8001,
+        log_level="info",
+        workers=1,  # the extraction pool has its own worker processes
+    )
+
+
+if __name__ == "__main__":
+    dev()
@@ -0,0 +1,66 @@
+from typing import List, Optional, Tuple
+
+from pydantic import BaseModel, Field
+
+
+class ArticleHTML(BaseModel):
+    id: int = Field()
+    html: str = Field()
+    # The extraction depends on the content category (e.g. the containers of "programs" and "program-sub-pages" are
+    # extracted recursively), so it is required to extract an article as in the `data_processing` pipeline
+    content_category: str = Field(min_length=1)
+
+    # Only used in the logs of the extractor
+    content_name: str = Field(default="")
+    full_url: str = Field(default="")
+
+
+class ExtractionRequest(BaseModel):
+    articles: List[ArticleHTML] = Field()
+
+
+class Section(BaseModel):
+    """
+    A section of the section tree of an article, see `HTMLExtractor.extract_sections`
+    """
+
+    level: int = Field()  # 0 for the root section, 1 to 6 for h1 to h6
+    header: str = Field()
+    start: int = Field()  # offsets of the paragraphs in `extracted_content_body`
+    end: int = Field()
+    parent: int = Field()  # -1 for the root section
+    tables: List[int] = Field()  # indexes in `extracted_tables`
+
+
+class ExtractedArticle(BaseModel):
+    """
+    The columns extracted by the `extract_data` node of the `data_processing` pipeline
+    """
+
+    id: int = Field()
+
+    has_table: bool = Field()
+    has_image: bool = Field()
+    related_sections: List[str] = Field()
+    # None if the article has no table, and an empty table is None
+    extracted_tables: Optional[List[Optional[List[List[str]]]]] = Field()
+    extracted_raw_html_tables: Optional[List[str]] = Field()
+    extracted_links: List[Tuple[str, str]] = Field()  # (text, url)
+    extracted_headers: List[Tuple[str, str]] = Field()  # (text, tag name)
+    extracted_images: List[Tuple[str, Optional[str]]] = Field()  # (alt text, url)
+    extracted_content_body: str = Field()
+    extracted_sections: List[Section] = Field()
+
+    # Text statistics
+    word_count: int = Field()
+    char_count: int = Field()
+    sentence_count: int = Field()
+    readability_word_count: int = Field()
+    letter_count: int = Field()
+    latin_ratio: Optional[float] = Field()
+    han_ratio: Optional[float] = Field()
+    tamil_ratio: Optional[float] = Field()
+
+
+class ExtractionResponse(BaseModel):
+    articles: List[ExtractedArticle] = Field()
@@ -0,0 +1,98 @@
+import asyncio
+import os
+from concurrent.futures import ProcessPoolExecutor, wait
+from typing import Any
+
+import pandas as pd
+from content_optimization.pipelines.data_processing.text_stats import add_text_stats
+from content_optimization.pipelines.data_processing.utils import extract_article
+
+# A small article extracted by each worker process when it starts, so that the first request does not pay for the
+# imports and the compiled patterns of the extractor
+WARM_UP_HTML = (
+    "<div><h2>Header</h2><p>Text with a <a href='https://www.healthhub.sg'>link</a>.</p>"
+    "<table><tr><td>Cell</td></tr></table><p><img src='image.png' alt='Image'/></p>"
+    "<p><strong>Read these next:</strong></p><ul><li>Article</li></ul></div>"
+)
+
+
+def warm_up_worker(parser: str) -> None:
+    """
+    Initializes a worker process of the `ExtractionPool` by extracting a small article.
+
+    Args:
+        parser (str): The BeautifulSoup parser of the pool.
+    """
+    extract_article("warm-up", "", "", WARM_UP_HTML, parser)
+
+
+class ExtractionPool:
+    """
+    A warm pool of worker processes that extract articles on demand with the `HTMLExtractor`.
+
+    All worker processes are started and warmed up when the pool is created, so that a request of a few articles is
+    extracted in milliseconds. The articles of a request are sent to the workers one at a time, so that they are
+    extracted concurrently.
+    """
+
+    def __init__(self, workers: int = -1, parser: str = "html.parser") -> None:
+        """
+        Starts the worker processes of the pool.
+
+        Args:
+            workers (int): The number of worker processes. Set to -1 to use all cores. Defaults to -1.
+            parser (str): The BeautifulSoup parser to use. Defaults to "html.parser".
+        """
+        if workers == -1:
+            workers = os.cpu_count() or 1
+
+        self.workers = workers
+        self.parser = parser
+        self.executor = ProcessPoolExecutor(
+            max_workers=workers, initializer=warm_up_worker, initargs=(parser,)
+        )
+        # The executor only starts the worker processes on demand, so submit a task to each of them
+        wait([self.executor.submit(os.getpid) for _ in range(workers)])
+
+    async def extract(
+        self, articles: list[tuple[str, str, str, str]]
+    ) -> list[dict[str, Any]]:
+        """
+        Extracts all data from a list of articles, with the text statistics added at extraction (see
+        `add_text_stats`).
+
+        Args:
+            articles (list[tuple[str, str, str, str]]): A list of `(content_name, content_category, full_url,
+                html_content)` tuples to extract.
+
+        Returns:
+            list[dict[str, Any]]: The extracted data of each article, in the same order as `articles`. Missing
+                script ratios are None.
+        """
+        loop = asyncio.get_running_loop()
+        extracted_articles = await asyncio.gather(
+            *(
+                loop.run_in_executor(
+                    self.executor, extract_article, *article, self.parser
+                )
+                for article in articles
+            )
+        )
+        if not extracted_articles:
+            return []
+
+        df = pd.DataFrame(extracted_articles)
+        df["content_body"] = [article[3] for article in articles]
+        df = add_text_stats(df).drop(columns="content_body")
+        ratio_columns = [column for column in df.columns if column.endswith("_ratio")]
+        df[ratio_columns] = (
+            df[ratio_columns].astype(object).where(df[ratio_columns].notna(), None)
+        )
+
+        return df.to_dict(orient="records")
+
+    def shutdown(self) -> None:
+        """
+        Stops the worker processes of the pool.
+        """
+        self.executor.shutdown(cancel_futures=True)
@@ -0,0 +1,39 @@
+from content_optimization.service.get_injected_pool import get_pool
+from content_optimization.service.models import ExtractionRequest, ExtractionResponse
+from content_optimization.service.pool import ExtractionPool
+from fastapi import APIRouter, Depends
+
+extractRouter = APIRouter(prefix="/extract")
+
+
+@extractRouter.post("", response_model=ExtractionResponse)
+async def extract_articles(
+    body: ExtractionRequest, pool: ExtractionPool = Depends(get_pool)
+):
+    """
+    Extracts all data from a batch of articles, e.g. to re-extract a few articles after a fix in the CMS without
+    running the `data_processing` pipeline
+    """
+    extracted_articles = await pool.extract(
+        [
+            (
+                article.content_name or str(article.id),
+                article.content_category,
+                article.full_url,
+                article.html,
+            )
+            for article in body.articles
+        ]
+    )
+    for article, extracted_data in zip(body.articles, extracted_articles):
+        extracted_data["id"] = article.id
+
+    return {"articles": extracted_articles}
+
+
+@extractRouter.get("/health")
+async def health_check(pool: ExtractionPool = Depends(get_pool)):
+    """
+    Endpoint for healthcheck, with the number of warm worker processes
+    """
+    return {"status": "ok", "workers": pool.workers, "parser": pool.parser}
@@ -0,0 +1,81 @@
+from pathlib import Path
+
+import pandas as pd
+import pytest
+from src.content_optimization.datasets.excel import CachedExcelDataset
+
+
+def test_cached_excel_dataset(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    """
+    A test function for `CachedExcelDataset` that checks the loaded sheets and the sidecars.
+
+    Args:
+        tmp_path (Path): The temporary directory to store the workbook and the sidecars in.
+        monkeypatch (pytest.MonkeyPatch): The fixture to count the calls to `pd.read_excel`.
+
+    Raises:
+        AssertionError: If the loaded sheets or the sidecars do not meet the specified criteria (see below).
+
+    Note:
+        1. Expects the sheets loaded from the sidecar to be identical to the sheets read from the workbook
+        2. Expects the workbook to be read only on a cache miss
+        3. Expects sheets with columns of mixed types to be pickled instead
+        4. Expects the stale sidecar to be replaced when the workbook changes
+    """
+    filepath = tmp_path / "google_analytics.xlsx"
+    cache_dir = tmp_path / "excel_cache"
+    sheets = {
+        "programs": pd.DataFrame(
+            {
+                "id": [1, 2, 3],
+                "title": ["Diabetes", None, "Asthma"],
+                "page_views": [10.5, None, 3.0],
+                "published": pd.to_datetime(["2024-01-01", None, "2024-03-01"]),
+            }
+        ),
+        "medications": pd.DataFrame({"mixed": [1, "two", None]}),
+    }
+    with pd.ExcelWriter(filepath) as writer:
+        for sheet_name, df in sheets.items():
+            df.to_excel(writer, sheet_name=sheet_name, index=False)
+
+    read_excel = pd.read_excel
+    calls = []
+    monkeypatch.setattr(
+        pd,
+        "read_excel",
+        lambda *args, **kwargs: calls.append(1) or read_excel(*args, **kwargs),
+    )
+
+    dataset = CachedExcelDataset(
+        filepath=filepath.as_posix(),
+        cache_dir=cache_dir.as_posix(),
+        load_args={"sheet_name": list(sheets), "engine": "openpyxl"},
+    )
+    expected = dataset.load()
+    actual = dataset.load()
+
+    assert calls == [1]
+    assert list(actual) == list(sheets)
+    for sheet_name in sheets:
+        pd.testing.assert_frame_equal(actual[sheet_name], expected[sheet_name])
+        # `assert_frame_equal` does not tell NaN from None
+        assert (
+            actual[sheet_name].map(repr).values == expected[sheet_name].map(repr).values
+        ).all()
+    sidecar_dir = next(cache_dir.iterdir())
+    assert sorted(path.name for path in sidecar_dir.iterdir()) == [
+        "0.parquet",
+        "1.pkl",
+        "manifest.json",
+    ]
+
+    with pd.ExcelWriter(filepath) as writer:
+        sheets["programs"].to_excel(writer, sheet_name="programs", index=False)
+        sheets["programs"].to_excel(writer, sheet_name="medications", index=False)
+    actual = dataset.load()
+
+    assert calls == [1, 1]
+    pd.testing.assert_frame_equal(actual["medications"], expected["programs"])
+    assert [path.name for path in cache_dir.iterdir()] != [sidecar_dir.name]
+    assert len(list(cache_dir.iterdir())) == 1
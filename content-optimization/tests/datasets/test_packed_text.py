@@ -0,0 +1,55 @@
+from pathlib import Path
+
+from src.content_optimization.datasets.packed_text import PackedTextDataset
+
+
+def test_packed_text_dataset(tmp_path: Path):
+    """
+    A test function for `PackedTextDataset` that checks the lookups, the saves and the export of the texts.
+
+    Args:
+        tmp_path (Path): The temporary directory to store the database and the exported text files in.
+
+    Raises:
+        AssertionError: If the loaded texts or the exported text files do not meet the specified criteria (see below).
+
+    Note:
+        1. Expects the texts to be looked up by key and by article id, and streamed by content category
+        2. Expects saving to replace the texts of the saved content categories only
+        3. Expects the exported text files to follow the layout of the `PartitionedDataset` of text files
+    """
+    dataset = PackedTextDataset(
+        filepath=(tmp_path / "all_extracted_text.db").as_posix()
+    )
+    dataset.save(
+        {
+            "diseases-and-conditions/Diabetes_1": "Diabetes is a chronic condition.",
+            "diseases-and-conditions/Type_1 Diabetes_2": "Type 1 diabetes",
+            "programs/Healthy 365_3": "Healthy 365",
+        }
+    )
+    store = dataset.load()
+
+    assert len(store) == 3  # noqa: PLR2004
+    assert store["programs/Healthy 365_3"] == "Healthy 365"
+    assert store.get_by_id(2) == "Type 1 diabetes"
+    assert store.get_by_id(4) is None
+    assert [key for key, _ in store.iter_texts("diseases-and-conditions")] == [
+        "diseases-and-conditions/Diabetes_1",
+        "diseases-and-conditions/Type_1 Diabetes_2",
+    ]
+
+    dataset.save({"programs/Healthy 365 App_4": "Healthy 365 App"})
+
+    assert list(store) == [
+        "diseases-and-conditions/Diabetes_1",
+        "diseases-and-conditions/Type_1 Diabetes_2",
+        "programs/Healthy 365 App_4",
+    ]
+
+    exported = store.export((tmp_path / "all_extracted_text").as_posix(), "programs")
+
+    assert exported == 1
+    assert (
+        tmp_path / "all_extracted_text" / "programs" / "Healthy 365 App_4.txt"
+    ).read_text(encoding="utf-8") == "Healthy 365 App"
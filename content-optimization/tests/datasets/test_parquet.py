@@ -0,0 +1,112 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from src.content_optimization.datasets.parquet import CompactParquetDataset
+
+
+def test_compact_parquet_dataset(tmp_path: Path):
+    """
+    A test function for `CompactParquetDataset` that checks the loaded dtypes and values.
+
+    Args:
+        tmp_path (Path): The temporary directory to store the Parquet files in.
+
+    Raises:
+        AssertionError: If the loaded DataFrames do not meet the specified criteria (see below).
+
+    Note:
+        1. Expects the low-cardinality columns to be loaded as `category` and the text columns as Arrow-backed strings
+        2. Expects columns that are not strings to keep their inferred types
+        3. Expects the same DataFrame as the saved one if `arrow_dtypes` is False, including None values
+    """
+    df = pd.DataFrame(
+        {
+            "id": [1, 2, 3],
+            "content_category": ["programs", "medications", "programs"],
+            "remove_type": [None, "Recipe", None],
+            "pr_name": [np.nan, np.nan, np.nan],
+            "extracted_content_body": ["Diabetes", "", None],
+            "extracted_links": [["https://a"], [], ["https://b", "https://c"]],
+            "to_remove": [False, True, False],
+        }
+    )
+    kwargs = {
+        "categorical_columns": ["content_category", "remove_type", "pr_name"],
+        "large_string_columns": ["extracted_content_body"],
+    }
+
+    dataset = CompactParquetDataset(
+        filepath=(tmp_path / "merged_data.parquet").as_posix(), **kwargs
+    )
+    dataset.save(df)
+    actual = dataset.load()
+
+    assert isinstance(actual["content_category"].dtype, pd.CategoricalDtype)
+    assert isinstance(actual["remove_type"].dtype, pd.CategoricalDtype)
+    assert actual["extracted_content_body"].dtype == pd.ArrowDtype(pa.large_string())
+    assert actual["pr_name"].dtype == np.float64
+    assert (actual["remove_type"] != "Recipe").tolist() == [True, False, True]
+    assert actual["extracted_content_body"].tolist()[:2] == ["Diabetes", ""]
+
+    dataset = CompactParquetDataset(
+        filepath=(tmp_path / "all_contents_mapped.parquet").as_posix(),
+        arrow_dtypes=False,
+        **kwargs,
+    )
+    dataset.save(df)
+    actual = dataset.load()
+
+    pd.testing.assert_frame_equal(actual, df)
+    assert actual["remove_type"].tolist()[0] is None
+
+
+def test_compact_parquet_dataset_batches(tmp_path: Path, batch_size: int = 2):
+    """
+    A test function for `CompactParquetDataset` that checks that a DataFrame saved in batches is the same as the
+    DataFrame saved at once.
+
+    Args:
+        tmp_path (Path): The temporary directory to store the Parquet files in.
+        batch_size (int): The number of rows in each batch.
+
+    Raises:
+        AssertionError: If the loaded DataFrame or the row groups do not meet the specified criteria (see below).
+
+    Note:
+        1. Expects the same DataFrame, even if a column only has null values in a batch
+        2. Expects each batch to be written as a row group
+    """
+    df = pd.DataFrame(
+        {
+            "id": [1, 2, 3, 4, 5],
+            "remove_type": [None, None, "Recipe", None, "Multilingual"],
+            "extracted_links": [None, None, ["https://a"], [], None],
+            "extracted_content_body": [None, None, "Diabetes", "", "Asthma"],
+        }
+    )
+    kwargs = {
+        "categorical_columns": ["remove_type"],
+        "large_string_columns": ["extracted_content_body"],
+        "arrow_dtypes": False,
+    }
+    batches = [df.iloc[i : i + batch_size] for i in range(0, len(df), batch_size)]
+
+    dataset = CompactParquetDataset(
+        filepath=(tmp_path / "batches.parquet").as_posix(), **kwargs
+    )
+    dataset.save(batches)
+    actual = dataset.load()
+
+    dataset = CompactParquetDataset(
+        filepath=(tmp_path / "dataframe.parquet").as_posix(), **kwargs
+    )
+    dataset.save(df)
+    expected = dataset.load()
+
+    pd.testing.assert_frame_equal(actual, expected)
+    assert pq.ParquetFile(tmp_path / "batches.parquet").num_row_groups == len(
+        batches
+    ), "Expected a row group per batch"
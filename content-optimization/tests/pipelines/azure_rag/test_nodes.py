@@ -0,0 +1,59 @@
+import json
+
+import pandas as pd
+from src.content_optimization.pipelines.azure_rag.nodes import extract_content
+
+ARTICLE_CONTENT_COLUMNS = [
+    "id",
+    "title",
+    "full_url",
+    "extracted_content_body",
+    "content_category",
+    "pr_name",
+    "has_table",
+]
+TABLE_CONTENT_COLUMNS = [
+    "id",
+    "title",
+    "full_url",
+    "processed_table_content",
+    "content_category",
+    "pr_name",
+]
+
+
+def test_extract_content_with_missing_values():
+    """
+    A test function for `extract_content` with missing values in the categorical columns of the merged data.
+
+    Raises:
+        AssertionError: If the extracted content does not meet the specified criteria (see below).
+
+    Note:
+        1. Expects a missing `pr_name` of a categorical column to be None, for the content and the table
+        2. Expects the extracted content to be serializable to valid JSON
+    """
+    processed_data_rag = pd.DataFrame(
+        {
+            "id": [1, 2],
+            "title": ["Diabetes", "Exercise"],
+            "full_url": ["https://www.healthhub.sg/a", "https://www.healthhub.sg/b"],
+            "extracted_content_body": ["Diabetes is a chronic condition.", "Walk."],
+            "content_category": pd.Categorical(
+                ["diseases-and-conditions", "live-healthy-articles"]
+            ),
+            "pr_name": pd.Categorical([None, "Health Promotion Board"]),
+            "has_table": [True, False],
+            "processed_table_content": ["Table of diabetes", None],
+            "extracted_sections": [None, None],
+        }
+    )
+
+    json_data_rag = extract_content(
+        processed_data_rag, ARTICLE_CONTENT_COLUMNS, TABLE_CONTENT_COLUMNS
+    )
+
+    assert json_data_rag["1_content"][0]["pr_name"] is None
+    assert json_data_rag["1_table"][0]["pr_name"] is None
+    assert json_data_rag["2_content"][0]["pr_name"] == "Health Promotion Board"
+    assert "NaN" not in json.dumps(json_data_rag, allow_nan=False)
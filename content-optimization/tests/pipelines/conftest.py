@@ -97,6 +97,7 @@ def catalog(datasets: dict, parameters: dict) -> DataCatalog:
             "params:default_columns": parameters["default_columns"],
             "params:word_count_cutoff": parameters["word_count_cutoff"],
             "params:whitelist": parameters["whitelist"],
+            "params:blacklist": parameters["blacklist"],
             "params:cfg": parameters["cfg"],
             "params:selection_options.only_confirmed": parameters["selection_options"][
                 "only_confirmed"
@@ -0,0 +1,93 @@
+import inspect
+from pathlib import Path
+
+import pytest
+from src.content_optimization.pipelines.data_processing import cache as cache_module
+from src.content_optimization.pipelines.data_processing.cache import (
+    ExtractionCache,
+    get_extractor_version,
+    hash_html,
+)
+
+
+def test_extraction_cache(tmp_path: Path, num_stale_entries: int = 2):
+    """
+    A test function for `ExtractionCache` that checks the lookups, version stamps and compaction.
+
+    Args:
+        tmp_path (Path): The temporary directory to store the cache in.
+        num_stale_entries (int): The expected number of entries evicted on compaction.
+
+    Raises:
+        AssertionError: If the cache does not meet the specified criteria (see below).
+
+    Note:
+        1. Expects a miss before an article is stored and a hit after
+        2. Expects a miss if the HTML content or the extractor version changes
+        3. Expects stale entries to be evicted on compaction
+    """
+    filepath = (tmp_path / "extraction_cache.db").as_posix()
+    data = {"has_table": False, "extracted_headers": [("Header", "h2")]}
+    old_hash = hash_html("live-healthy-articles", "<p>Old content</p>")
+    new_hash = hash_html("live-healthy-articles", "<p>New content</p>")
+
+    with ExtractionCache(filepath, version="v1") as cache:
+        assert cache.get(1, old_hash) is None, "Expected a cache miss"
+        cache.put(1, old_hash, data)
+        assert cache.get(1, old_hash) == data, "Expected a cache hit"
+        assert cache.get(1, new_hash) is None, "Expected a miss for new HTML"
+        cache.put(1, new_hash, data)
+        assert (cache.hits, cache.misses) == (1, 2), "Unexpected hit and miss counts"
+
+    with ExtractionCache(filepath, version="v2") as cache:
+        assert cache.get(1, new_hash) is None, "Expected a miss for a new version"
+        cache.put(1, new_hash, data)
+        # Evicts both entries of "v1"
+        assert (
+            cache.compact() == num_stale_entries
+        ), "Expected stale entries to be evicted"
+        assert cache.get(1, new_hash) == data, "Expected the latest entry to be kept"
+
+
+def test_extractor_version(monkeypatch: pytest.MonkeyPatch):
+    """
+    A test function for `get_extractor_version` that checks the modules and parser versions covered by the version
+    stamp.
+
+    Args:
+        monkeypatch (pytest.MonkeyPatch): The fixture to change the source code of the extractor modules and the
+            version of the parser backend.
+
+    Raises:
+        AssertionError: If the version stamp does not change with the source code of the extractor modules, the
+            parser or the version of its backend.
+    """
+    version = get_extractor_version()
+    getsource = inspect.getsource
+    assert (
+        get_extractor_version("lxml") != version
+    ), "Expected a new parser to change the stamp"
+
+    with monkeypatch.context() as m:
+        m.setattr(cache_module, "get_parser_version", lambda parser: f"{parser} 0.0.0")
+        assert (
+            get_extractor_version() != version
+        ), "Expected a new version of the parser backend to change the stamp"
+
+    for module in cache_module.EXTRACTOR_MODULES:
+        changed_source = getsource(module) + "\n# A change\n"
+        with monkeypatch.context() as m:
+            m.setattr(
+                cache_module.inspect,
+                "getsource",
+                lambda obj, module=module, source=changed_source: (
+                    source if obj is module else getsource(obj)
+                ),
+            )
+            assert (
+                get_extractor_version() != version
+            ), f"Expected a change to {module.__name__} to change the stamp"
+
+    assert [
+        module.__name__.rsplit(".", 1)[-1] for module in cache_module.EXTRACTOR_MODULES
+    ] == ["extractor", "normalization"], "Expected the modules of the extractor"
@@ -0,0 +1,147 @@
+import pandas as pd
+from src.content_optimization.pipelines.data_processing.corrections import (
+    apply_corrections,
+    get_corrections,
+    get_unmatched_corrections,
+    load_missing_contents,
+)
+
+EXCEL_ERRORS = {
+    "diabetes": "<p>Diabetes</p>",
+    "asthma": "<p>Asthma</p>",
+    "removed-article": "<p>Removed</p>",
+}
+UPDATED_URLS = {
+    "live-healthy-articles": {
+        2: "https://www.healthhub.sg/live-healthy/2",
+        9: "https://www.healthhub.sg/live-healthy/9",
+    },
+    # The article is in another content category
+    "programs": {1: "https://www.healthhub.sg/programs/1"},
+}
+BLACKLIST = {3: "Infographic", 8: "Recipe"}
+
+
+def get_articles() -> pd.DataFrame:
+    """
+    Gets the articles of the live-healthy-articles content category.
+
+    Returns:
+        pd.DataFrame: The articles.
+    """
+    return pd.DataFrame(
+        {
+            "id": [1, 2, 3, 4],
+            "friendly_url": ["diabetes", "asthma", "asthma", "cancer"],
+            "full_url": [f"https://www.healthhub.sg/{i}" for i in range(1, 5)],
+            "full_url2": [None] * 4,
+            "content_body": ["Value exceeded maximum cell size", None, "<p>a</p>", ""],
+            "content_category": ["live-healthy-articles"] * 4,
+        },
+        index=[10, 11, 12, 13],
+    )
+
+
+def apply_corrections_reference(
+    df: pd.DataFrame, excel_errors: dict[str, str], new_urls: dict[int, str]
+) -> pd.DataFrame:
+    """
+    The previous implementation of `add_content_body` and `add_updated_urls`, kept to check the parity of
+    `apply_corrections`.
+
+    Args:
+        df (pd.DataFrame): The DataFrame containing the articles.
+        excel_errors (dict[str, str]): A dictionary that maps each article friendly url to the updated content body.
+        new_urls (dict[int, str]): A dictionary that maps each article id to the updated full_url.
+
+    Returns:
+        pd.DataFrame: The DataFrame with the corrected values.
+    """
+    for friendly_url, text in excel_errors.items():
+        article_index = df.index[df["friendly_url"] == friendly_url]
+        if article_index.empty:
+            continue
+        df.loc[article_index, "content_body"] = text
+
+    for article_id, url in new_urls.items():
+        article_index = df.index[df["id"] == article_id]
+        if article_index.empty:
+            continue
+        df.loc[article_index, "full_url"] = url
+        df.loc[article_index, "full_url2"] = url
+
+    return df
+
+
+def test_apply_corrections_parity():
+    """
+    A test function for `apply_corrections` that checks the parity with the previous implementation.
+
+    Raises:
+        AssertionError: If the corrected articles differ from the previous implementation.
+    """
+    corrections = get_corrections(EXCEL_ERRORS, UPDATED_URLS, BLACKLIST)
+
+    corrected = apply_corrections(get_articles(), corrections, "live-healthy-articles")
+    expected = apply_corrections_reference(
+        get_articles(), EXCEL_ERRORS, UPDATED_URLS["live-healthy-articles"]
+    )
+
+    pd.testing.assert_frame_equal(corrected, expected)
+    # The blacklist is applied after extraction
+    assert "remove_type" not in corrected.columns
+
+
+def test_get_unmatched_corrections():
+    """
+    A test function for `get_unmatched_corrections`.
+
+    Raises:
+        AssertionError: If the unmatched corrections do not meet the specified criteria (see below).
+
+    Note:
+        1. Expects the corrections of all content categories to match an article of any content category
+        2. Expects the corrections of a content category to only match the articles of that content category
+    """
+    corrections = get_corrections(EXCEL_ERRORS, UPDATED_URLS, BLACKLIST)
+    unmatched = get_unmatched_corrections(corrections, get_articles())
+
+    assert unmatched.to_dict(orient="records") == [
+        {
+            "source": "missing_contents",
+            "content_category": None,
+            "key_column": "friendly_url",
+            "key": "removed-article",
+        },
+        {
+            "source": "updated_urls",
+            "content_category": "live-healthy-articles",
+            "key_column": "id",
+            "key": 9,
+        },
+        {
+            "source": "updated_urls",
+            "content_category": "programs",
+            "key_column": "id",
+            "key": 1,
+        },
+        {"source": "blacklist", "content_category": None, "key_column": "id", "key": 8},
+    ]
+
+
+def test_load_missing_contents():
+    """
+    A test function for `load_missing_contents`.
+
+    Raises:
+        AssertionError: If the missing contents are not keyed by the friendly url.
+    """
+    missing_contents = {
+        "missing_contents/diabetes": lambda: EXCEL_ERRORS["diabetes"],
+        "asthma": lambda: EXCEL_ERRORS["asthma"],
+    }
+
+    assert load_missing_contents(missing_contents) == {
+        "diabetes": EXCEL_ERRORS["diabetes"],
+        "asthma": EXCEL_ERRORS["asthma"],
+    }
@@ -0,0 +1,315 @@
+import difflib
+import json
+from pathlib import Path
+
+import pytest
+from kedro.io import DataCatalog
+from src.content_optimization.pipelines.data_processing.extractor import HTMLExtractor
+
+HTML_CONTENT = """
+<div>
+    <h2>Living with Diabetes</h2>
+    <p>Diabetes is a chronic condition. <a href="https://www.healthhub.sg/a">Read more</a>.</p>
+    <p><strong>Related: <a href="https://www.healthhub.sg/b">Managing Diabetes</a></strong></p>
+    <table>
+        <tr><th>Meal Type</th><th>Portion Size</th></tr>
+        <tr><td>Rice</td><td>1 bowl</td></tr>
+    </table>
+    <p><img src="https://www.healthhub.sg/c.png" alt="A healthy plate"/>Eat well.</p>
+    <p><strong>Read these next:</strong></p>
+    <ul><li><a href="https://www.healthhub.sg/d">Eating Out</a></li><li>Exercise</li></ul>
+</div>
+"""
+
+# The golden extraction corpus of synthetic articles, see `benchmarks/benchmark_extraction.py`
+GOLDEN_PATH = Path(__file__).resolve().parents[3] / "benchmarks/golden/extraction.jsonl"
+
+
+@pytest.fixture
+def extractor() -> HTMLExtractor:
+    return HTMLExtractor(
+        "living-with-diabetes",
+        "live-healthy-articles",
+        "https://www.healthhub.sg/living-with-diabetes",
+        HTML_CONTENT,
+    )
+
+
+def test_traverse(extractor: HTMLExtractor):
+    """
+    A test function for `HTMLExtractor.traverse` that checks the outputs of the read-only extractors.
+
+    Args:
+        extractor (HTMLExtractor): The HTMLExtractor of the test article.
+
+    Raises:
+        AssertionError: If the extracted data does not meet the specified criteria (see below).
+
+    Note:
+        1. Expects the table and image to be detected
+        2. Expects the related sections, tables, links, headers and images to be extracted
+    """
+    assert extractor.check_for_table(), "Expected a table"
+    assert extractor.check_for_image(), "Expected an image"
+    assert extractor.extract_related_sections() == [
+        "Managing Diabetes",
+        "Eating Out",
+        "Exercise",
+    ]
+    assert extractor.extract_tables() == [
+        [["Meal Type", "Portion Size"], ["Rice", "1 bowl"]]
+    ]
+    assert extractor.extract_headers() == [("Living with Diabetes", "h2")]
+    assert extractor.extract_img_links_and_alt_text() == [
+        ("A healthy plate", "https://www.healthhub.sg/c.png")
+    ]
+    assert ("Read more", "https://www.healthhub.sg/a") in extractor.extract_links()
+
+
+def test_traverse_after_extract_text(extractor: HTMLExtractor):
+    """
+    A test function that checks that the read-only extractors are not affected by `HTMLExtractor.extract_text`,
+    which modifies the parsed tree (e.g. by removing tables).
+
+    Args:
+        extractor (HTMLExtractor): The HTMLExtractor of the test article.
+
+    Raises:
+        AssertionError: If the tables are no longer found after extracting the text.
+    """
+    extracted_content_body = extractor.extract_text()
+
+    assert "Rice" not in extracted_content_body, "Expected tables to be removed"
+    assert extractor.check_for_table(), "Expected a table"
+    assert extractor.extract_raw_html_tables() is not None, "Expected a raw table"
+
+
+def test_extract_sections():
+    """
+    A test function for `HTMLExtractor.extract_sections`.
+
+    Raises:
+        AssertionError: If the section tree does not meet the specified criteria (see below).
+
+    Note:
+        1. Expects the text before the first header in the root section
+        2. Expects the parent of each section to be the closest preceding section of a lower level
+        3. Expects the paragraphs of each section to be sliced from the content body, without the header
+        4. Expects the tables to be referenced by the section they are in, and empty headers to be skipped
+        5. Expects a header that is not in the content body (e.g. within a table) to have an empty span
+    """
+    extractor = HTMLExtractor(
+        "exercise",
+        "live-healthy-articles",
+        "https://www.healthhub.sg/exercise",
+        """
+        <p>Stay active.</p>
+        <h2>Exercises at home</h2>
+        <p>Try these.</p>
+        <h3>Wall planks</h3>
+        <p>Hold for 30 seconds.</p>
+        <h3> </h3>
+        <table><tr><td><h4>Sets</h4></td></tr><tr><td>3</td></tr></table>
+        <h2>Exercises outdoors</h2>
+        <p>Go for a walk.</p>
+        """,
+    )
+    extracted = extractor.extract_all()
+    content_body = extracted["extracted_content_body"]
+    sections = extracted["extracted_sections"]
+
+    assert [
+        (section["level"], section["header"], section["parent"], section["tables"])
+        for section in sections
+    ] == [
+        (0, "", -1, []),
+        (2, "Exercises at home", 0, []),
+        (3, "Wall planks", 1, [0]),
+        (4, "Sets", 2, []),
+        (2, "Exercises outdoors", 0, []),
+    ]
+    assert [
+        content_body[section["start"] : section["end"]].strip() for section in sections
+    ] == ["Stay active.", "Try these.", "Hold for 30 seconds.", "", "Go for a walk."]
+    assert sections[3]["start"] == sections[3]["end"], "Expected an empty span"
+
+
+def test_extract_sections_header_in_text():
+    """
+    A test function for `HTMLExtractor.extract_sections` when the text of a header also appears in an earlier
+    paragraph.
+
+    Raises:
+        AssertionError: If a header is matched within an earlier paragraph instead of its own line.
+    """
+    extractor = HTMLExtractor(
+        "parkinsons-disease",
+        "diseases-and-conditions",
+        "https://www.healthhub.sg/parkinsons-disease",
+        """
+        <p>Learn how Symptoms appear and what Causes them.</p>
+        <h2>Symptoms</h2>
+        <p>Tremor and stiffness.</p>
+        <h2>Causes</h2>
+        <p>Genes and the environment.</p>
+        """,
+    )
+    extracted = extractor.extract_all()
+    content_body = extracted["extracted_content_body"]
+
+    assert [
+        (section["header"], content_body[section["start"] : section["end"]].strip())
+        for section in extracted["extracted_sections"]
+    ] == [
+        ("", "Learn how Symptoms appear and what Causes them."),
+        ("Symptoms", "Tremor and stiffness."),
+        ("Causes", "Genes and the environment."),
+    ]
+
+
+def diff_extracted_content(
+    expected: dict[str, object], actual: dict[str, object], label: str
+) -> list[str]:
+    """
+    Reports the exact differences between the outputs of two extractors.
+
+    Args:
+        expected (dict[str, object]): The output of `HTMLExtractor.extract_all` with the reference parser.
+        actual (dict[str, object]): The output of `HTMLExtractor.extract_all` with the parser under test.
+        label (str): The label of the article used in the report.
+
+    Returns:
+        list[str]: A unified diff for `extracted_content_body` and a line for every other differing column.
+    """
+    differences = []
+    for column, value in expected.items():
+        if value == actual[column]:
+            continue
+        if column == "extracted_content_body":
+            differences.extend(
+                difflib.unified_diff(
+                    value.splitlines(),
+                    actual[column].splitlines(),
+                    fromfile=f"{label} (html.parser)",
+                    tofile=f"{label} (parser under test)",
+                    lineterm="",
+                )
+            )
+        else:
+            differences.append(
+                f"{label}: {column} differs: {value!r} != {actual[column]!r}"
+            )
+
+    return differences
+
+
+@pytest.mark.parametrize("parser", ["lxml"])
+@pytest.mark.parametrize(
+    "html_content",
+    [
+        HTML_CONTENT,
+        "Text outside of any tag <b>with bold text</b><p>and a paragraph.</p>",
+        "<style>p { color: red; }</style><p>Paragraph after a style tag.</p>",
+        "<p>First line<br/>Second line</p><hr/><p>After a horizontal rule.</p>",
+        "",
+    ],
+)
+def test_parser_parity(parser: str, html_content: str):
+    """
+    A test function that checks that a parser gives the same output as "html.parser".
+
+    Args:
+        parser (str): The parser under test.
+        html_content (str): The HTML content to extract.
+
+    Raises:
+        AssertionError: If any extracted column differs. The exact differences are reported.
+    """
+    args = (
+        "living-with-diabetes",
+        "live-healthy-articles",
+        "https://www.healthhub.sg/living-with-diabetes",
+        html_content,
+    )
+    expected = HTMLExtractor(*args).extract_all()
+    actual = HTMLExtractor(*args, parser=parser).extract_all()
+
+    differences = diff_extracted_content(expected, actual, "test article")
+    assert not differences, "\n".join(differences)
+
+
+@pytest.mark.parametrize("parser", ["lxml"])
+def test_parser_parity_on_corpus(catalog: DataCatalog, parser: str):
+    """
+    A test function that checks that a parser gives the same output as "html.parser" over the test corpus.
+
+    Args:
+        catalog (DataCatalog): The Kedro DataCatalog containing the necessary test datasets.
+        parser (str): The parser under test.
+
+    Raises:
+        AssertionError: If any extracted column differs for any article. The exact differences are reported.
+    """
+    differences = []
+    for content_category, partition_load_func in catalog.load(
+        "all_contents_added"
+    ).items():
+        df = partition_load_func()
+        for _, row in df[df["content_body"].notna()].iterrows():
+            args = (
+                row["content_name"],
+                content_category,
+                row["full_url"],
+                row["content_body"],
+            )
+            expected = HTMLExtractor(*args).extract_all()
+            actual = HTMLExtractor(*args, parser=parser).extract_all()
+            differences.extend(diff_extracted_content(expected, actual, f"{row['id']}"))
+
+    assert not differences, "\n".join(differences)
+
+
+def test_golden_extraction():
+    """
+    A test function that checks the output of `HTMLExtractor.extract_all` against the golden extraction corpus.
+
+    Raises:
+        AssertionError: If any extracted column differs from the golden corpus. The exact differences are reported.
+    """
+    with open(GOLDEN_PATH, encoding="utf-8") as f:
+        records = [json.loads(line) for line in f]
+
+    differences = []
+    for record in records:
+        extracted_data = HTMLExtractor(
+            record["content_name"],
+            record["content_category"],
+            record["full_url"],
+            record["html_content"],
+        ).extract_all()
+        # Compare the JSON representation, as stored in the golden corpus (e.g. tuples as lists)
+        actual = json.loads(json.dumps(extracted_data))
+        if actual.keys() != record["expected"].keys():
+            differences.append(
+                f"{record['content_name']}: columns differ: {sorted(record['expected'])} != {sorted(actual)}"
+            )
+            continue
+        differences.extend(
+            diff_extracted_content(record["expected"], actual, record["content_name"])
+        )
+
+    assert records, "Expected a non-empty golden corpus"
+    assert not differences, "\n".join(differences)
+
+
+def test_invalid_parser():
+    """
+    A test function that checks that an unsupported parser raises a `ValueError`.
+
+    Raises:
+        AssertionError: If no `ValueError` is raised.
+    """
+    with pytest.raises(ValueError) as error:
+        HTMLExtractor.preprocess_html(HTML_CONTENT, parser="xml")
+
+    assert "Invalid parser `xml`" in str(error.value)
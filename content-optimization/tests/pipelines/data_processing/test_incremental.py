@@ -0,0 +1,67 @@
+from pathlib import Path
+
+from src.content_optimization.pipelines.data_processing.incremental import (
+    commit_fingerprints,
+    fingerprint_raw_partitions,
+    select_categories,
+)
+
+
+def test_incremental_runs(tmp_path: Path):
+    """
+    A test function for the incremental runs that checks which content categories are recomputed.
+
+    Args:
+        tmp_path (Path): The temporary directory to store the raw files and the manifest in.
+
+    Raises:
+        AssertionError: If the selected content categories do not meet the specified criteria (see below).
+
+    Note:
+        1. Expects all content categories to be recomputed in the first run
+        2. Expects no content category to be recomputed if nothing changed since the last complete run
+        3. Expects only the content categories with changed raw files or parameters to be recomputed
+        4. Expects the content categories recomputed upstream to be recomputed downstream until committed
+        5. Expects all content categories to be recomputed if incremental runs are disabled
+    """
+    raw_path = tmp_path / "all_contents"
+    raw_path.mkdir()
+    for partition_id in ["export-published-a", "export-published-b"]:
+        (raw_path / f"{partition_id}.xlsx").write_bytes(partition_id.encode())
+
+    incremental = {
+        "enabled": True,
+        "manifest_path": (tmp_path / "fingerprints" / "manifest.json").as_posix(),
+        "raw_path": raw_path.as_posix(),
+    }
+
+    def run(parameters: dict[str, str]) -> tuple[set[str], set[str]]:
+        raw_fingerprints = fingerprint_raw_partitions(
+            incremental, ["export-published-a", "export-published-b"]
+        )
+        standardized = select_categories(
+            incremental,
+            "standardize",
+            {
+                "a": raw_fingerprints["export-published-a"],
+                "b": raw_fingerprints["export-published-b"],
+            },
+        )
+        mapped = select_categories(incremental, "map", parameters)
+        return standardized, mapped
+
+    assert run({"a": "x", "b": "x"}) == ({"a", "b"}, {"a", "b"})
+    commit_fingerprints(incremental)
+    assert run({"a": "x", "b": "x"}) == (set(), set())
+
+    # Re-export a single content category
+    (raw_path / "export-published-b.xlsx").write_bytes(b"re-exported")
+    assert run({"a": "x", "b": "x"}) == ({"b"}, {"b"})
+
+    # Failed run: the pending content category is recomputed in the next run
+    assert run({"a": "y", "b": "x"}) == ({"b"}, {"a", "b"})
+    commit_fingerprints(incremental)
+    assert run({"a": "y", "b": "x"}) == (set(), set())
+
+    assert select_categories(None, "map", {"a": "y"}) is None
+    assert select_categories({"enabled": False}, "map", {"a": "y"}) is None
@@ -0,0 +1,84 @@
+import pandas as pd
+from src.content_optimization.pipelines.data_processing.near_duplicates import (
+    choose_num_bands,
+    flag_near_duplicates,
+)
+
+ARTICLE = " ".join(
+    f"Sentence {i} of the article about managing diabetes with a healthy diet."
+    for i in range(30)
+)
+
+
+def test_flag_near_duplicates():
+    """
+    A test function for `flag_near_duplicates` that checks the flagged articles and the reported pairs.
+
+    Raises:
+        AssertionError: If the flagged articles or pairs do not meet the specified criteria (see below).
+
+    Note:
+        1. Expects articles that only differ by a date or a footer across content categories to be flagged as "Near Duplicate"
+        2. Expects whitelisted and already flagged articles to not be (re)flagged
+        3. Expects the near-duplicate pairs to be reported with their Jaccard similarity above the threshold
+    """
+    df = pd.DataFrame(
+        {
+            "id": [1, 2, 3, 4, 5],
+            "content_category": [
+                "live-healthy-articles",
+                "programs",
+                "programs",
+                "medications",
+                "programs",
+            ],
+            "title": [
+                "Diabetes",
+                "Diabetes (Updated)",
+                "Diabetes (Footer)",
+                "Asthma",
+                "Diabetes (Old)",
+            ],
+            "extracted_content_body": [
+                ARTICLE,
+                ARTICLE + " Last updated on 1 January 2024.",
+                ARTICLE + " Share this article.",
+                "An unrelated article about managing asthma and allergies.",
+                ARTICLE,
+            ],
+            "to_remove": [False, False, False, False, True],
+            "remove_type": [None, None, None, None, "Duplicated Content"],
+        }
+    )
+
+    df, near_duplicate_pairs = flag_near_duplicates(df, whitelist=[3], threshold=0.9)
+
+    assert df.loc[df["to_remove"], "id"].tolist() == [1, 2, 5]
+    assert df["remove_type"].tolist() == [
+        "Near Duplicate",
+        "Near Duplicate",
+        None,
+        None,
+        "Duplicated Content",
+    ]
+    assert set(zip(near_duplicate_pairs["id_1"], near_duplicate_pairs["id_2"])) == {
+        (1, 2),
+        (1, 3),
+        (2, 3),
+    }
+    assert (near_duplicate_pairs["jaccard_similarity"] >= 0.9).all()  # noqa: PLR2004
+
+
+def test_choose_num_bands():
+    """
+    A test function for `choose_num_bands` that checks that the bands divide the signatures.
+
+    Raises:
+        AssertionError: If the number of bands does not divide the number of permutations or is not monotonic.
+    """
+    num_bands = [
+        choose_num_bands(128, threshold) for threshold in [0.95, 0.9, 0.8, 0.5]
+    ]
+
+    assert all(128 % n == 0 for n in num_bands), "Expected bands to divide signatures"
+    assert num_bands == sorted(num_bands), "Expected more bands for lower thresholds"
@@ -6,6 +6,7 @@
 from src.content_optimization.pipelines.data_processing.nodes import (
     add_data,
     extract_data,
+    map_data,
     merge_data,
     standardize_columns,
 )
@@ -85,8 +86,10 @@ def test_add_data(catalog: DataCatalog):
 
     # Combine all dataframes into one
     combined_df = pd.DataFrame()
-    for content_category, df in all_contents_added.items():
-        combined_df = pd.concat([combined_df, df], axis=0, ignore_index=True)
+    for content_category, partition_load_func in all_contents_added.items():
+        combined_df = pd.concat(
+            [combined_df, partition_load_func()], axis=0, ignore_index=True
+        )
 
     # Get articles with Excel Errors
     filtered_df = combined_df[combined_df["friendly_url"].isin(friendly_urls)]
@@ -97,6 +100,61 @@ def test_add_data(catalog: DataCatalog):
         ), "Content body was not successfully replaced"
 
 
+def test_add_and_map_data_are_lazy():
+    """
+    A test function for the lazy partitions returned by `add_data` and `map_data`.
+
+    Raises:
+        AssertionError: If the partitions do not meet the specified criteria (see below).
+
+    Note:
+        1. Expects no partition to be loaded until its function is called
+        2. Expects each partition to be added and mapped when its function is called
+    """
+    loaded = []
+
+    def load(content_category: str) -> pd.DataFrame:
+        loaded.append(content_category)
+        return pd.DataFrame(
+            {
+                "id": [1],
+                "friendly_url": ["diabetes"],
+                "full_url": ["https://www.healthhub.sg/a-z/diseases-and-conditions/1"],
+                "content_category": [content_category],
+                "content_body": ["<p>Value exceeded maximum cell size</p>"],
+                "article_category_names": ["Body Care"],
+            }
+        )
+
+    content_categories = ["diseases-and-conditions", "live-healthy-articles"]
+    all_contents_added = add_data(
+        {
+            content_category: lambda content_category=content_category: load(
+                content_category
+            )
+            for content_category in content_categories
+        },
+        {"missing_contents/diabetes": lambda: "<p>Diabetes</p>"},
+        {"live-healthy-articles": {1: "https://www.healthhub.sg/live-healthy/1"}},
+    )
+    all_contents_mapped = map_data(
+        all_contents_added,
+        {"live-healthy-articles": {"Well-being & Lifestyle": ["Body Care"]}},
+        {},
+    )
+
+    assert list(all_contents_mapped) == content_categories
+    assert loaded == [], "Expected no partition to be loaded"
+
+    df = all_contents_mapped["live-healthy-articles"]()
+
+    assert loaded == ["live-healthy-articles"], "Expected only one partition loaded"
+    assert df.loc[0, "content_body"] == "<p>Diabetes</p>"
+    assert df.loc[0, "full_url"] == "https://www.healthhub.sg/live-healthy/1"
+    assert not df.loc[0, "to_remove"]
+    assert df.loc[0, "l1_mappings"] == "Well-being & Lifestyle"
+
+
 @pytest.mark.parametrize("word_count_cutoff", [50, 90])
 def test_extract_data(catalog: DataCatalog, word_count_cutoff: int):
     """
@@ -116,7 +174,7 @@ def test_extract_data(catalog: DataCatalog, word_count_cutoff: int):
         4. Expects the extracted content body to meet the word count cutoff
     """
     whitelist = catalog.load("params:whitelist")
-    all_contents_extracted, all_extracted_text = extract_data(
+    all_contents_extracted, all_extracted_text, _ = extract_data(
         catalog.load("all_contents_added"),
         word_count_cutoff,
         whitelist,
@@ -157,6 +215,38 @@ def test_extract_data(catalog: DataCatalog, word_count_cutoff: int):
         ), "Found extracted content body below the word count cutoff that is not removed"
 
 
+def test_extract_data_with_process_pool(catalog: DataCatalog):
+    """
+    A test function for `extract_data` that checks that extracting with a process pool gives the same output as
+    extracting in a single process.
+
+    Args:
+        catalog (DataCatalog): The Kedro DataCatalog containing the necessary test datasets.
+
+    Raises:
+        AssertionError: If the output data does not meet the specified criteria (see below).
+
+    Note:
+        1. Expects the same extracted text files in both modes
+        2. Expects the same extracted dataframes in both modes
+    """
+    args = (
+        catalog.load("all_contents_added"),
+        catalog.load("params:word_count_cutoff"),
+        catalog.load("params:whitelist"),
+        catalog.load("params:blacklist"),
+    )
+    serial_extracted, serial_text, _ = extract_data(*args)
+    parallel_extracted, parallel_text, _ = extract_data(*args, workers=2, chunksize=4)
+
+    # Check if the text files are the same
+    assert serial_text == parallel_text, "Extracted text differs with a process pool"
+
+    for content_category, df in serial_extracted.items():
+        # Check if the dataframes are the same
+        pd.testing.assert_frame_equal(df, parallel_extracted[content_category])
+
+
 def test_merge_data(catalog: DataCatalog):
     """
     A test function for `merge_data` that checks the output data.
@@ -172,7 +262,7 @@ def test_merge_data(catalog: DataCatalog):
         2. Expects the total number of rows in the output data equal to the sum of the rows in the input data
     """
     all_contents_extracted = catalog.load("all_contents_extracted")
-    merged_df = merge_data(all_contents_extracted)
+    merged_df, _ = merge_data(all_contents_extracted)
 
     # Check if output is a dataframe
     assert isinstance(merged_df, pd.DataFrame), "Expected a dataframe"
@@ -0,0 +1,89 @@
+import random
+import re
+import unicodedata
+
+import pandas as pd
+from src.content_optimization.pipelines.data_processing.normalization import (
+    clean_column,
+    clean_text,
+    clean_texts,
+)
+
+# Fragments of article text with the special characters found in the HTML content
+FRAGMENTS = [
+    "Diabetes is a chronic condition.",
+    "Don’t skip meals \u2013 eat\xa0well",
+    "“Healthy” plate\u200b • café © HealthHub®",
+    "Line\u2028separator\u2029and _x000D_ carriage return",
+    "  \t\n tabs and\x1cseparators\x1f \r\n",
+    "１２½ ﬁ ① 中文 \U0001f600",
+    "",
+]
+
+
+def clean_text_reference(text: str) -> str:
+    """
+    The previous implementation of `HTMLExtractor.clean_text`, kept to check the parity of `clean_text`.
+
+    Args:
+        text (str): The input text to be cleaned.
+
+    Returns:
+        str: The cleaned text.
+    """
+    text = text.replace("\u2013", "-")
+    text = unicodedata.normalize("NFKD", text)
+    text = text.encode("ascii", "ignore").decode("utf-8")
+    text = text.replace("\xa0", " ")
+    text = text.replace("\u200b", "")
+    text = text.replace("\u2028", "\n")
+    text = text.replace("\u2029", "\n")
+    text = text.replace("_x000D_", "")
+    text = re.sub(r"\s+", " ", text)
+
+    return text.strip()
+
+
+def test_clean_text_parity(num_texts: int = 1000):
+    """
+    A test function for `clean_text` and `clean_texts` that checks the parity with the previous implementation.
+
+    Args:
+        num_texts (int): The number of random texts to check.
+
+    Raises:
+        AssertionError: If the cleaned texts differ from the previous implementation.
+    """
+    rng = random.Random(42)
+    texts = FRAGMENTS + [
+        " ".join(rng.choices(FRAGMENTS, k=rng.randint(1, 5))) for _ in range(num_texts)
+    ]
+
+    for text in texts:
+        assert clean_text(text) == clean_text_reference(
+            text
+        ), f"Expected the same cleaned text for {text!r}"
+    assert clean_texts(texts) == [clean_text_reference(text) for text in texts]
+
+
+def test_clean_column():
+    """
+    A test function for `clean_column`.
+
+    Raises:
+        AssertionError: If the cleaned column does not meet the specified criteria (see below).
+
+    Note:
+        1. Expects the texts to be cleaned
+        2. Expects the missing values and the index to be kept
+    """
+    series = pd.Series(
+        [FRAGMENTS[1], None, FRAGMENTS[1], FRAGMENTS[3]], index=[3, 1, 2, 0]
+    )
+    cleaned = clean_column(series)
+
+    assert cleaned.index.equals(series.index), "Expected the index to be kept"
+    assert cleaned.isna().tolist() == [False, True, False, False]
+    assert cleaned.dropna().tolist() == [
+        clean_text_reference(text) for text in series.dropna()
+    ], "Expected the texts to be cleaned"
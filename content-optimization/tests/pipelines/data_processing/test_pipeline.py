@@ -14,6 +14,7 @@
 from kedro.io import DataCatalog
 from kedro.runner import SequentialRunner
 from pytest import LogCaptureFixture
+from src.content_optimization.pipelines.data_processing import create_parallel_pipeline
 from src.content_optimization.pipelines.data_processing import (
     create_pipeline as create_dp_pipeline,
 )
@@ -47,3 +48,45 @@ def test_data_processing_pipeline(caplog: LogCaptureFixture, catalog: DataCatalo
     SequentialRunner().run(pipeline, catalog)
 
     assert successful_run_msg in caplog.text
+
+
+def test_data_processing_parallel_pipeline():
+    """
+    A test function for the structure of the parallel data processing pipeline.
+
+    Raises:
+        AssertionError: If the pipeline does not meet the specified criteria (see below).
+
+    Note:
+        1. Expects a namespaced branch of the same nodes for each content category
+        2. Expects the branches to be independent, so that they can be run concurrently
+        3. Expects the branches to fan in to the same merge and report nodes as the linear pipeline
+    """
+    content_categories = ["diseases-and-conditions", "live-healthy-articles"]
+    pipeline = create_parallel_pipeline(content_categories)
+    linear_pipeline = create_dp_pipeline()
+
+    for content_category in content_categories:
+        branch = pipeline.only_nodes_with_namespace(content_category)
+        assert sorted(node.name for node in branch.nodes) == sorted(
+            f"{content_category}.{node.name}"
+            for node in linear_pipeline.nodes
+            if node.name not in {"report_corrections_node", "merge_data_node"}
+        )
+        # No branch depends on the outputs of another branch
+        assert branch.inputs() <= linear_pipeline.inputs() | {
+            input for input in pipeline.inputs() if input.startswith("params:")
+        }
+
+    # Each layer holds the same node of every branch, and the merge node is the only node of the last layer
+    assert [len(nodes) for nodes in pipeline.grouped_nodes] == [2, 2, 3, 2, 1]
+    assert [node.name for node in pipeline.grouped_nodes[-1]] == ["merge_data_node"]
+    assert pipeline.outputs() == {
+        "merged_data",
+        "near_duplicate_pairs",
+        "unmatched_corrections",
+    } | {
+        f"{content_category}.{output}"
+        for content_category in content_categories
+        for output in ["all_extracted_text", "extraction_profile"]
+    }
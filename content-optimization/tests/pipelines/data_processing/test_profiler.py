@@ -0,0 +1,114 @@
+from pathlib import Path
+
+import pandas as pd
+from src.content_optimization.pipelines.data_processing.extractor import HTMLExtractor
+from src.content_optimization.pipelines.data_processing.profiler import (
+    PROFILE_COLUMNS,
+    get_profile_report,
+    load_profile_report,
+    profile_articles,
+)
+
+HTML_CONTENTS = [
+    "<div><h2>Header</h2><p>Some text</p></div>",
+    "<div><table><tr><td>Cell</td></tr></table><p>More text</p></div>",
+]
+
+
+def test_profile_articles():
+    """
+    A test function for `profile_articles` and `get_profile_report`.
+
+    Raises:
+        AssertionError: If the profiles do not meet the specified criteria (see below).
+
+    Note:
+        1. Expects the extracted data to be the same as `HTMLExtractor.extract_all`
+        2. Expects the size of the HTML content and parsed tree of each article
+        3. Expects the report to be ranked from the slowest article
+    """
+    articles = [
+        (f"Article {i}", "live-healthy-articles", f"https://example.com/{i}", html)
+        for i, html in enumerate(HTML_CONTENTS)
+    ]
+    extracted_articles, profiles = profile_articles(articles)
+
+    for article, extracted in zip(articles, extracted_articles):
+        assert (
+            extracted == HTMLExtractor(*article).extract_all()
+        ), "Expected the same extracted data as `HTMLExtractor.extract_all`"
+
+    for html, profile in zip(HTML_CONTENTS, profiles):
+        assert profile["html_bytes"] == len(html), "Unexpected HTML size"
+        assert profile["node_count"] > 0, "Expected the tags to be counted"
+        assert profile["total_seconds"] >= profile["parse_seconds"]
+    assert [profile["table_count"] for profile in profiles] == [
+        0,
+        1,
+    ], "Expected the tables to be counted"
+
+    report = get_profile_report(
+        [{"id": i, **profile} for i, profile in enumerate(profiles)]
+    )
+    assert list(report.columns) == PROFILE_COLUMNS, "Unexpected report columns"
+    assert report["total_seconds"].is_monotonic_decreasing, "Expected a ranking"
+    assert list(report["rank"]) == list(range(1, len(profiles) + 1))
+
+
+def test_load_profile_report_of_each_content_category(tmp_path: Path):
+    """
+    A test function for `load_profile_report` with the versioned reports of each content category saved by the
+    parallel pipeline.
+
+    Args:
+        tmp_path (Path): The temporary directory to save the reports in.
+
+    Raises:
+        AssertionError: If the merged report does not meet the specified criteria (see below).
+
+    Note:
+        1. Expects the latest version of each content category that profiled at least one article
+        2. Expects the reports to be merged and ranked together, from the report path or its directory
+    """
+    category_reports = {
+        "live-healthy-articles": {
+            "2024-01-01T00.00.00.000Z": [(1, 0.2), (2, 0.05)],
+            # A run without profiling saves an empty report
+            "2024-01-02T00.00.00.000Z": [],
+        },
+        "programs": {"2024-01-01T00.00.00.000Z": [(3, 0.1)]},
+    }
+    report_dir = tmp_path / "extraction_profile"
+    for content_category, versions in category_reports.items():
+        for version, profiles in versions.items():
+            version_dir = report_dir / f"{content_category}.csv" / version
+            version_dir.mkdir(parents=True)
+            get_profile_report(
+                [
+                    {
+                        "id": article_id,
+                        "content_category": content_category,
+                        "total_seconds": total_seconds,
+                    }
+                    for article_id, total_seconds in profiles
+                ]
+            ).to_csv(version_dir / f"{content_category}.csv", index=False)
+
+    for filepath in [tmp_path / "extraction_profile.csv", report_dir]:
+        report = load_profile_report(filepath.as_posix())
+
+        assert list(report.columns) == PROFILE_COLUMNS, "Unexpected report columns"
+        pd.testing.assert_frame_equal(
+            report[["rank", "id", "content_category"]],
+            pd.DataFrame(
+                {
+                    "rank": [1, 2, 3],
+                    "id": [1, 3, 2],
+                    "content_category": [
+                        "live-healthy-articles",
+                        "programs",
+                        "live-healthy-articles",
+                    ],
+                }
+            ),
+        )
@@ -0,0 +1,87 @@
+import pandas as pd
+from src.content_optimization.pipelines.data_processing.rules import (
+    MULTILINGUAL,
+    RECIPE,
+    FlagRule,
+    FlagRuleEngine,
+    below_word_count_rule,
+    blacklist_rule,
+)
+
+
+def test_flag_rule_engine():
+    """
+    A test function for `FlagRuleEngine` that checks the precedence of the rules, the whitelist and the stats.
+
+    Raises:
+        AssertionError: If the flagged articles or stats do not meet the specified criteria (see below).
+
+    Note:
+        1. Expects rules that skip flagged articles to not overwrite earlier rules
+        2. Expects whitelisted articles to be ignored, except by the blacklist
+        3. Expects the blacklist to override all earlier rules
+        4. Expects the number of flagged articles of each rule to be reported
+    """
+    df = pd.DataFrame(
+        {
+            "id": [1, 2, 3, 4, 5],
+            "title": ["Chicken Soup Recipe", "Diabetes", "Recipes", "Asthma", "Eczema"],
+            "keywords": [None, None, None, None, None],
+            "friendly_url": ["soup-chinese", "diabetes", "recipes", "asthma", "eczema"],
+            "extracted_content_body": [
+                "What you need",
+                "Diabetes is a chronic condition.",
+                "What you need",
+                "Asthma " * 100,
+                "Eczema",
+            ],
+            "to_remove": [False, False, False, False, True],
+            "remove_type": [None, None, None, None, "NaN"],
+        }
+    )
+
+    engine = FlagRuleEngine(
+        [RECIPE, MULTILINGUAL, below_word_count_rule(10), blacklist_rule({4: "Test"})]
+    )
+    df = engine.apply(df, whitelist=[3, 4])
+
+    assert df["to_remove"].tolist() == [True, True, False, True, True]
+    assert df["remove_type"].tolist() == [
+        "Recipe",
+        "Below Word Count",
+        None,
+        "Test",
+        "NaN",
+    ]
+    assert [(stat["rule"], stat["flagged"]) for stat in engine.stats] == [
+        ("Recipe", 1),
+        ("Multilingual", 0),
+        ("Below Word Count", 1),
+        ("Blacklist", 1),
+    ]
+
+
+def test_custom_flag_rule():
+    """
+    A test function that checks that a new rule can be declared as a mask over the precomputed features.
+
+    Raises:
+        AssertionError: If the custom rule does not flag the expected articles.
+    """
+    rule = FlagRule(
+        "Mentions COVID",
+        lambda features, _: features["content_lower"].str.contains("covid", na=False),
+        "Outdated",
+    )
+    df = pd.DataFrame(
+        {
+            "id": [1, 2],
+            "extracted_content_body": ["COVID-19 vaccination", "Healthy eating"],
+            "to_remove": [False, False],
+            "remove_type": [None, None],
+        }
+    )
+
+    df = FlagRuleEngine([rule]).apply(df, whitelist=[])
+
+    assert df["remove_type"].tolist() == ["Outdated", None]
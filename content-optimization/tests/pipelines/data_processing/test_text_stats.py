@@ -0,0 +1,136 @@
+import random
+import re
+import string
+
+import numpy as np
+import pandas as pd
+from src.content_optimization.pipelines.data_processing.text_stats import (
+    TEXT_STATS_COLUMNS,
+    add_text_stats,
+    get_script_ratios,
+    get_text_stats,
+)
+
+# Fragments of extracted text with the delimiters, punctuation and hyperlinks found in the articles
+FRAGMENTS = [
+    "Diabetes is a chronic condition.",
+    "Eat well! Exercise often?",
+    "See https://www.healthhub.sg/live-healthy for more.",
+    "What you need:\n- 2 eggs\n- 1 cup of rice",
+    "Dr. Tan said: 'rest...' -- and drink water ...",
+    "... ! ? - -- '",
+    "e.g.no-space.here",
+    "",
+]
+
+
+def readability_counts_reference(text: str) -> tuple[int, int, int]:
+    """
+    The sentence, word and letter counts of `hemmingway_score` in the article harmonisation, kept to check the parity
+    of `get_text_stats`.
+
+    Args:
+        text (str): The text to count.
+
+    Returns:
+        tuple[int, int, int]: The number of sentences, words and letters.
+    """
+    text = re.sub(r"https?:\/\/[^\s]+", "", text)
+    sentences = []
+    for line in text.split("\n"):
+        for sentence in re.split(r"[.!?]", line):
+            if sentence.strip():
+                sentences.append(sentence.strip())
+
+    words = []
+    for sentence in sentences:
+        for token in sentence.split(" "):
+            word = token.strip().translate(str.maketrans("", "", string.punctuation))
+            if word:
+                words.append(word)
+
+    return len(sentences), len(words), sum(len(word) for word in words)
+
+
+def test_get_text_stats_parity(num_texts: int = 500):
+    """
+    A test function for `get_text_stats` that checks the parity with the on-the-fly counts.
+
+    Args:
+        num_texts (int): The number of random texts to check.
+
+    Raises:
+        AssertionError: If the counts differ from the on-the-fly counts.
+    """
+    rng = random.Random(42)
+    texts = FRAGMENTS + [
+        rng.choice([" ", "\n"]).join(rng.choices(FRAGMENTS, k=rng.randint(1, 5)))
+        for _ in range(num_texts)
+    ]
+    stats = get_text_stats(pd.Series(texts + [None]))
+
+    for text, (_, row) in zip(texts, stats.iterrows()):
+        assert row["word_count"] == len(text.split())
+        assert row["char_count"] == len(text)
+        assert (
+            row["sentence_count"],
+            row["readability_word_count"],
+            row["letter_count"],
+        ) == readability_counts_reference(
+            text
+        ), f"Expected the same counts for {text!r}"
+    assert stats.iloc[-1].tolist() == [0] * 5, "Expected a missing text to be empty"
+
+
+def test_get_script_ratios():
+    """
+    A test function for `get_script_ratios`.
+
+    Raises:
+        AssertionError: If the ratios do not meet the specified criteria (see below).
+
+    Note:
+        1. Expects the ratios to be computed on the visible text, without the tags and with the entities unescaped
+        2. Expects NaN ratios for content without characters of the scripts
+    """
+    html_contents = pd.Series(
+        [
+            "<p>ab</p><p>糖尿病</p>",
+            '<div class="中文">&#20013;&#25991;</div>',
+            "<p>நீரிழிவு</p>",
+            "<p>123 !</p>",
+            None,
+        ]
+    )
+    ratios = get_script_ratios(html_contents)
+
+    assert ratios.columns.tolist() == ["latin_ratio", "han_ratio", "tamil_ratio"]
+    assert ratios.iloc[0].tolist() == [0.4, 0.6, 0.0]
+    assert ratios.iloc[1].tolist() == [0.0, 1.0, 0.0]
+    assert ratios.iloc[2].tolist() == [0.0, 0.0, 1.0]
+    assert np.isnan(ratios.iloc[3:].to_numpy()).all()
+
+
+def test_add_text_stats():
+    """
+    A test function for `add_text_stats`.
+
+    Raises:
+        AssertionError: If the text statistics columns are not added or the index is not kept.
+    """
+    df = pd.DataFrame(
+        {
+            "content_body": ["<p>Eat well. Sleep well.</p>", None],
+            "extracted_content_body": ["Eat well. Sleep well.", None],
+        },
+        index=[5, 3],
+    )
+    df = add_text_stats(df)
+
+    assert df.columns.tolist()[2:] == TEXT_STATS_COLUMNS
+    assert df.loc[5, ["word_count", "sentence_count", "letter_count"]].tolist() == [
+        4,
+        2,
+        16,
+    ]
+    assert df.loc[3, "word_count"] == 0
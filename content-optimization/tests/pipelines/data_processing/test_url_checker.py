@@ -0,0 +1,207 @@
+import threading
+import time
+from collections import Counter
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pandas as pd
+import pytest
+from src.content_optimization.pipelines.data_processing.url_checker import URLChecker
+from src.content_optimization.pipelines.data_processing.utils import flag_url_error
+
+# Maps the paths of the stub server to the status code and page content
+PAGES = {
+    "/ok": (200, "<p>Article</p>"),
+    "/missing": (404, "<p>Not Found</p>"),
+    "/soft-404": (200, "<h1>404 Error</h1><p>Page not found</p>"),
+    "/server-error": (500, "<p>Internal Server Error</p>"),
+    "/no-head": (200, "<p>Article</p>"),
+}
+# The paths of the stub server that reject HEAD requests
+NO_HEAD_PATHS = {"/no-head"}
+# The paths of the stub server that respond after `SLOW_RESPONSE_SECONDS` with a 200 page
+SLOW_PREFIX = "/slow/"
+SLOW_RESPONSE_SECONDS = 0.5
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """A stub HTTP request handler that serves the `PAGES` and counts the requests."""
+
+    requests = Counter()
+
+    def get_page(self) -> tuple[int, str]:
+        if self.path.startswith(SLOW_PREFIX):
+            time.sleep(SLOW_RESPONSE_SECONDS)
+            return 200, "<p>Article</p>"
+        return PAGES.get(self.path, (404, ""))
+
+    def do_HEAD(self):
+        self.requests[("HEAD", self.path)] += 1
+        status, _ = (405, "") if self.path in NO_HEAD_PATHS else self.get_page()
+        self.send_response(status)
+        self.end_headers()
+
+    def do_GET(self):
+        self.requests[("GET", self.path)] += 1
+        status, content = self.get_page()
+        body = content.encode()
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def base_url() -> Iterator[str]:
+    """
+    Starts a stub HTTP server on a free local port.
+
+    Yields:
+        str: The base URL of the stub server.
+    """
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    StubHandler.requests.clear()
+
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+
+    server.shutdown()
+    server.server_close()
+
+
+def test_check_urls(base_url: str, tmp_path: Path):
+    """
+    A test function for `URLChecker.check_urls` against a stub HTTP server.
+
+    Args:
+        base_url (str): The base URL of the stub server.
+        tmp_path (Path): The temporary directory to store the result cache in.
+
+    Raises:
+        AssertionError: If the results do not meet the specified criteria (see below).
+
+    Note:
+        1. Expects 200 pages to exist, and 404 pages, soft "404 error" pages and 500 pages to not exist
+        2. Expects a single GET request for each page that responds, without HEAD requests
+        3. Expects 500 responses to be retried
+        4. Expects cached results to be reused without sending any request
+    """
+    checker = URLChecker(
+        cache_path=(tmp_path / "url_checks.db").as_posix(), retries=1, backoff=0
+    )
+    urls = [f"{base_url}{path}" for path in PAGES]
+    expected = {
+        f"{base_url}/ok": (True, "URL exists"),
+        f"{base_url}/missing": (False, "400 error"),
+        f"{base_url}/soft-404": (False, "404 error"),
+        f"{base_url}/server-error": (False, "400 error"),
+        f"{base_url}/no-head": (True, "URL exists"),
+    }
+
+    assert checker.check_urls(urls) == expected
+    assert all(
+        StubHandler.requests[("GET", path)] == 1
+        for path in PAGES
+        if path != "/server-error"
+    ), "Expected a single GET request"
+    assert not any(
+        method == "HEAD" for method, _ in StubHandler.requests
+    ), "Expected no HEAD request"
+    assert StubHandler.requests[("GET", "/server-error")] > 1, "Expected retries"
+
+    StubHandler.requests.clear()
+    assert checker.check_urls(urls) == expected
+    assert not StubHandler.requests, "Expected cached results to be reused"
+
+
+def test_check_urls_without_soft_404_markers(base_url: str):
+    """
+    A test function for `URLChecker.check_urls` without soft 404 markers against a stub HTTP server.
+
+    Args:
+        base_url (str): The base URL of the stub server.
+
+    Raises:
+        AssertionError: If the results do not meet the specified criteria (see below).
+
+    Note:
+        1. Expects the pages to be checked with a single HEAD request, without downloading them
+        2. Expects errors of HEAD requests (e.g. servers that reject them) to be confirmed with a GET request
+        3. Expects soft "404 error" pages to exist, since their content is not checked
+    """
+    checker = URLChecker(retries=0, soft_404_markers=[])
+    urls = [f"{base_url}{path}" for path in PAGES]
+
+    assert checker.check_urls(urls) == {
+        f"{base_url}/ok": (True, "URL exists"),
+        f"{base_url}/missing": (False, "400 error"),
+        f"{base_url}/soft-404": (True, "URL exists"),
+        f"{base_url}/server-error": (False, "400 error"),
+        f"{base_url}/no-head": (True, "URL exists"),
+    }
+    assert StubHandler.requests == Counter(
+        [("HEAD", path) for path in PAGES]
+        + [("GET", path) for path in ["/missing", "/server-error", "/no-head"]]
+    ), "Expected a GET request only for the errors of HEAD requests"
+
+
+def test_check_urls_queued(base_url: str, num_urls: int = 20):
+    """
+    A test function for `URLChecker.check_urls` with more URLs of a slow host than connections to the host.
+
+    Args:
+        base_url (str): The base URL of the stub server.
+        num_urls (int): The number of URLs to check.
+
+    Raises:
+        AssertionError: If a URL times out while waiting for a free connection.
+    """
+    checker = URLChecker(
+        max_connections_per_host=4, timeout=SLOW_RESPONSE_SECONDS * 4, retries=0
+    )
+    urls = [f"{base_url}{SLOW_PREFIX}{i}" for i in range(num_urls)]
+
+    results = checker.check_urls(urls)
+
+    assert [url for url, result in results.items() if not result[0]] == []
+
+
+def test_flag_url_error(base_url: str):
+    """
+    A test function for `flag_url_error` against a stub HTTP server.
+
+    Args:
+        base_url (str): The base URL of the stub server.
+
+    Raises:
+        AssertionError: If the articles flagged for removal do not meet the specified criteria (see below).
+
+    Note:
+        1. Expects articles with a 404 page, a soft "404 error" page or an invalid URL to be flagged
+        2. Expects whitelisted articles and articles without a URL to not be flagged
+    """
+    df = pd.DataFrame(
+        {
+            "id": [1, 2, 3, 4, 5, 6],
+            "full_url": [
+                f"{base_url}/ok",
+                f"{base_url}/missing",
+                f"{base_url}/soft-404",
+                f"{base_url}/missing",
+                None,
+                "not-a-url",
+            ],
+            "to_remove": False,
+            "remove_type": None,
+        }
+    )
+
+    df = flag_url_error(df, whitelist=[4], url_check={"retries": 0})
+
+    assert df.loc[df["to_remove"], "id"].tolist() == [2, 3, 6]
+    assert (df.loc[df["to_remove"], "remove_type"] == "URL Error").all()
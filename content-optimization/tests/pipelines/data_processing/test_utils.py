@@ -0,0 +1,297 @@
+import tempfile
+from functools import partial
+
+import numpy as np
+import pandas as pd
+from src.content_optimization.pipelines.data_processing.nodes import merge_data
+from src.content_optimization.pipelines.data_processing.spill import SpilledTexts
+from src.content_optimization.pipelines.data_processing.utils import (
+    extract_contents,
+    extract_contents_in_batches,
+    flag_articles_to_remove_after_extraction,
+    flag_duplicated,
+    invert_ia_mappings,
+    map_all_category_names,
+    map_category_names,
+    strip_whitespaces,
+)
+
+
+def test_flag_duplicated():
+    """
+    A test function for `flag_duplicated` that checks the whitelist and first-occurrence semantics.
+
+    Raises:
+        AssertionError: If the flagged articles do not meet the specified criteria (see below).
+
+    Note:
+        1. Expects all occurrences of a duplicated value to be flagged, including the first instance
+        2. Expects whitelisted and already flagged articles to not be (re)flagged
+        3. Expects null and empty values to be ignored
+        4. Expects a value to be flagged if only its first instance was already flagged
+    """
+    df = pd.DataFrame(
+        {
+            "id": [1, 2, 3, 4, 5, 6, 7, 8, 9, 10],
+            "extracted_content_body": [
+                "a",
+                "a",
+                "a",
+                "b",
+                "",
+                "",
+                None,
+                None,
+                "c",
+                "c",
+            ],
+            "to_remove": [
+                False,
+                False,
+                False,
+                False,
+                False,
+                False,
+                False,
+                False,
+                True,
+                False,
+            ],
+            "remove_type": [
+                None,
+                None,
+                None,
+                None,
+                None,
+                None,
+                None,
+                None,
+                "Recipe",
+                None,
+            ],
+        }
+    )
+
+    df = flag_duplicated(df, whitelist=[3], column="extracted_content_body")
+
+    assert df.loc[df["to_remove"], "id"].tolist() == [1, 2, 9, 10]
+    assert df["remove_type"].tolist() == [
+        "Duplicated Content",
+        "Duplicated Content",
+        None,
+        None,
+        None,
+        None,
+        None,
+        None,
+        "Recipe",
+        "Duplicated Content",
+    ]
+
+
+def test_merge_data_with_duplicates_across_categories():
+    """
+    A test function for `merge_data` that checks the duplicates flagged across content categories.
+
+    Raises:
+        AssertionError: If the flagged articles do not meet the specified criteria (see below).
+
+    Note:
+        1. Expects no duplicates to be flagged across content categories by default
+        2. Expects the duplicated content and URLs across content categories to be flagged if enabled
+    """
+    google_analytics_columns = {"Page Views": "page_views"}
+    all_contents_mapped = {
+        content_category: (
+            lambda ids=ids: pd.DataFrame(
+                {
+                    "id": ids,
+                    "extracted_content_body": [f"content {i % 10}" for i in ids],
+                    "full_url": [f"https://www.healthhub.sg/{i}" for i in ids],
+                    "to_remove": False,
+                    "remove_type": None,
+                    "page_views": np.nan,
+                }
+            )
+        )
+        for content_category, ids in [("programs", [1, 2]), ("medications", [11, 12])]
+    }
+    google_analytics_data = {
+        content_category: pd.DataFrame({"id": ids, "Page Views": [10, 20]})
+        for content_category, ids in [("programs", [1, 2]), ("medications", [11, 12])]
+    }
+
+    merged_df, _ = merge_data(
+        all_contents_mapped, google_analytics_data, google_analytics_columns
+    )
+    assert not merged_df["to_remove"].any(), "Expected no duplicates"
+
+    merged_df, _ = merge_data(
+        all_contents_mapped,
+        google_analytics_data,
+        google_analytics_columns,
+        whitelist=[2],
+        flag_duplicates_across_categories=True,
+    )
+    assert merged_df.loc[merged_df["to_remove"], "id"].tolist() == [1, 11, 12]
+    assert (
+        merged_df.loc[merged_df["to_remove"], "remove_type"] == "Duplicated Content"
+    ).all()
+
+
+def test_map_all_category_names_parity(parameters: dict):
+    """
+    A test function that checks that `map_all_category_names` gives the same output as `map_category_names` applied
+    to the L1 and L2 IA mappings one after another.
+
+    Args:
+        parameters (dict): The parameters of the Kedro project.
+
+    Raises:
+        AssertionError: If the mapped columns or the `article_category_names` column differ.
+
+    Note:
+        1. Expects the mapped values to be the same, regardless of their order (`map_category_names` de-duplicates
+            with a set)
+        2. Expects the "&" in `article_category_names` to be replaced with "and" the same way
+    """
+    l1_mappings = invert_ia_mappings(parameters["l1_mappings"])
+    l2_mappings = invert_ia_mappings(parameters["l2_mappings"])
+    category_names = sorted(
+        {name for mappings in l1_mappings.values() for name in mappings}
+    )
+
+    rows = []
+    for content_category in [*l1_mappings, "programs"]:
+        for i in range(len(category_names)):
+            names = category_names[i : i + 3] + ["Unmapped & Unknown", ""]
+            rows.append((content_category, ",".join(names)))
+            rows.append((content_category, ",".join(reversed(names))))
+        rows.append((content_category, None))
+    df = pd.DataFrame(rows, columns=["content_category", "article_category_names"])
+
+    expected = map_category_names(
+        l1_mappings,
+        df.copy(),
+        "content_category",
+        "article_category_names",
+        "l1_mappings",
+    )
+    expected = map_category_names(
+        l2_mappings,
+        expected,
+        "content_category",
+        "article_category_names",
+        "l2_mappings",
+    )
+    actual = map_all_category_names(
+        {"l1_mappings": l1_mappings, "l2_mappings": l2_mappings},
+        df.copy(),
+        "content_category",
+        "article_category_names",
+    )
+
+    pd.testing.assert_series_equal(
+        expected["article_category_names"], actual["article_category_names"]
+    )
+    for column in ["l1_mappings", "l2_mappings"]:
+        assert [
+            None if value is None else sorted(value.split(" | "))
+            for value in expected[column]
+        ] == [
+            None if value is None else sorted(value.split(" | "))
+            for value in actual[column]
+        ], f"Unexpected {column}"
+
+
+def test_strip_whitespaces_parity():
+    """
+    A test function that checks that `strip_whitespaces` returns the same output as the elementwise strip.
+
+    Raises:
+        AssertionError: If the stripped DataFrame does not meet the specified criteria (see below).
+
+    Note:
+        1. Expects the same values and dtypes as `df.map(lambda x: x.strip() if isinstance(x, str) else x)`
+        2. Expects null values to be kept as they are (None or NaN)
+    """
+    df = pd.DataFrame(
+        {
+            "id": [1, 2, 3],
+            "title": ["  Diabetes\n", None, "\xa0Asthma\t"],
+            "keywords": [" diabetes ", np.nan, "asthma"],
+            "mixed": [" 1 ", 2, np.nan],
+            "empty": pd.Series([None, np.nan, None], dtype=object),
+            "page_views": [1.0, np.nan, 3.0],
+        }
+    )
+
+    expected = df.map(lambda x: x.strip() if isinstance(x, str) else x)
+    actual = strip_whitespaces(df.copy())
+
+    pd.testing.assert_frame_equal(actual, expected)
+    assert actual["title"].tolist()[1] is None
+    assert actual.map(repr).equals(expected.map(repr))
+
+
+def test_extract_contents_in_batches_parity(batch_size: int = 2):
+    """
+    A test function that checks that `extract_contents_in_batches` returns the same output as `extract_contents`
+    followed by `flag_articles_to_remove_after_extraction`.
+
+    Args:
+        batch_size (int): The number of articles extracted at a time.
+
+    Raises:
+        AssertionError: If the batched output does not meet the specified criteria (see below).
+
+    Note:
+        1. Expects the same extracted data and flags, including duplicates across batches
+        2. Expects the same extracted texts, in the same order
+    """
+    content_bodies = [
+        "<p>Diabetes is a chronic condition that affects how the body turns food into energy.</p>",
+        "<p>Short</p>",
+        "<p>Diabetes is a chronic condition that affects how the body turns food into energy.</p>",
+        "<p></p>",
+        "<p>Asthma is a condition in which the airways narrow and swell and produce extra mucus.</p>",
+    ]
+    df = pd.DataFrame(
+        {
+            "id": range(1, len(content_bodies) + 1),
+            "content_name": [f"article-{i}" for i in range(len(content_bodies))],
+            "title": [f"Article {i}" for i in range(len(content_bodies))],
+            "keywords": None,
+            "friendly_url": None,
+            "full_url": None,
+            "content_body": content_bodies,
+            "content_category": "diseases-and-conditions",
+            "to_remove": [False, False, False, False, True],
+            "remove_type": [None, None, None, None, "No Content Body"],
+        }
+    )
+    extract = partial(
+        extract_contents, content_category="diseases-and-conditions", whitelist=[5]
+    )
+    flag = partial(
+        flag_articles_to_remove_after_extraction,
+        word_count_cutoff=3,
+        whitelist=[5],
+        blacklist={},
+    )
+
+    expected, expected_text, _ = extract(df.copy())
+    expected = flag(expected)
+
+    texts = SpilledTexts(tempfile.TemporaryDirectory())
+    batches, _ = extract_contents_in_batches(df, batch_size, extract, flag, texts)
+    actual = pd.concat(batches)
+
+    pd.testing.assert_frame_equal(actual, expected)
+    assert list(texts.items()) == list(expected_text.items())
+    assert actual["remove_type"].tolist()[:4] == [
+        "Duplicated Content",
+        "Below Word Count",
+        "Duplicated Content",
+        "No Extracted Content",
+    ], "Expected the articles to be flagged across batches"
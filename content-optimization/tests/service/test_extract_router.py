@@ -0,0 +1,92 @@
+from http import HTTPStatus
+
+from fastapi.testclient import TestClient
+from src.content_optimization.pipelines.data_processing.utils import extract_article
+from src.content_optimization.service.main import app
+
+HTML_CONTENT = (
+    "<h2>Living with Diabetes</h2><p>Diabetes is a chronic condition.</p>"
+    "<p><img src='https://www.healthhub.sg/c.png'/></p>"
+)
+
+
+def test_extract_articles():
+    """
+    A test function for the `/extract` endpoint.
+
+    Raises:
+        AssertionError: If the response does not meet the specified criteria (see below).
+
+    Note:
+        1. Expects the extracted data of each article with its id, in the same order as the request
+        2. Expects the tuples of the extracted data as lists, and a missing image url as null
+    """
+    with TestClient(app) as client:
+        response = client.post(
+            "/extract",
+            json={
+                "articles": [
+                    {
+                        "id": 2,
+                        "html": HTML_CONTENT,
+                        "content_category": "diseases-and-conditions",
+                    },
+                    {
+                        "id": 1,
+                        "html": "<p>Eat well.</p>",
+                        "content_category": "programs",
+                    },
+                ]
+            },
+        )
+
+    assert response.status_code == HTTPStatus.OK
+    articles = response.json()["articles"]
+    assert [article["id"] for article in articles] == [2, 1]
+
+    expected = extract_article("2", "diseases-and-conditions", "", HTML_CONTENT)
+    assert articles[0]["extracted_content_body"] == expected["extracted_content_body"]
+    assert articles[0]["extracted_headers"] == [["Living with Diabetes", "h2"]]
+    assert articles[0]["extracted_images"] == [["", "https://www.healthhub.sg/c.png"]]
+    assert [article["word_count"] for article in articles] == [
+        len(expected["extracted_content_body"].split()),
+        2,
+    ]
+
+
+def test_extract_articles_invalid_request():
+    """
+    A test function that checks that an article without HTML content or content category is rejected.
+
+    Raises:
+        AssertionError: If a request is not rejected with a 422 status code.
+    """
+    invalid_articles = [
+        {"id": 1, "content_category": "programs"},
+        {"id": 1, "html": "<p>Eat well.</p>"},
+        {"id": 1, "html": "<p>Eat well.</p>", "content_category": ""},
+    ]
+    with TestClient(app) as client:
+        responses = [
+            client.post("/extract", json={"articles": [article]})
+            for article in invalid_articles
+        ]
+
+    assert [response.status_code for response in responses] == [
+        HTTPStatus.UNPROCESSABLE_ENTITY
+    ] * len(invalid_articles)
+
+
+def test_health_check():
+    """
+    A test function for the `/extract/health` endpoint.
+
+    Raises:
+        AssertionError: If the service is not healthy or has no warm workers.
+    """
+    with TestClient(app) as client:
+        response = client.get("/extract/health")
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.json()["status"] == "ok"
+    assert response.json()["workers"] > 0
@@ -0,0 +1,68 @@
+import asyncio
+
+import pytest
+from src.content_optimization.pipelines.data_processing.text_stats import (
+    TEXT_STATS_COLUMNS,
+)
+from src.content_optimization.pipelines.data_processing.utils import extract_articles
+from src.content_optimization.service.pool import ExtractionPool
+
+ARTICLES = [
+    (
+        "living-with-diabetes",
+        "live-healthy-articles",
+        "https://www.healthhub.sg/living-with-diabetes",
+        "<h2>Living with Diabetes</h2><p>Eat well. <a href='https://www.healthhub.sg/a'>Read more</a>.</p>"
+        "<table><tr><td>Rice</td><td>1 bowl</td></tr></table>",
+    ),
+    ("empty", "programs", "", ""),
+    ("chinese", "programs", "", "<p>糖尿病</p><p><img src='c.png' alt='A plate'/></p>"),
+]
+
+
+@pytest.fixture(scope="module")
+def pool() -> ExtractionPool:
+    pool = ExtractionPool(workers=2)
+    yield pool
+    pool.shutdown()
+
+
+def test_extract(pool: ExtractionPool):
+    """
+    A test function for `ExtractionPool.extract` that checks the parity with `extract_articles`.
+
+    Args:
+        pool (ExtractionPool): The extraction pool.
+
+    Raises:
+        AssertionError: If the extracted data does not meet the specified criteria (see below).
+
+    Note:
+        1. Expects the same extracted data as `extract_articles`, in the same order
+        2. Expects the text statistics, with None for the missing script ratios
+    """
+    extracted_articles = asyncio.run(pool.extract(ARTICLES))
+
+    for extracted_data, expected in zip(
+        extracted_articles, extract_articles(ARTICLES), strict=True
+    ):
+        assert {key: extracted_data[key] for key in expected} == expected
+        assert set(extracted_data) == set(expected) | set(TEXT_STATS_COLUMNS)
+
+    assert [
+        (article["word_count"], article["latin_ratio"], article["han_ratio"])
+        for article in extracted_articles
+    ] == [(8, 1.0, 0.0), (0, None, None), (0, 0.0, 1.0)]
+
+
+def test_extract_empty(pool: ExtractionPool):
+    """
+    A test function that checks that an empty batch is extracted without the worker processes.
+
+    Args:
+        pool (ExtractionPool): The extraction pool.
+
+    Raises:
+        AssertionError: If the extracted data is not empty.
+    """
+    assert asyncio.run(pool.extract([])) == []